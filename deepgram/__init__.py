@@ -32,6 +32,16 @@ from .client import (
     DeepgramUnknownApiError,
 )
 from .errors import DeepgramApiKeyError
+from .client import (
+    RetryPolicy,
+    RateLimiter,
+    SingleFlight,
+    JsonCodec,
+    WordsTable,
+    ParquetSink,
+    EventQueueStats,
+)
+from .client import mmap_file
 
 # listen/read client
 from .client import Listen, Read
@@ -41,6 +51,7 @@ from .client import (
     TextSource,
     BufferSource,
     StreamSource,
+    FilePathSource,
     FileSource,
     UrlSource,
 )
@@ -92,6 +103,7 @@ from .client import (
     ListenWSAlternative,
     ListenWSChannel,
     ListenWSWord,
+    ListenWSCompactWord,
 )
 
 # prerecorded
@@ -119,6 +131,9 @@ from .client import (
     AsyncPrerecordedResponse,
     PrerecordedResponse,
     SyncPrerecordedResponse,
+    BatchResult,
+    ResultCache,
+    TranscriptIndex,
     #### shared
     # Average,
     # Alternative,
@@ -154,6 +169,7 @@ from .client import (
     ListenRESTAlternative,
     ListenRESTChannel,
     ListenRESTWord,
+    ListenRESTCompactWord,
 )
 
 # read
@@ -213,6 +229,7 @@ from .client import (
 from .client import (
     SpeakResponse,  # backward compat
     SpeakRESTResponse,
+    SpeakCache,
 )
 
 ## speak WebSocket
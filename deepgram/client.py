@@ -17,10 +17,22 @@ from .clients import (
     TextSource,
     BufferSource,
     StreamSource,
+    FilePathSource,
     FileSource,
     UrlSource,
 )
 from .clients import BaseResponse
+from .clients import AsyncHttpClientPool, HttpClientPool
+from .clients import (
+    RetryPolicy,
+    RateLimiter,
+    SingleFlight,
+    JsonCodec,
+    WordsTable,
+    ParquetSink,
+    EventQueueStats,
+)
+from .clients import mmap_file
 from .clients import (
     Average,
     Intent,
@@ -86,6 +98,7 @@ from .clients import (
     ListenWSAlternative,
     ListenWSChannel,
     ListenWSWord,
+    ListenWSCompactWord,
 )
 
 # prerecorded
@@ -121,6 +134,9 @@ from .clients import (
     AsyncPrerecordedResponse,
     PrerecordedResponse,
     SyncPrerecordedResponse,
+    BatchResult,
+    ResultCache,
+    TranscriptIndex,
     #### shared
     # Average,
     # Intent,
@@ -157,6 +173,7 @@ from .clients import (
     ListenRESTAlternative,
     ListenRESTChannel,
     ListenRESTWord,
+    ListenRESTCompactWord,
 )
 
 # read
@@ -219,6 +236,7 @@ from .clients import (
 from .clients import (
     SpeakResponse,  # backward compat
     SpeakRESTResponse,
+    SpeakCache,
 )
 
 ## speak WebSocket
@@ -363,6 +381,9 @@ class DeepgramClient:
 
         asyncmanage: Returns an (Async) ManageClient instance for managing Deepgram resources.
         asyncselfhosted: Returns an (Async) SelfHostedClient instance for interacting with Deepgram's on-premises API.
+
+        close: Closes the HTTP connection pool shared by all the sync REST clients.
+        aclose: Closes the HTTP connection pool shared by all the async REST clients.
     """
 
     _config: DeepgramClientOptions
@@ -392,6 +413,44 @@ class DeepgramClient:
             config.set_apikey(self.api_key)
             self._config = config
 
+        # all REST clients created from this object share a connection pool
+        if self._config.http_pool is None:
+            self._config.http_pool = HttpClientPool(self._config)
+        if self._config.async_http_pool is None:
+            self._config.async_http_pool = AsyncHttpClientPool(self._config)
+
+        # all clients created from this object share one rate limiter
+        if self._config.rate_limiter is None:
+            limits = self._config.get_rate_limits()
+            if any(value is not None for value in limits.values()):
+                self._config.rate_limiter = RateLimiter(**limits)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the HTTP connection pool shared by all the sync REST clients.
+        """
+        if self._config.http_pool is not None:
+            self._config.http_pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP connection pool shared by all the async REST clients.
+        """
+        if self._config.async_http_pool is not None:
+            await self._config.async_http_pool.aclose()
+
     @property
     def listen(self):
         """
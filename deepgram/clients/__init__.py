@@ -7,10 +7,19 @@ from .common import (
     TextSource,
     BufferSource,
     StreamSource,
+    FilePathSource,
     FileSource,
     UrlSource,
 )
 from .common import BaseResponse
+from .common import AsyncHttpClientPool, HttpClientPool
+from .common import RetryPolicy
+from .common import RateLimiter
+from .common import SingleFlight
+from .common import JsonCodec
+from .common import WordsTable, ParquetSink
+from .common import EventQueueStats
+from .common import mmap_file
 
 # common (shared between analze and prerecorded)
 from .common import (
@@ -93,6 +102,9 @@ from .listen import (
     AsyncPrerecordedResponse,
     PrerecordedResponse,
     SyncPrerecordedResponse,
+    BatchResult,
+    ResultCache,
+    TranscriptIndex,
     #### shared
     # Average,
     # Intent,
@@ -129,6 +141,7 @@ from .listen import (
     ListenRESTAlternative,
     ListenRESTChannel,
     ListenRESTWord,
+    ListenRESTCompactWord,
 )
 
 
@@ -156,6 +169,7 @@ from .listen import (
     #### uniqye
     ListenWSMetadata,
     ListenWSWord,
+    ListenWSCompactWord,
     ListenWSAlternative,
     ListenWSChannel,
 )
@@ -232,6 +246,7 @@ from .speak import (
 from .speak import (
     SpeakResponse,  # backward compat
     SpeakRESTResponse,
+    SpeakCache,
 )
 
 ## text-to-speech WebSocket
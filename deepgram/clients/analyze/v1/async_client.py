@@ -113,7 +113,9 @@ class AsyncAnalyzeClient(AbstractAsyncRestClient):
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = AnalyzeResponse.from_json(result)
+        res = AnalyzeResponse.from_json(
+            result, codec=self._json, lazy=self._config.is_lazy_response_enabled()
+        )
         self._logger.verbose("result: %s", res)
         self._logger.notice("analyze_url succeeded")
         self._logger.debug("AsyncAnalyzeClient.analyze_url LEAVE")
@@ -184,7 +186,7 @@ class AsyncAnalyzeClient(AbstractAsyncRestClient):
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = AsyncAnalyzeResponse.from_json(result)
+        res = AsyncAnalyzeResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("analyze_url_callback succeeded")
         self._logger.debug("AnalyzeClient.analyze_url_callback LEAVE")
@@ -265,7 +267,9 @@ class AsyncAnalyzeClient(AbstractAsyncRestClient):
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = AnalyzeResponse.from_json(result)
+        res = AnalyzeResponse.from_json(
+            result, codec=self._json, lazy=self._config.is_lazy_response_enabled()
+        )
         self._logger.verbose("result: %s", res)
         self._logger.notice("analyze_text succeeded")
         self._logger.debug("AsyncAnalyzeClient.analyze_text LEAVE")
@@ -337,7 +341,7 @@ class AsyncAnalyzeClient(AbstractAsyncRestClient):
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = AsyncAnalyzeResponse.from_json(result)
+        res = AsyncAnalyzeResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("analyze_text_callback succeeded")
         self._logger.debug("AnalyzeClient.analyze_text_callback LEAVE")
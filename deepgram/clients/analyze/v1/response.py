@@ -61,18 +61,6 @@ class Metadata(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "intents_info" in _dict:
-            _dict["intents_info"] = IntentsInfo.from_dict(_dict["intents_info"])
-        if "sentiment_info" in _dict:
-            _dict["sentiment_info"] = SentimentInfo.from_dict(_dict["sentiment_info"])
-        if "summary_info" in _dict:
-            _dict["summary_info"] = SummaryInfo.from_dict(_dict["summary_info"])
-        if "topics_info" in _dict:
-            _dict["topics_info"] = TopicsInfo.from_dict(_dict["topics_info"])
-        return _dict[key]
-
 
 @dataclass
 class Summary(BaseResponse):
@@ -102,18 +90,6 @@ class Results(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "summary" in _dict:
-            _dict["summary"] = Summary.from_dict(_dict["summary"])
-        if "sentiments" in _dict:
-            _dict["sentiments"] = Sentiments.from_dict(_dict["sentiments"])
-        if "topics" in _dict:
-            _dict["topics"] = Topics.from_dict(_dict["topics"])
-        if "intents" in _dict:
-            _dict["intents"] = Intents.from_dict(_dict["intents"])
-        return _dict[key]
-
 
 # Analyze Response Result:
 
@@ -131,13 +107,5 @@ class AnalyzeResponse(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "metadata" in _dict:
-            _dict["metadata"] = Metadata.from_dict(_dict["metadata"])
-        if "results" in _dict:
-            _dict["results"] = Results.from_dict(_dict["results"])
-        return _dict[key]
-
 
 SyncAnalyzeResponse = AnalyzeResponse
@@ -2,6 +2,8 @@
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
 
+from typing import Callable
+
 from .v1 import (
     DeepgramError,
     DeepgramTypeError,
@@ -9,8 +11,17 @@ from .v1 import (
     DeepgramUnknownApiError,
 )
 
-from .v1 import AbstractAsyncRestClient
-from .v1 import AbstractSyncRestClient
+from .v1 import AbstractAsyncRestClient, AsyncHttpClientPool
+from .v1 import AbstractSyncRestClient, HttpClientPool
+from .v1 import RetryPolicy
+from .v1 import RateLimiter
+from .v1 import SingleFlight
+from .v1 import JsonCodec
+from .v1 import WordsTable, words_table, alternative_words
+from .v1 import ParquetSink
+from .v1 import EventQueue, AsyncEventQueue, EventQueueStats
+from .v1 import mmap_file
+from .v1 import atomic_write, read_entry, remove_file, evict_files
 from .v1 import AbstractAsyncWebSocketClient
 from .v1 import AbstractSyncWebSocketClient
 
@@ -18,6 +29,7 @@ from .v1 import (
     TextSource as TextSourceLatest,
     BufferSource as BufferSourceLatest,
     StreamSource as StreamSourceLatest,
+    FilePathSource as FilePathSourceLatest,
     FileSource as FileSourceLatest,
     UrlSource as UrlSourceLatest,
 )
@@ -25,6 +37,8 @@ from .v1 import (
 # shared
 from .v1 import (
     BaseResponse as BaseResponseLatest,
+    CompactResponse as CompactResponseLatest,
+    compact_class as compact_class_latest,
     ModelInfo as ModelInfoLatest,
     Hit as HitLatest,
     Search as SearchLatest,
@@ -59,9 +73,13 @@ UrlSource = UrlSourceLatest
 TextSource = TextSourceLatest
 BufferSource = BufferSourceLatest
 StreamSource = StreamSourceLatest
+FilePathSource = FilePathSourceLatest
 FileSource = FileSourceLatest
 
 BaseResponse = BaseResponseLatest
+CompactResponse = CompactResponseLatest
+# annotated, mypy cannot infer it through the import cycle with the response modules
+compact_class: Callable[[type, str], type] = compact_class_latest
 ModelInfo = ModelInfoLatest
 Hit = HitLatest
 Search = SearchLatest
@@ -10,8 +10,17 @@ from .errors import (
     DeepgramApiError,
     DeepgramUnknownApiError,
 )
-from .abstract_async_rest import AbstractAsyncRestClient
-from .abstract_sync_rest import AbstractSyncRestClient
+from .abstract_async_rest import AbstractAsyncRestClient, AsyncHttpClientPool
+from .abstract_sync_rest import AbstractSyncRestClient, HttpClientPool
+from .retry import RetryPolicy
+from .rate_limiter import RateLimiter
+from .single_flight import SingleFlight
+from .json_codec import JsonCodec
+from .words_table import WordsTable, words_table, alternative_words
+from .parquet_sink import ParquetSink
+from .event_queue import EventQueue, AsyncEventQueue, EventQueueStats
+from .buffers import mmap_file
+from .file_cache import atomic_write, read_entry, remove_file, evict_files
 from .abstract_async_websocket import AbstractAsyncWebSocketClient
 from .abstract_sync_websocket import AbstractSyncWebSocketClient
 
@@ -19,12 +28,15 @@ from .options import (
     TextSource,
     BufferSource,
     StreamSource,
+    FilePathSource,
     FileSource,
     UrlSource,
 )
 
 from .shared_response import (
     BaseResponse,
+    CompactResponse,
+    compact_class,
     ModelInfo,
     Hit,
     Search,
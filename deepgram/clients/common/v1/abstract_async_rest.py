@@ -2,15 +2,97 @@
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import io
-from typing import Dict, Optional, List, Union
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Union
 
 import httpx
 
-from .helpers import append_query_params
+from .helpers import append_query_params, http2_prior_knowledge
 from ....options import DeepgramClientOptions
 from .errors import DeepgramError, DeepgramApiError, DeepgramUnknownApiError
+from .buffers import as_buffer_stream
+from .retry import RetryPolicy, body_position, resolve_retry_policy, rewind_body
+from .json_codec import JsonCodec, get_json_codec
+from .rate_limiter import hold_until_aclosed
+from .single_flight import (
+    SingleFlight,
+    copy_memory_result,
+    resolve_single_flight,
+    single_flight_key,
+)
+
+
+# the number of seconds AsyncHttpClientPool.aclose() waits for the clients of other loops
+CLOSE_TIMEOUT = 5.0
+
+
+class AsyncHttpClientPool:
+    """
+    Holds a lazily created httpx.AsyncClient so its connection pool can be reused across requests.
+
+    A pool attached to DeepgramClientOptions.async_http_pool (done by DeepgramClient) is shared by
+    every async REST client created with those options. Since connections are bound to the event
+    loop that opened them, there is one httpx.AsyncClient per running event loop. The clients of
+    loops which have been closed are dropped when the next one is created, and the pool does not
+    keep a loop alive.
+    """
+
+    _config: DeepgramClientOptions
+    _clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+
+    def __init__(self, config: DeepgramClientOptions):
+        self._config = config
+        self._clients = weakref.WeakKeyDictionary()
+
+    def get_client(self) -> httpx.AsyncClient:
+        """
+        Returns the pooled httpx.AsyncClient for the running event loop, creating it if needed.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            # their connections cannot be used, or closed, from another loop
+            self._clients = weakref.WeakKeyDictionary(
+                (other, pooled)
+                for other, pooled in self._clients.items()
+                if not other.is_closed()
+            )
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(**self._config.get_http_pool_limits()),
+                http1=not http2_prior_knowledge(self._config),
+                http2=self._config.is_http2_enabled(),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled httpx.AsyncClients and releases all of their connections.
+
+        The client of the running loop is closed here, those of other running loops are closed
+        on their own loop, waiting up to CLOSE_TIMEOUT seconds for them. The first error raised
+        while closing, or asyncio.TimeoutError, is raised once every client has been handled.
+        """
+        loop = asyncio.get_running_loop()
+        clients = list(self._clients.items())
+        self._clients = weakref.WeakKeyDictionary()
+        closing: List[Awaitable[None]] = []
+        for other, client in clients:
+            if client.is_closed or other.is_closed():
+                continue
+            if other is loop:
+                closing.append(client.aclose())
+            else:
+                closing.append(
+                    asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(client.aclose(), other)
+                    )
+                )
+        if len(closing) > 0:
+            await asyncio.wait_for(asyncio.gather(*closing), timeout=CLOSE_TIMEOUT)
 
 
 class AbstractAsyncRestClient:
@@ -26,20 +108,234 @@ class AbstractAsyncRestClient:
         params (Optional[Dict[str, Any]]): Optional query parameters to include in requests.
         timeout (Optional[httpx.Timeout]): Optional timeout configuration for requests.
 
+    Requests are sent through a pooled httpx.AsyncClient. When the config carries a shared
+    AsyncHttpClientPool (see DeepgramClient), the pool is shared with all other async REST
+    clients using that config and is closed by its owner. Otherwise this object owns its pool,
+    which is released by aclose() or by using the client as an async context manager.
+
+    Failed requests are retried according to a RetryPolicy, taken from the `retry` argument of the
+    call, the retry_policy attribute of the client or the `retry` option of the config, in that order.
+
+    Identical requests in flight at the same time can be sent once and share the response, by
+    setting single_flight, or the "single_flight" option of the config, to a SingleFlight.
+
     Exceptions:
         DeepgramApiError: Raised for known API errors.
         DeepgramUnknownApiError: Raised for unknown API errors.
     """
 
     _config: DeepgramClientOptions
+    _json: JsonCodec
+    _pool: AsyncHttpClientPool
+
+    retry_policy: Optional[RetryPolicy] = None
+    single_flight: Optional[SingleFlight] = None
 
     def __init__(self, config: DeepgramClientOptions):
         if config is None:
             raise DeepgramError("Config are required")
         self._config = config
+        self._json = get_json_codec(config)
+        self._pool = AsyncHttpClientPool(config)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled HTTP client owned by this object.
+
+        A pool shared through DeepgramClientOptions is left open for the other clients.
+        """
+        await self._pool.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Returns the shared pooled HTTP client if there is one, otherwise the one owned by this object.
+        """
+        if isinstance(self._config.async_http_pool, AsyncHttpClientPool):
+            return self._config.async_http_pool.get_client()
+        return self._pool.get_client()
+
+    def _get_single_flight(self) -> Optional[SingleFlight]:
+        """
+        Returns the SingleFlight in effect for this client, if any.
+        """
+        if self.single_flight is None:
+            self.single_flight = resolve_single_flight(
+                self._config.options.get("single_flight")
+            )
+            if self.single_flight is not None:
+                # share the in-flight requests with the other clients created from this config
+                self._config.options["single_flight"] = self.single_flight
+        return self.single_flight
 
     # pylint: disable=too-many-positional-arguments
 
+    async def _coalesce(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        kwargs: Dict,
+        request: Callable[[], Awaitable[Any]],
+        copy: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Runs the request, or waits for an identical one already in flight when coalescing is enabled.
+        """
+        single_flight = self._get_single_flight()
+        key = None
+        if single_flight is not None:
+            key = single_flight_key(method, url, headers, kwargs)
+        if key is None:
+            return await request()
+        return await single_flight.do_async(key, request, copy)  # type: ignore
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends the request, uploading buffer-protocol content without copying it into bytes.
+        """
+        buffer = as_buffer_stream(kwargs.get("content"), is_async=True)
+        if buffer is None:
+            return await self._send_with_retry(
+                method, url, headers, timeout, stream, **kwargs
+            )
+
+        kwargs["content"] = buffer
+        headers = headers.copy()
+        headers["Content-Length"] = str(len(buffer))
+        try:
+            return await self._send_with_retry(
+                method, url, headers, timeout, stream, **kwargs
+            )
+        finally:
+            # the body has been sent, let go of the caller's buffer
+            buffer.release()
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends the request, retrying it according to the RetryPolicy in effect.
+        """
+        policy = kwargs.pop("retry", None)
+        if policy is None:
+            policy = self.retry_policy
+        if policy is None:
+            policy = self._config.options.get("retry")
+        policy = resolve_retry_policy(policy)
+        if policy is None:
+            return await self._send_once(
+                method, url, headers, timeout, stream, **kwargs
+            )
+
+        content = kwargs.get("content")
+        position = body_position(content)
+        attempt = 1
+        delay = policy.base_delay
+        while True:
+            try:
+                response = await self._send_once(
+                    method, url, headers, timeout, stream, **kwargs
+                )
+            except httpx.TransportError as e:
+                if not policy.should_retry_error(method, attempt, e) or not rewind_body(
+                    content, position
+                ):
+                    raise
+                delay = policy.next_delay(delay) or policy.base_delay
+            else:
+                if not policy.should_retry_response(
+                    method, attempt, response
+                ) or not rewind_body(content, position):
+                    return response
+                next_delay = policy.next_delay(delay, response)
+                if next_delay is None:
+                    return response
+                await response.aclose()
+                delay = next_delay
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends a single attempt of the request, waiting for the shared RateLimiter if there is one.
+        """
+        limiter = self._config.rate_limiter
+        if limiter is None:
+            return await self._send_request(
+                method, url, headers, timeout, stream, **kwargs
+            )
+        await limiter.acquire_async()
+        try:
+            response = await self._send_request(
+                method, url, headers, timeout, stream, **kwargs
+            )
+        except BaseException:
+            limiter.release()
+            raise
+        if stream:
+            # the body is still being received, the slot is given back by aclose()
+            return hold_until_aclosed(response, limiter)
+        limiter.release()
+        return response
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends the request using the pooled HTTP client.
+
+        If a custom transport is passed in, a dedicated client is used for the request instead.
+        """
+        transport = kwargs.pop("transport", None)
+        if transport is not None:
+            client = httpx.AsyncClient(timeout=timeout, transport=transport)
+            if stream:
+                req = client.build_request(method, url, headers=headers, **kwargs)
+                return await client.send(req, stream=True)
+            async with client:
+                return await client.request(method, url, headers=headers, **kwargs)
+
+        client = self._get_client()
+        req = client.build_request(
+            method, url, headers=headers, timeout=timeout, **kwargs
+        )
+        return await client.send(req, stream=stream)
+
     async def get(
         self,
         url: str,
@@ -212,37 +508,32 @@ class AbstractAsyncRestClient:
             _url = append_query_params(_url, params)
         if addons is not None:
             _url = append_query_params(_url, addons)
-        _headers = self._config.headers
+        _headers = self._config.headers.copy()
         if headers is not None:
             _headers.update(headers)
         if timeout is None:
             timeout = httpx.Timeout(30.0, connect=10.0)
 
-        try:
-            transport = kwargs.get("transport")
-            async with httpx.AsyncClient(
-                timeout=timeout, transport=transport
-            ) as client:
-                if transport:
-                    kwargs.pop("transport")
-                response = await client.request(
-                    method, _url, headers=_headers, **kwargs
+        async def request() -> str:
+            response = await self._send(method, _url, _headers, timeout, **kwargs)
+            response.raise_for_status()
+
+            # throw exception if response is None or response.text is None
+            if response is None or response.text is None:
+                raise DeepgramError(
+                    "Response is not available yet. Please try again later."
                 )
-                response.raise_for_status()
 
-                # throw exception if response is None or response.text is None
-                if response is None or response.text is None:
-                    raise DeepgramError(
-                        "Response is not available yet. Please try again later."
-                    )
+            return response.text
 
-                return response.text
+        try:
+            return await self._coalesce(method, _url, _headers, kwargs, request)
 
         except httpx.HTTPError as e1:
             if isinstance(e1, httpx.HTTPStatusError):
                 status_code = e1.response.status_code or 500
                 try:
-                    json_object = json.loads(e1.response.text)
+                    json_object = self._json.loads(e1.response.text)
                     raise DeepgramApiError(
                         json_object.get("err_msg"),
                         str(status_code),
@@ -276,44 +567,41 @@ class AbstractAsyncRestClient:
             _url = append_query_params(_url, params)
         if addons is not None:
             _url = append_query_params(_url, addons)
-        _headers = self._config.headers
+        _headers = self._config.headers.copy()
         if headers is not None:
             _headers.update(headers)
         if timeout is None:
             timeout = httpx.Timeout(30.0, connect=10.0)
 
+        async def request() -> Dict[str, Union[str, io.BytesIO]]:
+            response = await self._send(method, _url, _headers, timeout, **kwargs)
+            response.raise_for_status()
+
+            ret: Dict[str, Union[str, io.BytesIO]] = {}
+            for item in file_result:
+                if item in response.headers:
+                    ret[item] = response.headers[item]
+                    continue
+                tmp_item = f"dg-{item}"
+                if tmp_item in response.headers:
+                    ret[item] = response.headers[tmp_item]
+                    continue
+                tmp_item = f"x-dg-{item}"
+                if tmp_item in response.headers:
+                    ret[item] = response.headers[tmp_item]
+            ret["stream"] = io.BytesIO(response.content)
+            return ret
+
         try:
-            transport = kwargs.get("transport")
-            async with httpx.AsyncClient(
-                timeout=timeout, transport=transport
-            ) as client:
-                if transport:
-                    kwargs.pop("transport")
-                response = await client.request(
-                    method, _url, headers=_headers, **kwargs
-                )
-                response.raise_for_status()
-
-                ret: Dict[str, Union[str, io.BytesIO]] = {}
-                for item in file_result:
-                    if item in response.headers:
-                        ret[item] = response.headers[item]
-                        continue
-                    tmp_item = f"dg-{item}"
-                    if tmp_item in response.headers:
-                        ret[item] = response.headers[tmp_item]
-                        continue
-                    tmp_item = f"x-dg-{item}"
-                    if tmp_item in response.headers:
-                        ret[item] = response.headers[tmp_item]
-                ret["stream"] = io.BytesIO(response.content)
-                return ret
+            return await self._coalesce(
+                method, _url, _headers, kwargs, request, copy_memory_result
+            )
 
         except httpx.HTTPError as e1:
             if isinstance(e1, httpx.HTTPStatusError):
                 status_code = e1.response.status_code or 500
                 try:
-                    json_object = json.loads(e1.response.text)
+                    json_object = self._json.loads(e1.response.text)
                     raise DeepgramApiError(
                         json_object.get("err_msg"),
                         str(status_code),
@@ -346,25 +634,22 @@ class AbstractAsyncRestClient:
             _url = append_query_params(_url, params)
         if addons is not None:
             _url = append_query_params(_url, addons)
-        _headers = self._config.headers
+        _headers = self._config.headers.copy()
         if headers is not None:
             _headers.update(headers)
         if timeout is None:
             timeout = httpx.Timeout(30.0, connect=10.0)
 
         try:
-            transport = kwargs.get("transport")
-            client = httpx.AsyncClient(timeout=timeout, transport=transport)
-            if transport:
-                kwargs.pop("transport")
-            req = client.build_request(method, _url, headers=_headers, **kwargs)
-            return await client.send(req, stream=True)
+            return await self._send(
+                method, _url, _headers, timeout, stream=True, **kwargs
+            )
 
         except httpx.HTTPError as e1:
             if isinstance(e1, httpx.HTTPStatusError):
                 status_code = e1.response.status_code or 500
                 try:
-                    json_object = json.loads(e1.response.text)
+                    json_object = self._json.loads(e1.response.text)
                     raise DeepgramApiError(
                         json_object.get("err_msg"),
                         str(status_code),
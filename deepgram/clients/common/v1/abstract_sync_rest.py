@@ -4,13 +4,66 @@
 
 import json
 import io
-from typing import Dict, Optional, List, Union
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, List, Union
 
 import httpx
 
-from .helpers import append_query_params
+from .helpers import append_query_params, http2_prior_knowledge
 from ....options import DeepgramClientOptions
 from .errors import DeepgramError, DeepgramApiError, DeepgramUnknownApiError
+from .buffers import as_buffer_stream
+from .retry import RetryPolicy, body_position, resolve_retry_policy, rewind_body
+from .json_codec import JsonCodec, get_json_codec
+from .rate_limiter import hold_until_closed
+from .single_flight import (
+    SingleFlight,
+    copy_memory_result,
+    resolve_single_flight,
+    single_flight_key,
+)
+
+
+class HttpClientPool:
+    """
+    The pooled httpx.Client used by the sync REST clients.
+
+    A pool attached to DeepgramClientOptions.http_pool (done by DeepgramClient) is shared by
+    every sync REST client created with those options, so that the clients returned by each
+    v() call reuse the same connections. The httpx.Client is created on first use.
+    """
+
+    _config: DeepgramClientOptions
+    _client: Optional[httpx.Client]
+    _lock: threading.Lock
+
+    def __init__(self, config: DeepgramClientOptions):
+        self._config = config
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get_client(self) -> httpx.Client:
+        """
+        Returns the pooled httpx.Client, creating it if needed.
+        """
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    limits=httpx.Limits(**self._config.get_http_pool_limits()),
+                    http1=not http2_prior_knowledge(self._config),
+                    http2=self._config.is_http2_enabled(),
+                )
+            return self._client
+
+    def close(self) -> None:
+        """
+        Closes the pooled httpx.Client and releases all of its connections.
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
 
 
 class AbstractSyncRestClient:
@@ -26,20 +79,233 @@ class AbstractSyncRestClient:
         params (Optional[Dict[str, Any]]): Optional query parameters to include in requests.
         timeout (Optional[httpx.Timeout]): Optional timeout configuration for requests.
 
+    Requests are sent through a pooled httpx.Client. When the config carries a shared
+    HttpClientPool (see DeepgramClient), the pool is shared with all other sync REST clients
+    using that config and is closed by its owner. Otherwise this object owns its pool, which is
+    released by close(), by using the client as a context manager or when the object goes away.
+
+    Identical requests in flight at the same time can be sent once and share the response, by
+    setting single_flight, or the "single_flight" option of the config, to a SingleFlight.
+
     Exceptions:
         DeepgramApiError: Raised for known API errors.
         DeepgramUnknownApiError: Raised for unknown API errors.
     """
 
     _config: DeepgramClientOptions
+    _json: JsonCodec
+    _pool: HttpClientPool
+
+    retry_policy: Optional[RetryPolicy] = None
+    single_flight: Optional[SingleFlight] = None
 
     def __init__(self, config: DeepgramClientOptions):
         if config is None:
             raise DeepgramError("Config are required")
         self._config = config
+        self._json = get_json_codec(config)
+        self._pool = HttpClientPool(config)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        # the pool owned by this object, if it was ever used
+        pool = self.__dict__.get("_pool")
+        if pool is not None:
+            pool.close()
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP client owned by this object.
+
+        A pool shared through DeepgramClientOptions is left open for the other clients.
+        """
+        self._pool.close()
+
+    def _get_client(self) -> httpx.Client:
+        """
+        Returns the shared pooled HTTP client if there is one, otherwise the one owned by this object.
+        """
+        if isinstance(self._config.http_pool, HttpClientPool):
+            return self._config.http_pool.get_client()
+        return self._pool.get_client()
+
+    def _get_single_flight(self) -> Optional[SingleFlight]:
+        """
+        Returns the SingleFlight in effect for this client, if any.
+        """
+        if self.single_flight is None:
+            self.single_flight = resolve_single_flight(
+                self._config.options.get("single_flight")
+            )
+            if self.single_flight is not None:
+                # share the in-flight requests with the other clients created from this config
+                self._config.options["single_flight"] = self.single_flight
+        return self.single_flight
 
     # pylint: disable=too-many-positional-arguments
 
+    def _coalesce(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        kwargs: Dict,
+        request: Callable[[], Any],
+        copy: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Runs the request, or waits for an identical one already in flight when coalescing is enabled.
+        """
+        single_flight = self._get_single_flight()
+        key = None
+        if single_flight is not None:
+            key = single_flight_key(method, url, headers, kwargs)
+        if key is None:
+            return request()
+        return single_flight.do(key, request, copy)  # type: ignore
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends the request, uploading buffer-protocol content without copying it into bytes.
+        """
+        buffer = as_buffer_stream(kwargs.get("content"))
+        if buffer is None:
+            return self._send_with_retry(
+                method, url, headers, timeout, stream, **kwargs
+            )
+
+        kwargs["content"] = buffer
+        headers = headers.copy()
+        headers["Content-Length"] = str(len(buffer))
+        try:
+            return self._send_with_retry(
+                method, url, headers, timeout, stream, **kwargs
+            )
+        finally:
+            # the body has been sent, let go of the caller's buffer
+            buffer.release()
+
+    def _send_with_retry(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends the request, retrying it according to the RetryPolicy in effect.
+        """
+        policy = kwargs.pop("retry", None)
+        if policy is None:
+            policy = self.retry_policy
+        if policy is None:
+            policy = self._config.options.get("retry")
+        policy = resolve_retry_policy(policy)
+        if policy is None:
+            return self._send_once(method, url, headers, timeout, stream, **kwargs)
+
+        content = kwargs.get("content")
+        position = body_position(content)
+        attempt = 1
+        delay = policy.base_delay
+        while True:
+            try:
+                response = self._send_once(
+                    method, url, headers, timeout, stream, **kwargs
+                )
+            except httpx.TransportError as e:
+                if not policy.should_retry_error(method, attempt, e) or not rewind_body(
+                    content, position
+                ):
+                    raise
+                delay = policy.next_delay(delay) or policy.base_delay
+            else:
+                if not policy.should_retry_response(
+                    method, attempt, response
+                ) or not rewind_body(content, position):
+                    return response
+                next_delay = policy.next_delay(delay, response)
+                if next_delay is None:
+                    return response
+                response.close()
+                delay = next_delay
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends a single attempt of the request, waiting for the shared RateLimiter if there is one.
+        """
+        limiter = self._config.rate_limiter
+        if limiter is None:
+            return self._send_request(method, url, headers, timeout, stream, **kwargs)
+        limiter.acquire()
+        try:
+            response = self._send_request(
+                method, url, headers, timeout, stream, **kwargs
+            )
+        except BaseException:
+            limiter.release()
+            raise
+        if stream:
+            # the body is still being received, the slot is given back by close()
+            return hold_until_closed(response, limiter)
+        limiter.release()
+        return response
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        timeout: httpx.Timeout,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Sends the request using the pooled HTTP client.
+
+        If a custom transport is passed in, a dedicated client is used for the request instead.
+        """
+        transport = kwargs.pop("transport", None)
+        if transport is not None:
+            client = httpx.Client(timeout=timeout, transport=transport)
+            if stream:
+                req = client.build_request(method, url, headers=headers, **kwargs)
+                return client.send(req, stream=True)
+            with client:
+                return client.request(method, url, headers=headers, **kwargs)
+
+        client = self._get_client()
+        req = client.build_request(
+            method, url, headers=headers, timeout=timeout, **kwargs
+        )
+        return client.send(req, stream=stream)
+
     def get(
         self,
         url: str,
@@ -212,33 +478,32 @@ class AbstractSyncRestClient:
             _url = append_query_params(_url, params)
         if addons is not None:
             _url = append_query_params(_url, addons)
-        _headers = self._config.headers
+        _headers = self._config.headers.copy()
         if headers is not None:
             _headers.update(headers)
         if timeout is None:
             timeout = httpx.Timeout(30.0, connect=10.0)
 
-        try:
-            transport = kwargs.get("transport")
-            with httpx.Client(timeout=timeout, transport=transport) as client:
-                if transport:
-                    kwargs.pop("transport")
-                response = client.request(method, _url, headers=_headers, **kwargs)
-                response.raise_for_status()
+        def request() -> str:
+            response = self._send(method, _url, _headers, timeout, **kwargs)
+            response.raise_for_status()
 
-                # throw exception if response is None or response.text is None
-                if response is None or response.text is None:
-                    raise DeepgramError(
-                        "Response is not available yet. Please try again later."
-                    )
+            # throw exception if response is None or response.text is None
+            if response is None or response.text is None:
+                raise DeepgramError(
+                    "Response is not available yet. Please try again later."
+                )
 
-                return response.text
+            return response.text
+
+        try:
+            return self._coalesce(method, _url, _headers, kwargs, request)
 
         except httpx.HTTPError as e1:
             if isinstance(e1, httpx.HTTPStatusError):
                 status_code = e1.response.status_code or 500
                 try:
-                    json_object = json.loads(e1.response.text)
+                    json_object = self._json.loads(e1.response.text)
                     raise DeepgramApiError(
                         json_object.get("err_msg"),
                         str(status_code),
@@ -272,40 +537,41 @@ class AbstractSyncRestClient:
             _url = append_query_params(_url, params)
         if addons is not None:
             _url = append_query_params(_url, addons)
-        _headers = self._config.headers
+        _headers = self._config.headers.copy()
         if headers is not None:
             _headers.update(headers)
         if timeout is None:
             timeout = httpx.Timeout(30.0, connect=10.0)
 
+        def request() -> Dict[str, Union[str, io.BytesIO]]:
+            response = self._send(method, _url, _headers, timeout, **kwargs)
+            response.raise_for_status()
+
+            ret: Dict[str, Union[str, io.BytesIO]] = {}
+            for item in file_result:
+                if item in response.headers:
+                    ret[item] = response.headers[item]
+                    continue
+                tmp_item = f"dg-{item}"
+                if tmp_item in response.headers:
+                    ret[item] = response.headers[tmp_item]
+                    continue
+                tmp_item = f"x-dg-{item}"
+                if tmp_item in response.headers:
+                    ret[item] = response.headers[tmp_item]
+            ret["stream"] = io.BytesIO(response.content)
+            return ret
+
         try:
-            transport = kwargs.get("transport")
-            with httpx.Client(timeout=timeout, transport=transport) as client:
-                if transport:
-                    kwargs.pop("transport")
-                response = client.request(method, _url, headers=_headers, **kwargs)
-                response.raise_for_status()
-
-                ret: Dict[str, Union[str, io.BytesIO]] = {}
-                for item in file_result:
-                    if item in response.headers:
-                        ret[item] = response.headers[item]
-                        continue
-                    tmp_item = f"dg-{item}"
-                    if tmp_item in response.headers:
-                        ret[item] = response.headers[tmp_item]
-                        continue
-                    tmp_item = f"x-dg-{item}"
-                    if tmp_item in response.headers:
-                        ret[item] = response.headers[tmp_item]
-                ret["stream"] = io.BytesIO(response.content)
-                return ret
+            return self._coalesce(
+                method, _url, _headers, kwargs, request, copy_memory_result
+            )
 
         except httpx.HTTPError as e1:
             if isinstance(e1, httpx.HTTPStatusError):
                 status_code = e1.response.status_code or 500
                 try:
-                    json_object = json.loads(e1.response.text)
+                    json_object = self._json.loads(e1.response.text)
                     raise DeepgramApiError(
                         json_object.get("err_msg"),
                         str(status_code),
@@ -338,25 +604,20 @@ class AbstractSyncRestClient:
             _url = append_query_params(_url, params)
         if addons is not None:
             _url = append_query_params(_url, addons)
-        _headers = self._config.headers
+        _headers = self._config.headers.copy()
         if headers is not None:
             _headers.update(headers)
         if timeout is None:
             timeout = httpx.Timeout(30.0, connect=10.0)
 
         try:
-            transport = kwargs.get("transport")
-            client = httpx.Client(timeout=timeout, transport=transport)
-            if transport:
-                kwargs.pop("transport")
-            req = client.build_request(method, _url, headers=_headers, **kwargs)
-            return client.send(req, stream=True)
+            return self._send(method, _url, _headers, timeout, stream=True, **kwargs)
 
         except httpx.HTTPError as e1:
             if isinstance(e1, httpx.HTTPStatusError):
                 status_code = e1.response.status_code or 500
                 try:
-                    json_object = json.loads(e1.response.text)
+                    json_object = self._json.loads(e1.response.text)
                     raise DeepgramApiError(
                         json_object.get("err_msg"),
                         str(status_code),
@@ -17,6 +17,7 @@ from ....utils import verboselogs
 from ....options import DeepgramClientOptions
 from .helpers import convert_to_websocket_url, append_query_params
 from .errors import DeepgramError
+from .json_codec import JsonCodec, get_json_codec
 
 from .websocket_response import (
     OpenResponse,
@@ -42,6 +43,7 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
 
     _logger: verboselogs.VerboseLogger
     _config: DeepgramClientOptions
+    _json: JsonCodec
     _endpoint: str
     _websocket_url: str
 
@@ -57,6 +59,8 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
     _options: Optional[Dict] = None
     _headers: Optional[Dict] = None
 
+    _rate_limited: bool = False
+
     def __init__(self, config: DeepgramClientOptions, endpoint: str = ""):
         if config is None:
             raise DeepgramError("Config is required")
@@ -68,6 +72,7 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
         self._logger.setLevel(config.verbose)
 
         self._config = config
+        self._json = get_json_codec(config)
         self._endpoint = endpoint
         self._lock_send = threading.Lock()
 
@@ -136,6 +141,11 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
         self._logger.debug("combined_headers: %s", combined_headers)
 
         url_with_params = append_query_params(self._websocket_url, combined_options)
+
+        # wait for the rate limiter shared by the clients of this DeepgramClient
+        if self._config.rate_limiter is not None and not self._rate_limited:
+            self._config.rate_limiter.acquire()
+            self._rate_limited = True
         try:
             self._socket = connect(url_with_params, additional_headers=combined_headers)
             self._exit_event.clear()
@@ -173,6 +183,7 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
             self._logger.error(
                 "ConnectionClosed in AbstractSyncWebSocketClient.start: %s", e
             )
+            self._release_rate_limit()
             self._logger.debug("AbstractSyncWebSocketClient.start LEAVE")
             if self._config.options.get("termination_exception_connect", False):
                 raise e
@@ -181,6 +192,7 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
             self._logger.error(
                 "WebSocketException in AbstractSyncWebSocketClient.start: %s", e
             )
+            self._release_rate_limit()
             self._logger.debug("AbstractSyncWebSocketClient.start LEAVE")
             if self._config.options.get("termination_exception_connect", False):
                 raise e
@@ -189,6 +201,7 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
             self._logger.error(
                 "WebSocketException in AbstractSyncWebSocketClient.start: %s", e
             )
+            self._release_rate_limit()
             self._logger.debug("AbstractSyncWebSocketClient.start LEAVE")
             if self._config.options.get("termination_exception_connect", False):
                 raise e
@@ -216,6 +229,14 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
         """
         raise NotImplementedError("no _emit method")
 
+    def _log_threads(self) -> None:
+        """
+        Logs the running threads, only call it when debug logging is enabled.
+        """
+        for thread in threading.enumerate():
+            self._logger.debug("after running thread: %s", thread.name)
+        self._logger.debug("number of active threads: %s", threading.active_count())
+
     # pylint: disable=too-many-return-statements,too-many-statements,too-many-locals,too-many-branches
     def _listening(
         self,
@@ -226,15 +247,25 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
         self._logger.debug("AbstractSyncWebSocketClient._listening ENTER")
 
         while True:
+            # checked once per message, disabled diagnostics then cost nothing
+            debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+            notice = self._logger.isEnabledFor(verboselogs.NOTICE)
             try:
                 if self._exit_event.is_set():
-                    self._logger.notice("_listening exiting gracefully")
-                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                    if notice:
+                        self._logger.notice("_listening exiting gracefully")
+                    if debug:
+                        self._logger.debug(
+                            "AbstractSyncWebSocketClient._listening LEAVE"
+                        )
                     return
 
                 if self._socket is None:
                     self._logger.warning("socket is empty")
-                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                    if debug:
+                        self._logger.debug(
+                            "AbstractSyncWebSocketClient._listening LEAVE"
+                        )
                     return
 
                 message = self._socket.recv()
@@ -243,27 +274,38 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
                     self._logger.info("message is None")
                     continue
 
-                self._logger.spam("data type: %s", type(message))
+                if debug:
+                    self._logger.spam("data type: %s", type(message))
 
                 if isinstance(message, bytes):
-                    self._logger.debug("Binary data received")
+                    if debug:
+                        self._logger.debug("Binary data received")
                     self._process_binary(message)
                 else:
-                    self._logger.debug("Text data received")
+                    if debug:
+                        self._logger.debug("Text data received")
                     self._process_text(message)
 
-                self._logger.notice("_listening Succeeded")
-                self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                if notice:
+                    self._logger.notice("_listening Succeeded")
+                if debug:
+                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
 
             except websockets.exceptions.ConnectionClosedOK as e:
-                self._logger.notice(f"_listening({e.code}) exiting gracefully")
-                self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                if notice:
+                    self._logger.notice("_listening(%s) exiting gracefully", e.code)
+                if debug:
+                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
                 return
 
             except websockets.exceptions.ConnectionClosed as e:
                 if e.code in [1000, 1001]:
-                    self._logger.notice(f"_listening({e.code}) exiting gracefully")
-                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                    if notice:
+                        self._logger.notice("_listening(%s) exiting gracefully", e.code)
+                    if debug:
+                        self._logger.debug(
+                            "AbstractSyncWebSocketClient._listening LEAVE"
+                        )
                     return
 
                 # we need to explicitly call self._signal_exit() here because we are hanging on a recv()
@@ -287,7 +329,8 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
                 # signal exit and close
                 self._signal_exit()
 
-                self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                if debug:
+                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
 
                 if self._config.options.get("termination_exception_connect") is True:
                     raise
@@ -312,7 +355,8 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
                 # signal exit and close
                 self._signal_exit()
 
-                self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                if debug:
+                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
 
                 if self._config.options.get("termination_exception_connect") is True:
                     raise
@@ -336,7 +380,8 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
                 # signal exit and close
                 self._signal_exit()
 
-                self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
+                if debug:
+                    self._logger.debug("AbstractSyncWebSocketClient._listening LEAVE")
 
                 if self._config.options.get("termination_exception_connect") is True:
                     raise
@@ -362,21 +407,29 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
     def _close_message(self) -> bool:
         raise NotImplementedError("no _close_message method")
 
-    # pylint: disable=too-many-return-statements,too-many-branches
+    # pylint: disable=too-many-return-statements,too-many-statements,too-many-branches
     def send(self, data: Union[str, bytes]) -> bool:
         """
         Sends data over the WebSocket connection.
         """
-        self._logger.spam("AbstractSyncWebSocketClient.send ENTER")
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        notice = self._logger.isEnabledFor(verboselogs.NOTICE)
+
+        if debug:
+            self._logger.spam("AbstractSyncWebSocketClient.send ENTER")
 
         if self._exit_event.is_set():
-            self._logger.notice("send exiting gracefully")
-            self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
+            if notice:
+                self._logger.notice("send exiting gracefully")
+            if debug:
+                self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
             return False
 
         if not self.is_connected():
-            self._logger.notice("is_connected is False")
-            self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
+            if notice:
+                self._logger.notice("is_connected is False")
+            if debug:
+                self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
             return False
 
         if self._socket is not None:
@@ -384,15 +437,19 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
                 try:
                     self._socket.send(data)
                 except websockets.exceptions.ConnectionClosedOK as e:
-                    self._logger.notice(f"send() exiting gracefully: {e.code}")
-                    self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
+                    if notice:
+                        self._logger.notice("send() exiting gracefully: %s", e.code)
+                    if debug:
+                        self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
                     if self._config.options.get("termination_exception_send") is True:
                         raise
                     return True
                 except websockets.exceptions.ConnectionClosed as e:
                     if e.code in [1000, 1001]:
-                        self._logger.notice(f"send({e.code}) exiting gracefully")
-                        self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
+                        if notice:
+                            self._logger.notice("send(%s) exiting gracefully", e.code)
+                        if debug:
+                            self._logger.debug("AbstractSyncWebSocketClient.send LEAVE")
                         if (
                             self._config.options.get("termination_exception_send")
                             == "true"
@@ -400,32 +457,37 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
                             raise
                         return True
                     self._logger.error("send() failed - ConnectionClosed: %s", str(e))
-                    self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
+                    if debug:
+                        self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
                     if self._config.options.get("termination_exception_send") is True:
                         raise
                     return False
                 except websockets.exceptions.WebSocketException as e:
                     self._logger.error("send() failed - WebSocketException: %s", str(e))
-                    self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
+                    if debug:
+                        self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
                     if self._config.options.get("termination_exception_send") is True:
                         raise
                     return False
                 except Exception as e:  # pylint: disable=broad-except
                     self._logger.error("send() failed - Exception: %s", str(e))
-                    self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
+                    if debug:
+                        self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
                     if self._config.options.get("termination_exception_send") is True:
                         raise
                     return False
 
-            self._logger.spam("send() succeeded")
-            self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
+            if debug:
+                self._logger.spam("send() succeeded")
+                self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
             return True
 
-        self._logger.spam("send() failed. socket is None")
-        self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
+        if debug:
+            self._logger.spam("send() failed. socket is None")
+            self._logger.spam("AbstractSyncWebSocketClient.send LEAVE")
         return False
 
-    # pylint: enable=too-many-return-statements,too-many-branches
+    # pylint: enable=too-many-return-statements,too-many-statements,too-many-branches
 
     def finish(self) -> bool:
         """
@@ -504,3 +566,12 @@ class AbstractSyncWebSocketClient(ABC):  # pylint: disable=too-many-instance-att
                 self._logger.error("socket.wait_closed failed: %s", e)
 
         self._socket = None
+
+        # give back the concurrency slot held by this connection
+        self._release_rate_limit()
+
+    def _release_rate_limit(self) -> None:
+        if self._rate_limited:
+            self._rate_limited = False
+            if self._config.rate_limiter is not None:
+                self._config.rate_limiter.release()
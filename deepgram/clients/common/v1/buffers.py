@@ -0,0 +1,85 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import mmap
+from typing import Any, AsyncIterator, Iterator, Optional
+
+# size of the slices handed to the transport when uploading a buffer
+CHUNK_SIZE = 64 * 1024
+
+
+class BufferStream:
+    """
+    Uploads any buffer-protocol object (mmap.mmap, memoryview, bytearray, NumPy array, ...)
+    as a request body without copying it into bytes.
+
+    The body is handed to the transport as memoryview slices of the original buffer. Unlike
+    a generator, it can be iterated again, so a request using it can be retried.
+
+    Args:
+        buffer (Any): The object exposing the buffer protocol.
+    """
+
+    _view: memoryview
+
+    def __init__(self, buffer: Any):
+        self._view = memoryview(buffer).cast("B")
+
+    def __len__(self) -> int:
+        return self._view.nbytes
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return self._chunks()
+
+    def _chunks(self) -> Iterator[memoryview]:
+        view = self._view
+        for start in range(0, view.nbytes, CHUNK_SIZE):
+            yield view[start : start + CHUNK_SIZE]
+
+    def release(self) -> None:
+        """
+        Releases the view on the underlying buffer, so that an mmap.mmap can be closed.
+        """
+        self._view.release()
+
+
+class AsyncBufferStream(BufferStream):
+    """
+    The httpx.AsyncClient counterpart of BufferStream, which must only be async iterable.
+    """
+
+    __iter__ = None  # type: ignore
+
+    async def __aiter__(self) -> AsyncIterator[memoryview]:
+        for chunk in self._chunks():
+            yield chunk
+
+
+def as_buffer_stream(content: Any, is_async: bool = False) -> Optional[BufferStream]:
+    """
+    Returns a BufferStream if the request content is a buffer-protocol object other than bytes.
+
+    bytes are already sent without a copy, and streams are read by the transport.
+    """
+    if content is None or isinstance(content, (bytes, str, BufferStream)):
+        return None
+    try:
+        if is_async:
+            return AsyncBufferStream(content)
+        return BufferStream(content)
+    except TypeError:
+        return None
+
+
+def mmap_file(path: str) -> mmap.mmap:
+    """
+    Memory-maps a file read-only, for use as a zero-copy BufferSource.
+
+    The pages are shared through the page cache with every other process mapping the same file.
+    Slicing a memoryview of the result selects part of the file without copying it:
+        audio = mmap_file("archive.wav")
+        payload = {"buffer": memoryview(audio)[start:end]}
+    """
+    with open(path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,392 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import threading
+import warnings
+from datetime import datetime
+from decimal import Decimal
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
+from types import UnionType
+from typing import Any, Callable, Dict, List, Set, Tuple, Union, get_args, get_origin
+from typing import get_type_hints
+from uuid import UUID
+
+from dataclasses_json import cfg
+from dataclasses_json.core import _decode_dataclass
+
+# Specialized from_dict functions for the response dataclasses.
+#
+# dataclasses_json decodes by reflection: for every object it resolves the type hints of the
+# class and walks the field types through a chain of generic helpers. For a transcript with
+# thousands of words that cost dominates parsing. The functions below are generated once per
+# class from the same type hints and produce the same objects: defaults are applied to
+# missing keys, primitives are coerced with the field type (an int in a float field becomes a
+# float), unknown keys are dropped and nested dataclasses, lists, dicts, optionals and enums
+# are decoded recursively.
+#
+# Anything the generator does not handle, such as letter case or per-field decoder overrides,
+# unions other than Optional or datetime fields, falls back to the dataclasses_json decoder.
+#
+# Lazy decoders skip the work for the fields nobody reads: they wrap the dict in an instance
+# of a generated subclass and decode each field, with the same rules, when it is first read.
+# A handler reading channel.alternatives[0].transcript never builds the word objects.
+#
+# Compact decoders build the compact variant registered for a class, a slotted dataclass
+# without an instance __dict__, wherever the class appears, for example for every word.
+
+Decoder = Callable[[Any], Any]
+
+# decoders by (lazy, compact)
+_registries: Dict[Tuple[bool, bool], Dict[type, Decoder]] = {
+    (lazy, compact): {} for lazy in (False, True) for compact in (False, True)
+}
+_lock = threading.RLock()
+
+# compact variants by class, see register_compact_class
+compact_classes: Dict[type, type] = {}
+
+
+class _Unsupported(Exception):
+    """
+    Raised while generating a decoder for a type that only dataclasses_json can decode.
+    """
+
+
+def get_decoder(cls: type, lazy: bool = False, compact: bool = False) -> Decoder:
+    """
+    Returns the from_dict function for the dataclass, generating it on first use.
+
+    A lazy decoder keeps the dict and decodes each field when it is first read. A compact
+    decoder builds the compact variants of the classes that have one.
+    """
+    registry = _registries[(lazy, compact)]
+    decoder = registry.get(cls)
+    if decoder is None:
+        with _lock:
+            decoder = registry.get(cls)
+            if decoder is None:
+                decoder = _Generator(lazy, compact).decoder(cls)
+    return decoder
+
+
+def decode_dataclass(
+    cls: type, kvs: Any, lazy: bool = False, compact: bool = False
+) -> Any:
+    """
+    Decodes the dict into an instance of the dataclass, like cls.from_dict(kvs).
+    """
+    return get_decoder(cls, lazy, compact)(kvs)
+
+
+def register_compact_class(cls: type, compact: type) -> None:
+    """
+    Registers the class compact decoders build in place of cls. Decoders generated before are
+    discarded.
+    """
+    with _lock:
+        compact_classes[cls] = compact
+        for registry in _registries.values():
+            registry.clear()
+
+
+def raw_field(obj: Any, name: str) -> Any:
+    """
+    Returns the undecoded value of a field of a lazy object, or None if the object is not lazy,
+    the field has been decoded already or is not in the dict.
+    """
+    raw = getattr(obj, "_lazy_raw", None)
+    if raw is None or name in obj.__dict__:
+        return None
+    return raw.get(name)
+
+
+def _generic_decoder(cls: type) -> Decoder:
+    def decode(kvs: Any) -> Any:
+        return _decode_dataclass(cls, kvs, False)
+
+    return decode
+
+
+def _is_union(tp: Any) -> bool:
+    return get_origin(tp) in (Union, UnionType)
+
+
+def _is_optional(tp: Any) -> bool:
+    return tp is Any or (_is_union(tp) and type(None) in get_args(tp))
+
+
+def _warn_none(cls_name: str, name: str) -> None:
+    warnings.warn(
+        f"'NoneType' object value of non-optional type {name} detected "
+        f"when decoding {cls_name}.",
+        RuntimeWarning,
+    )
+
+
+def _field_dataclass(value: Any, decoder: Decoder) -> Any:
+    # a field holding a dataclass already, for example when called with decoded objects
+    return value if is_dataclass(value) else decoder(value)
+
+
+class _LazyField:
+    """
+    A field of a lazy response, decoded from the raw dict on first access.
+
+    As a non-data descriptor it is only consulted while the instance has no value for the
+    field: the decoded value is stored in the instance and found directly from then on.
+    """
+
+    __slots__ = ("name", "decode", "default")
+
+    def __init__(self, name: str, decode: Decoder, default: Any):
+        self.name = name
+        self.decode = decode
+        self.default = default
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            if self.default is MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        value = self.decode(obj._lazy_raw)  # pylint: disable=protected-access
+        obj.__dict__[self.name] = value
+        return value
+
+
+def _rebuild(cls: type, kwargs: Dict[str, Any]) -> Any:
+    return cls(**kwargs)
+
+
+def _lazy_class(cls: type, field_decoders: Dict[str, Decoder]) -> type:
+    """
+    Returns a subclass of the dataclass whose fields are decoded on first access.
+
+    Instances print, compare, serialize and pickle like instances of the dataclass itself.
+    """
+    names = tuple(f.name for f in fields(cls) if f.init)
+    compared = tuple(f.name for f in fields(cls) if f.compare)
+
+    def __eq__(self, other):
+        if not isinstance(other, cls):
+            return NotImplemented
+        return tuple(getattr(self, n) for n in compared) == tuple(
+            getattr(other, n) for n in compared
+        )
+
+    def __reduce__(self):
+        return _rebuild, (cls, {n: getattr(self, n) for n in names})
+
+    namespace: Dict[str, Any] = {
+        "__slots__": ("_lazy_raw",),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "__eq__": __eq__,
+        "__hash__": cls.__hash__,
+        "__reduce__": __reduce__,
+    }
+    for name, decode in field_decoders.items():
+        namespace[name] = _LazyField(name, decode, getattr(cls, name, MISSING))
+    return type(cls.__name__, (cls,), namespace)
+
+
+def _lazy_decoder(lazy_cls: type, eager: Decoder) -> Decoder:
+    new = object.__new__
+
+    def decode(kvs: Any) -> Any:
+        if kvs.__class__ is not dict:
+            # decoded objects are passed through, anything else fails as it would eagerly
+            return eager(kvs)
+        obj: Any = new(lazy_cls)
+        obj._lazy_raw = kvs  # pylint: disable=protected-access
+        return obj
+
+    return decode
+
+
+class _Generator:
+    """
+    Generates the source of the decoder of a dataclass and of the dataclasses it contains.
+
+    Lazy decoders return an instance of a subclass holding the dict, whose fields are each
+    decoded by a generated function on first access. Nested dataclasses are lazy as well.
+    """
+
+    _pending: Set[type]
+    _lazy: bool
+    _compact: Dict[type, type]
+    _registry: Dict[type, Decoder]
+
+    def __init__(self, lazy: bool = False, compact: bool = False):
+        self._pending = set()
+        self._lazy = lazy
+        self._compact = compact_classes if compact else {}
+        self._registry = _registries[(lazy, compact)]
+
+    def decoder(self, cls: type) -> Decoder:
+        """
+        Returns the decoder of the class, generating and registering it if needed.
+        """
+        registry = self._registry
+        decoder = registry.get(cls)
+        if decoder is not None:
+            return decoder
+        if cls in self._compact:
+            decoder = self.decoder(self._compact[cls])
+            registry[cls] = decoder
+            return decoder
+        if cls in self._pending:
+            # a class containing itself, look the decoder up when it is called
+            return lambda kvs: registry[cls](kvs)  # pylint: disable=unnecessary-lambda
+
+        self._pending.add(cls)
+        try:
+            decoder = self._compile(cls)
+        except _Unsupported:
+            decoder = _generic_decoder(cls)
+        finally:
+            self._pending.discard(cls)
+        registry[cls] = decoder
+        return decoder
+
+    def _compile(self, cls: type) -> Decoder:
+        if cfg.global_config.decoders or getattr(cls, "dataclass_json_config", None):
+            raise _Unsupported(cls)
+
+        namespace: Dict[str, Any] = {
+            "_cls": cls,
+            "_warn_none": _warn_none,
+            "_field_dataclass": _field_dataclass,
+        }
+        hints = get_type_hints(cls)
+        body: Dict[str, List[str]] = {}
+        for i, f in enumerate(fields(cls)):
+            if not f.init:
+                continue
+            options = f.metadata.get("dataclasses_json", {})
+            if any(k != "exclude" for k in options):
+                raise _Unsupported(cls)
+            body[f"v{i}"] = self._field(cls, f, hints[f.name], f"v{i}", namespace)
+
+        names = [f.name for f in fields(cls) if f.init]
+        if self._lazy and cls not in compact_classes.values():
+            # compact classes have no __dict__ to keep the decoded values in
+            field_decoders = {}
+            for name, (var, lines) in zip(names, body.items()):
+                source = ["def decode(kvs):", "    get = kvs.get", *lines]
+                source.append(f"    return {var}")
+                exec("\n".join(source), namespace)  # pylint: disable=exec-used
+                field_decoders[name] = namespace.pop("decode")
+            return _lazy_decoder(
+                _lazy_class(cls, field_decoders),
+                get_decoder(cls, compact=bool(self._compact)),
+            )
+
+        source = [
+            "def decode(kvs):",
+            "    if isinstance(kvs, _cls):",
+            "        return kvs",
+            "    get = kvs.get",
+        ]
+        for lines in body.values():
+            source.extend(lines)
+        args = ", ".join(f"{name}={var}" for name, var in zip(names, body))
+        source.append(f"    return _cls({args})")
+        exec("\n".join(source), namespace)  # pylint: disable=exec-used
+        return namespace["decode"]
+
+    # pylint: disable=too-many-positional-arguments
+    def _field(
+        self, cls: type, f: Any, tp: Any, var: str, namespace: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Returns the lines setting var to the decoded value of the field, read from kvs.
+        """
+        lines = []
+        if f.default is not MISSING:
+            namespace[f"_default_{var}"] = f.default
+            lines.append(f"    {var} = get({f.name!r}, _default_{var})")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{var}"] = f.default_factory
+            lines.append(
+                f"    {var} = kvs[{f.name!r}] if {f.name!r} in kvs else _factory_{var}()"
+            )
+        else:
+            lines.append(f"    {var} = kvs[{f.name!r}]")
+
+        lines.append(f"    if {var} is not None:")
+        if is_dataclass(tp):
+            namespace[f"_decode_{var}"] = self.decoder(tp)  # type: ignore
+            lines.append(
+                f"        {var} = _decode_{var}({var}) if {var}.__class__ is dict "
+                f"else _field_dataclass({var}, _decode_{var})"
+            )
+        else:
+            lines.append(f"        {var} = {self._expr(tp, var, namespace, 0)}")
+        if not _is_optional(tp):
+            lines.append("    else:")
+            lines.append(f"        _warn_none({cls.__name__!r}, {f.name!r})")
+        return lines
+
+    # pylint: enable=too-many-positional-arguments
+
+    # pylint: disable=too-many-return-statements,too-many-branches
+    def _expr(self, tp: Any, var: str, namespace: Dict[str, Any], depth: int) -> str:
+        """
+        Returns an expression decoding var, which may be None, as dataclasses_json does for the type.
+        """
+        if tp is Any:
+            return var
+
+        origin = get_origin(tp)
+        args = get_args(tp)
+        if _is_union(tp):
+            if len(args) != 2 or type(None) not in args:
+                raise _Unsupported(tp)
+            inner = args[0] if args[1] is type(None) else args[1]
+            return f"(None if {var} is None else {self._expr(inner, var, namespace, depth)})"
+
+        item = f"x{depth}"
+        if origin is list or tp in (list, List):
+            if len(args) != 1:
+                raise _Unsupported(tp)
+            expr = self._expr(args[0], item, namespace, depth + 1)
+            return f"(None if {var} is None else [{expr} for {item} in {var}])"
+
+        if origin is dict or tp in (dict, Dict):
+            if not args:
+                return f"(None if {var} is None else dict({var}))"
+            key = f"k{depth}"
+            key_expr = self._expr(args[0], key, namespace, depth + 1)
+            if args[0] is not Any:
+                # keys are converted once more with the key type, as dataclasses_json does
+                if not isinstance(args[0], type):
+                    raise _Unsupported(tp)
+                key_type = f"_t{len(namespace)}"
+                namespace[key_type] = args[0]
+                key_expr = f"{key_type}({key_expr})"
+            value_expr = self._expr(args[1], item, namespace, depth + 1)
+            return (
+                f"(None if {var} is None else "
+                f"{{{key_expr}: {value_expr} for {key}, {item} in {var}.items()}})"
+            )
+
+        if origin is not None or not isinstance(tp, type):
+            raise _Unsupported(tp)
+
+        name = f"_t{len(namespace)}"
+        namespace[name] = tp
+        if issubclass(tp, Enum):
+            return f"(None if {var} is None else {name}({var}))"
+        if is_dataclass(tp):
+            namespace[name] = self.decoder(tp)
+            return f"{name}({var})"
+        if issubclass(tp, (datetime, Decimal, UUID)):
+            raise _Unsupported(tp)
+        if issubclass(tp, (int, float, str, bool)):
+            return f"({var} if isinstance({var}, {name}) else {name}({var}))"
+        return var
+
+    # pylint: enable=too-many-return-statements,too-many-branches
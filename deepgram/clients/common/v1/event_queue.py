@@ -0,0 +1,248 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Optional
+
+from .errors import DeepgramError
+
+# what put() does when the queue is full
+OVERFLOW_POLICIES = ["block", "drop_interim", "drop_oldest"]
+
+
+@dataclass
+class EventQueueStats:
+    """
+    The queue depth metrics of an EventQueue.
+
+    Attributes:
+        depth (int): The number of events waiting.
+        max_depth (int): The largest number of events that have been waiting at once.
+        maxsize (int): The capacity of the queue.
+        delivered (int): The number of events taken from the queue.
+        dropped (int): The number of events dropped by the overflow policy.
+    """
+
+    depth: int = 0
+    max_depth: int = 0
+    maxsize: int = 0
+    delivered: int = 0
+    dropped: int = 0
+
+
+class _BoundedQueue:  # pylint: disable=too-many-instance-attributes
+    """
+    The events and metrics shared by EventQueue and AsyncEventQueue.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: str = "block",
+        is_interim: Optional[Callable[[Any], bool]] = None,
+    ):
+        if maxsize <= 0:
+            raise DeepgramError("maxsize must be positive")
+        if overflow not in OVERFLOW_POLICIES:
+            raise DeepgramError(
+                f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}"
+            )
+        if overflow == "drop_interim" and is_interim is None:
+            raise DeepgramError("the drop_interim overflow requires is_interim")
+
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._is_interim = is_interim
+        self._items: Deque[Any] = deque()
+        self._closed = False
+        self._max_depth = 0
+        self._delivered = 0
+        self._dropped = 0
+
+    def _make_room(self, item: Any) -> Optional[bool]:
+        """
+        Applies the overflow policy for the item: returns True when it can be added, False when
+        it is refused and None when put() has to wait.
+        """
+        if self._closed:
+            return False
+        if len(self._items) < self.maxsize:
+            return True
+        if self.overflow == "drop_oldest":
+            self._items.popleft()
+            self._dropped += 1
+            return True
+        if self.overflow == "drop_interim":
+            # the oldest waiting interim event, else the new one if it is one
+            for index, waiting in enumerate(self._items):
+                if self._is_interim(waiting):  # type: ignore
+                    del self._items[index]
+                    self._dropped += 1
+                    return True
+            if self._is_interim(item):  # type: ignore
+                self._dropped += 1
+                return False
+        return None
+
+    def _append(self, item: Any) -> None:
+        self._items.append(item)
+        self._max_depth = max(self._max_depth, len(self._items))
+
+    def _pop(self) -> Any:
+        self._delivered += 1
+        return self._items.popleft()
+
+    @property
+    def closed(self) -> bool:
+        """
+        True once close() has been called.
+        """
+        return self._closed
+
+    def stats(self) -> EventQueueStats:
+        """
+        Returns the queue depth metrics.
+        """
+        return EventQueueStats(
+            depth=len(self._items),
+            max_depth=self._max_depth,
+            maxsize=self.maxsize,
+            delivered=self._delivered,
+            dropped=self._dropped,
+        )
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class EventQueue(_BoundedQueue):
+    """
+    A bounded first-in first-out queue of events, shared by the threads producing and consuming them.
+
+    When the queue is full, put() follows the overflow policy:
+        block: waits until the consumer has taken an event.
+        drop_interim: drops the oldest waiting event for which is_interim is true, or else the
+            new event if it is one, and only waits when neither is.
+        drop_oldest: drops the oldest waiting event.
+
+    Once closed, put() refuses new events and get() returns the waiting ones, then None.
+    close() can add a last event, such as the end of a stream, even to a full queue.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: str = "block",
+        is_interim: Optional[Callable[[Any], bool]] = None,
+    ):
+        super().__init__(maxsize, overflow, is_interim)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item: Any) -> bool:
+        """
+        Adds the event, returns False if the queue is closed or the event was dropped.
+        """
+        with self._lock:
+            room = self._make_room(item)
+            while room is None:
+                self._not_full.wait()
+                room = self._make_room(item)
+            if room:
+                self._append(item)
+                self._not_empty.notify()
+            return room
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Any]:
+        """
+        Removes and returns the oldest event, waiting for one for up to timeout seconds.
+
+        Returns None once the queue is closed and empty, or when the timeout expires.
+        """
+        with self._lock:
+            if not self._items and not self._closed:
+                self._not_empty.wait_for(
+                    lambda: self._items or self._closed, timeout=timeout
+                )
+            if not self._items:
+                return None
+            self._not_full.notify()
+            return self._pop()
+
+    def close(self, last: Optional[Any] = None) -> None:
+        """
+        Refuses new events and wakes up the threads waiting on the queue.
+
+        The last event, if given, is added whatever the capacity and the overflow policy.
+        """
+        with self._lock:
+            if last is not None and not self._closed:
+                self._append(last)
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def stats(self) -> EventQueueStats:
+        """
+        Returns the queue depth metrics.
+        """
+        with self._lock:
+            return super().stats()
+
+
+class AsyncEventQueue(_BoundedQueue):
+    """
+    The asyncio counterpart of EventQueue, for the tasks of one event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        overflow: str = "block",
+        is_interim: Optional[Callable[[Any], bool]] = None,
+    ):
+        super().__init__(maxsize, overflow, is_interim)
+        self._changed = asyncio.Condition()
+
+    async def put(self, item: Any) -> bool:
+        """
+        Adds the event, returns False if the queue is closed or the event was dropped.
+        """
+        async with self._changed:
+            room = self._make_room(item)
+            while room is None:
+                await self._changed.wait()
+                room = self._make_room(item)
+            if room:
+                self._append(item)
+                self._changed.notify_all()
+            return room
+
+    async def get(self) -> Optional[Any]:
+        """
+        Removes and returns the oldest event, waiting for one. Returns None once the queue is
+        closed and empty.
+        """
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._items or self._closed)
+            if not self._items:
+                return None
+            self._changed.notify_all()
+            return self._pop()
+
+    async def close(self, last: Optional[Any] = None) -> None:
+        """
+        Refuses new events and wakes up the tasks waiting on the queue.
+
+        The last event, if given, is added whatever the capacity and the overflow policy.
+        """
+        async with self._changed:
+            if last is not None and not self._closed:
+                self._append(last)
+            self._closed = True
+            self._changed.notify_all()
@@ -0,0 +1,88 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import os
+import tempfile
+import time
+from typing import Optional
+
+# Helpers for the on-disk caches. Each entry is one file: its mtime is when it was written
+# (for the TTL) and its atime when it was last used (for the LRU order). Files are replaced
+# atomically and may be removed by another process at any time.
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """
+    Writes the file through a temporary file in the same directory, so readers never see a partial file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        remove_file(tmp)
+        raise
+
+
+def read_entry(path: str, ttl: Optional[float] = None) -> Optional[bytes]:
+    """
+    Returns the content of a cache file and marks it as used, or None if it is missing or expired.
+    """
+    try:
+        stat = os.stat(path)
+        if ttl is not None and time.time() - stat.st_mtime > ttl:
+            remove_file(path)
+            return None
+        with open(path, "rb") as file:
+            data = file.read()
+        os.utime(path, (time.time(), stat.st_mtime))
+    except OSError:
+        return None
+    return data
+
+
+def remove_file(path: str) -> None:
+    """
+    Removes the file, ignoring it if another process already did.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def evict_files(
+    directory: str, suffix: str, max_bytes: int, ttl: Optional[float] = None
+) -> int:
+    """
+    Removes the expired files, then the least recently used ones until the total is under max_bytes.
+
+    Returns the number of bytes used by the remaining files.
+    """
+    entries = []
+    total = 0
+    now = time.time()
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(suffix):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        if ttl is not None and now - stat.st_mtime > ttl:
+            remove_file(entry.path)
+            continue
+        entries.append((stat.st_atime, stat.st_size, entry.path))
+        total += stat.st_size
+
+    if total <= max_bytes:
+        return total
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        remove_file(path)
+        total -= size
+    return total
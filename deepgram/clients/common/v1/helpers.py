@@ -6,6 +6,8 @@ from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 from typing import Dict, Optional
 import re
 
+from ....options import DeepgramClientOptions
+
 
 # This function appends query parameters to a URL
 def append_query_params(url: str, params: Optional[Dict] = None):
@@ -32,6 +34,16 @@ def append_query_params(url: str, params: Optional[Dict] = None):
     return updated_url
 
 
+# This function determines if HTTP/2 must be spoken without negotiation
+def http2_prior_knowledge(config: DeepgramClientOptions) -> bool:
+    """
+    Returns True if HTTP/2 is enabled for a plain http:// URL.
+
+    Without TLS there is no ALPN negotiation, so HTTP/2 (h2c) must be used with prior knowledge.
+    """
+    return config.is_http2_enabled() and config.url.lower().startswith("http://")
+
+
 # This function converts a URL to a WebSocket URL
 def convert_to_websocket_url(base_url: str, endpoint: str):
     """
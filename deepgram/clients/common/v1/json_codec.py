@@ -0,0 +1,162 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import importlib
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+from ....options import DeepgramClientOptions
+from .errors import DeepgramError
+
+
+class JsonCodec:
+    """
+    Encodes and decodes JSON for the clients, using the standard library json module.
+
+    The codec decodes the messages received over WebSockets, the REST responses and API errors,
+    and encodes the control messages sent over WebSockets. Subclasses use faster third party
+    parsers which are used automatically when installed.
+
+    A codec is selected with the "json_codec" option of the config, one of "auto" (the default),
+    "orjson", "msgspec", "ujson" or "json", or a JsonCodec:
+        DeepgramClientOptions(options={"json_codec": "orjson"})
+    """
+
+    name: str = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decodes a JSON document. Raises a ValueError if it is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Encodes the object as a JSON document.
+        """
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    A JsonCodec using orjson (pip install orjson).
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = importlib.import_module("orjson")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError is a json.JSONDecodeError
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj).decode("utf-8")
+
+
+class MsgspecCodec(JsonCodec):
+    """
+    A JsonCodec using msgspec (pip install msgspec).
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        msgspec = importlib.import_module("msgspec")
+        self._decode = msgspec.json.Decoder().decode
+        self._encode = msgspec.json.Encoder().encode
+        self._error = msgspec.DecodeError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> str:
+        return self._encode(obj).decode("utf-8")
+
+
+class UjsonCodec(JsonCodec):
+    """
+    A JsonCodec using ujson (pip install ujson).
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        self._ujson = importlib.import_module("ujson")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # ujson.JSONDecodeError is a ValueError
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._ujson.dumps(obj, ensure_ascii=False)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "ujson": UjsonCodec,
+    "json": JsonCodec,
+}
+
+# the order in which "auto" looks for an installed parser
+AUTO_ORDER = ["orjson", "msgspec", "ujson", "json"]
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def resolve_json_codec(value: Union[JsonCodec, str, None] = "auto") -> JsonCodec:
+    """
+    Converts the "json_codec" client option, a JsonCodec or the name of one, into a JsonCodec.
+
+    "auto" or None selects the first installed of orjson, msgspec and ujson, or the standard
+    library. Naming a codec whose package is not installed raises a DeepgramError.
+    """
+    if isinstance(value, JsonCodec):
+        return value
+    if value is None or value == "auto":
+        return default_json_codec()
+
+    codec = CODECS.get(str(value).lower())
+    if codec is None:
+        raise DeepgramError(f"Unknown json_codec: {value}")
+    try:
+        return codec()
+    except ImportError as e:
+        raise DeepgramError(
+            f"json_codec {value} requires the {value} package (pip install {value})"
+        ) from e
+
+
+def default_json_codec() -> JsonCodec:
+    """
+    Returns the fastest installed codec, which is also used by BaseResponse.from_json by default.
+    """
+    global _default_codec  # pylint: disable=global-statement
+    if _default_codec is None:
+        for name in AUTO_ORDER:
+            try:
+                _default_codec = CODECS[name]()
+                break
+            except ImportError:
+                continue
+    return _default_codec  # type: ignore
+
+
+def get_json_codec(config: DeepgramClientOptions) -> JsonCodec:
+    """
+    Returns the JsonCodec selected by the config, resolving the "json_codec" option on first use.
+    """
+    value = config.options.get("json_codec")
+    if isinstance(value, JsonCodec):
+        return value
+    codec = resolve_json_codec(value)
+    if value is not None:
+        # share the codec with the other clients created from this config
+        config.options["json_codec"] = codec
+    return codec
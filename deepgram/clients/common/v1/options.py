@@ -2,6 +2,7 @@
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
 
+import mmap
 from io import BufferedReader
 from typing import Union
 from typing_extensions import TypedDict
@@ -42,11 +43,28 @@ class BufferSource(TypedDict):
     This class is used to specify raw binary data, such as audio data in its
     binary form, which can be captured from a microphone or generated synthetically.
 
+    Any object supporting the buffer protocol (mmap.mmap, memoryview, bytearray, NumPy array)
+    can be used and is uploaded without being copied into bytes. See mmap_file().
+
+    Attributes:
+        buffer (Union[bytes, bytearray, memoryview, mmap.mmap]): The binary data.
+    """
+
+    buffer: Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class FilePathSource(TypedDict):
+    """
+    Represents a data source for streaming binary data from a file on disk.
+
+    This class is used to upload a local file, such as a long audio recording, in chunks
+    without reading the whole file into memory.
+
     Attributes:
-        buffer (bytes): The binary data.
+        path (str): The path to the file.
     """
 
-    buffer: bytes
+    path: str
 
 
 class TextSource(TypedDict):
@@ -62,4 +80,4 @@ class TextSource(TypedDict):
     text: str
 
 
-FileSource = Union[TextSource, BufferSource, StreamSource]
+FileSource = Union[TextSource, BufferSource, StreamSource, FilePathSource]
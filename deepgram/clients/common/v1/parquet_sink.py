@@ -0,0 +1,281 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import os
+from typing import Any, Dict, List, Optional
+
+from .errors import DeepgramError
+from .words_table import alternative_words
+
+# columns of the three files, as (name, arrow type name)
+WORD_COLUMNS = [
+    ("request_id", "string"),
+    ("channel", "int32"),
+    ("alternative", "int32"),
+    ("index", "int32"),
+    ("word", "string"),
+    ("punctuated_word", "string"),
+    ("start", "float64"),
+    ("end", "float64"),
+    ("confidence", "float64"),
+    ("speaker", "int32"),
+    ("speaker_confidence", "float64"),
+    ("language", "string"),
+]
+
+UTTERANCE_COLUMNS = [
+    ("request_id", "string"),
+    ("channel", "int32"),
+    ("id", "string"),
+    ("start", "float64"),
+    ("end", "float64"),
+    ("confidence", "float64"),
+    ("speaker", "int32"),
+    ("transcript", "string"),
+]
+
+PARAGRAPH_COLUMNS = [
+    ("request_id", "string"),
+    ("channel", "int32"),
+    ("alternative", "int32"),
+    ("index", "int32"),
+    ("start", "float64"),
+    ("end", "float64"),
+    ("speaker", "int32"),
+    ("num_words", "int32"),
+    ("text", "string"),
+]
+
+
+class _Table:  # pylint: disable=too-many-instance-attributes
+    """
+    The record batches of one Parquet file, written a row group at a time.
+    """
+
+    def __init__(  # pylint: disable=too-many-positional-arguments
+        self, pa: Any, pq: Any, path: str, columns: List[Any], options: Dict[str, Any]
+    ):
+        self._pa = pa
+        self._pq = pq
+        self.path = path
+        self.schema = pa.schema([(name, getattr(pa, kind)()) for name, kind in columns])
+        self.options = options
+        self.batches: List[Any] = []
+        self.rows = 0
+        self.written = 0
+        self._writer: Optional[Any] = None
+
+    def append(self, columns: Dict[str, List[Any]], row_group_size: int) -> None:
+        """
+        Appends the rows as a record batch, writing the row groups that are complete.
+        """
+        batch = self._pa.RecordBatch.from_pydict(columns, schema=self.schema)
+        if batch.num_rows == 0:
+            return
+        self.batches.append(batch)
+        self.rows += batch.num_rows
+        if self.rows >= row_group_size:
+            self.flush(row_group_size, partial=False)
+
+    def flush(self, row_group_size: int, partial: bool = True) -> None:
+        """
+        Writes the complete row groups, and with partial the remaining rows as a smaller one.
+        """
+        table = self._pa.Table.from_batches(self.batches, schema=self.schema)
+        count = self.rows if partial else self.rows - self.rows % row_group_size
+        if count == 0:
+            return
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(
+                self.path, self.schema, **self.options
+            )
+        self._writer.write_table(table.slice(0, count), row_group_size=row_group_size)
+        rest = table.slice(count)
+        self.batches = rest.to_batches()
+        self.rows = rest.num_rows
+        self.written += count
+
+    def close(self, row_group_size: int) -> None:
+        """
+        Writes the remaining rows and closes the file.
+        """
+        self.flush(row_group_size)
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ParquetSink:
+    """
+    Writes the words, utterances and paragraphs of transcription results to Parquet files.
+
+    Each result passed to write() is converted to one Arrow record batch per table, without a
+    round trip through JSON. Rows are written to words.parquet, utterances.parquet and
+    paragraphs.parquet in the directory, a row group each time row_group_size rows have been
+    collected. A file is only created once it has rows. Every row carries the request id of
+    the result and its channel, so the results of many requests can share the same files.
+
+    Requires pyarrow (pip install deepgram-sdk[arrow]).
+
+    Example:
+        with ParquetSink("transcripts") as sink:
+            for response in responses:
+                sink.write(response)
+    """
+
+    def __init__(
+        self, directory: str, row_group_size: int = 65536, compression: str = "zstd"
+    ):
+        try:
+            # dynamic import of pyarrow as not to force the requirements on the SDK (and users)
+            import pyarrow  # pylint: disable=import-outside-toplevel
+            import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise DeepgramError(
+                "ParquetSink requires pyarrow (pip install deepgram-sdk[arrow])"
+            ) from e
+        if row_group_size <= 0:
+            raise DeepgramError("row_group_size must be positive")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.row_group_size = row_group_size
+        options = {"compression": compression}
+        self._tables = {
+            name: _Table(
+                pyarrow,
+                pyarrow.parquet,
+                os.path.join(directory, f"{name}.parquet"),
+                columns,
+                options,
+            )
+            for name, columns in (
+                ("words", WORD_COLUMNS),
+                ("utterances", UTTERANCE_COLUMNS),
+                ("paragraphs", PARAGRAPH_COLUMNS),
+            )
+        }
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def rows(self) -> Dict[str, int]:
+        """
+        The number of rows of each table, written or not yet.
+        """
+        return {name: t.written + t.rows for name, t in self._tables.items()}
+
+    def write(self, response: Any, request_id: Optional[str] = None) -> None:
+        """
+        Appends the rows of a PrerecordedResponse or LiveResultResponse.
+
+        The request id defaults to the one in the metadata of the response.
+        """
+        if request_id is None:
+            metadata = getattr(response, "metadata", None)
+            request_id = getattr(metadata, "request_id", "") or ""
+
+        if hasattr(response, "channel"):
+            # a live result holds one channel
+            index = response.channel_index[0] if response.channel_index else 0
+            channels = [(index, response.channel)]
+            utterances: List[Any] = []
+        else:
+            results = response.results
+            channels = list(enumerate((results and results.channels) or []))
+            utterances = (results and results.utterances) or []
+
+        words = _columns(WORD_COLUMNS)
+        paragraphs = _columns(PARAGRAPH_COLUMNS)
+        for channel, content in channels:
+            for alternative, choice in enumerate(content.alternatives):
+                _word_rows(words, request_id, channel, alternative, choice)
+                _paragraph_rows(paragraphs, request_id, channel, alternative, choice)
+        self._tables["words"].append(words, self.row_group_size)
+        self._tables["paragraphs"].append(paragraphs, self.row_group_size)
+        self._tables["utterances"].append(
+            _utterance_rows(request_id, utterances), self.row_group_size
+        )
+
+    def flush(self) -> None:
+        """
+        Writes all collected rows, the last row group of each file may be smaller.
+        """
+        for table in self._tables.values():
+            table.flush(self.row_group_size)
+
+    def close(self) -> None:
+        """
+        Writes the remaining rows and closes the files.
+        """
+        for table in self._tables.values():
+            table.close(self.row_group_size)
+
+
+def _columns(columns: List[Any]) -> Dict[str, List[Any]]:
+    return {name: [] for name, _ in columns}
+
+
+def _utterance_rows(request_id: str, utterances: List[Any]) -> Dict[str, List[Any]]:
+    rows = _columns(UTTERANCE_COLUMNS)
+    for utterance in utterances:
+        rows["request_id"].append(request_id)
+        rows["channel"].append(utterance.channel)
+        rows["id"].append(utterance.id)
+        rows["start"].append(utterance.start)
+        rows["end"].append(utterance.end)
+        rows["confidence"].append(utterance.confidence)
+        rows["speaker"].append(utterance.speaker)
+        rows["transcript"].append(utterance.transcript)
+    return rows
+
+
+# pylint: disable=too-many-positional-arguments
+def _word_rows(
+    rows: Dict[str, List[Any]],
+    request_id: str,
+    channel: int,
+    alternative: int,
+    choice: Any,
+) -> None:
+    # reads the undecoded dicts of a lazy response, as words_table does
+    names = [name for name, _ in WORD_COLUMNS[4:]]
+    columns = [rows[name] for name in names]
+    count = 0
+    for word in alternative_words(choice):
+        get = dict.get if word.__class__ is dict else getattr
+        for name, column in zip(names, columns):
+            column.append(get(word, name, None))
+        count += 1
+    rows["request_id"].extend([request_id] * count)
+    rows["channel"].extend([channel] * count)
+    rows["alternative"].extend([alternative] * count)
+    rows["index"].extend(range(count))
+
+
+def _paragraph_rows(
+    rows: Dict[str, List[Any]],
+    request_id: str,
+    channel: int,
+    alternative: int,
+    choice: Any,
+) -> None:
+    paragraphs = getattr(choice, "paragraphs", None)
+    for index, paragraph in enumerate((paragraphs and paragraphs.paragraphs) or []):
+        rows["request_id"].append(request_id)
+        rows["channel"].append(channel)
+        rows["alternative"].append(alternative)
+        rows["index"].append(index)
+        rows["start"].append(paragraph.start)
+        rows["end"].append(paragraph.end)
+        rows["speaker"].append(paragraph.speaker)
+        rows["num_words"].append(paragraph.num_words)
+        rows["text"].append(" ".join(s.text for s in paragraph.sentences))
+
+
+# pylint: enable=too-many-positional-arguments
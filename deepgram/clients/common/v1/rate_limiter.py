@@ -0,0 +1,317 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, Iterator, Optional, Union
+
+import httpx
+
+from .errors import DeepgramError
+
+
+class RateLimiter:  # pylint: disable=too-many-instance-attributes
+    """
+    A token-bucket rate limiter with an optional cap on concurrent requests.
+
+    A single RateLimiter is shared by every client created from one DeepgramClient, and it can be
+    used from threads and from asyncio tasks at the same time. Each REST request takes a token and
+    holds a concurrency slot while it is sent, or until the response is closed when it is streamed.
+    Each WebSocket connection takes a token and holds a
+    concurrency slot until it is closed.
+
+    Args:
+        requests_per_second (Optional[float]): The rate at which tokens are refilled. None means no rate limit.
+        burst (Optional[int]): The size of the bucket (default is max(1, requests_per_second)).
+        max_concurrent (Optional[int]): The maximum number of requests in flight. None means no cap.
+    """
+
+    _rate: Optional[float]
+    _capacity: float
+    _tokens: float
+    _updated: float
+    _max_concurrent: Optional[int]
+    _in_flight: int
+    _waiting: int
+    _cond: threading.Condition
+    _async_waiters: "Deque[asyncio.Future[None]]"
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        if requests_per_second is not None and float(requests_per_second) <= 0:
+            raise DeepgramError("requests_per_second must be greater than 0")
+        if max_concurrent is not None and int(max_concurrent) <= 0:
+            raise DeepgramError("max_concurrent must be greater than 0")
+
+        self._rate = None if requests_per_second is None else float(requests_per_second)
+        if burst is None:
+            burst = max(1, int(self._rate or 1))
+        self._capacity = float(burst)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._max_concurrent = None if max_concurrent is None else int(max_concurrent)
+        self._in_flight = 0
+        self._waiting = 0
+        self._cond = threading.Condition()
+        # the asyncio tasks waiting for a concurrency slot, woken up by release()
+        self._async_waiters = deque()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    @property
+    def tokens(self) -> float:
+        """
+        The number of tokens currently available in the bucket.
+        """
+        with self._cond:
+            self._refill()
+            return self._tokens
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently holding a concurrency slot.
+        """
+        with self._cond:
+            return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of callers currently waiting for a token or a concurrency slot.
+        """
+        with self._cond:
+            return self._waiting
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns a snapshot of the limiter for monitoring.
+        """
+        with self._cond:
+            self._refill()
+            return {
+                "tokens": self._tokens,
+                "in_flight": self._in_flight,
+                "queue_depth": self._waiting,
+            }
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks the calling thread until a token and a concurrency slot are available.
+
+        Returns False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    wait = self._try_acquire()
+                    if wait == 0:
+                        return True
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait = remaining if wait is None else min(wait, remaining)
+                    # without a timeout, waiting for a slot lasts until release()
+                    self._cond.wait(wait)
+            finally:
+                self._waiting -= 1
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits without blocking the event loop until a token and a concurrency slot are available.
+
+        Returns False if the timeout expired first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._waiting += 1
+        try:
+            while True:
+                waiter = None
+                with self._cond:
+                    wait = self._try_acquire()
+                    if wait == 0:
+                        return True
+                    if wait is None:
+                        waiter = loop.create_future()
+                        self._async_waiters.append(waiter)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        if waiter is not None:
+                            self._forget(waiter)
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                if waiter is None:
+                    await asyncio.sleep(wait)  # type: ignore[arg-type]
+                    continue
+                try:
+                    await asyncio.wait_for(waiter, wait)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    self._forget(waiter)
+        finally:
+            with self._cond:
+                self._waiting -= 1
+
+    def release(self) -> None:
+        """
+        Gives back the concurrency slot taken by acquire() or acquire_async().
+        """
+        if self._max_concurrent is None:
+            return
+        with self._cond:
+            if self._in_flight > 0:
+                self._in_flight -= 1
+            self._cond.notify()
+            self._wake_async()
+
+    def _forget(self, waiter: "asyncio.Future[None]") -> None:
+        with self._cond:
+            if waiter in self._async_waiters:
+                self._async_waiters.remove(waiter)
+
+    def _wake_async(self) -> None:
+        """
+        Wakes up the first asyncio task waiting for a slot, on its own event loop. Must be called
+        holding the lock.
+        """
+        while self._async_waiters:
+            waiter = self._async_waiters.popleft()
+            if waiter.done():
+                continue
+            try:
+                waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+                return
+            except RuntimeError:
+                # its event loop is closed
+                continue
+
+    def _wake(self, waiter: "asyncio.Future[None]") -> None:
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+        # the task stopped waiting meanwhile, pass the slot on
+        with self._cond:
+            self._wake_async()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._rate is not None:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+        self._updated = now
+
+    def _try_acquire(self) -> Optional[float]:
+        """
+        Takes a token and a concurrency slot if both are available. Must be called holding the lock.
+
+        Returns 0 on success, None if all the slots are taken, until release() is called,
+        otherwise the number of seconds to wait for a token.
+        """
+        if self._max_concurrent is not None and self._in_flight >= self._max_concurrent:
+            return None
+        if self._rate is not None:
+            self._refill()
+            if self._tokens < 1:
+                return (1 - self._tokens) / self._rate
+            self._tokens -= 1
+        if self._max_concurrent is not None:
+            self._in_flight += 1
+        return 0
+
+
+def _release_once(limiter: RateLimiter) -> Callable[[], None]:
+    released = threading.Event()
+
+    def release() -> None:
+        if not released.is_set():
+            released.set()
+            limiter.release()
+
+    return release
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+def hold_until_closed(response: httpx.Response, limiter: RateLimiter) -> httpx.Response:
+    """
+    Keeps the concurrency slot of a streamed response until the response is closed, by reading
+    it to the end or by calling close().
+    """
+    if response.is_closed:
+        limiter.release()
+        return response
+    response.stream = _ReleasingStream(
+        response.stream, _release_once(limiter)  # type: ignore[arg-type]
+    )
+    return response
+
+
+def hold_until_aclosed(
+    response: httpx.Response, limiter: RateLimiter
+) -> httpx.Response:
+    """
+    The asyncio counterpart of hold_until_closed(), for responses closed with aclose().
+    """
+    if response.is_closed:
+        limiter.release()
+        return response
+    response.stream = _AsyncReleasingStream(
+        response.stream, _release_once(limiter)  # type: ignore[arg-type]
+    )
+    return response
@@ -67,12 +67,6 @@ class Average(BaseResponse):
     sentiment: Sentiment
     sentiment_score: float = 0
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "sentiment" in _dict:
-            _dict["sentiment"] = Sentiment.from_dict(_dict["sentiment"])
-        return _dict[key]
-
 
 @dataclass
 class Topic(BaseResponse):
@@ -116,16 +110,6 @@ class Segment(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "sentiment" in _dict:
-            _dict["sentiment"] = Sentiment.from_dict(_dict["sentiment"])
-        if "intents" in _dict:
-            _dict["intents"] = Intent.from_dict(_dict["intents"])
-        if "topics" in _dict:
-            _dict["topics"] = Topic.from_dict(_dict["topics"])
-        return _dict[key]
-
 
 @dataclass
 class Sentiments(BaseResponse):
@@ -136,16 +120,6 @@ class Sentiments(BaseResponse):
     average: Average
     segments: List[Segment] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "segments" in _dict:
-            _dict["segments"] = [
-                Segment.from_dict(segments) for segments in _dict["segments"]
-            ]
-        if "average" in _dict:
-            _dict["average"] = Average.from_dict(_dict["average"])
-        return _dict[key]
-
 
 @dataclass
 class Topics(BaseResponse):
@@ -155,14 +129,6 @@ class Topics(BaseResponse):
 
     segments: List[Segment] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "segments" in _dict:
-            _dict["segments"] = [
-                Segment.from_dict(segments) for segments in _dict["segments"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class Intents(BaseResponse):
@@ -171,11 +137,3 @@ class Intents(BaseResponse):
     """
 
     segments: List[Segment] = field(default_factory=list)
-
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "segments" in _dict:
-            _dict["segments"] = [
-                Segment.from_dict(segments) for segments in _dict["segments"]
-            ]
-        return _dict[key]
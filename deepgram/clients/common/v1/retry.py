@@ -0,0 +1,193 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+import httpx
+
+from .buffers import BufferStream
+
+# methods which can be replayed without side effects
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+# statuses which signal the server did not process the request, so any method can be replayed
+UNPROCESSED_STATUSES = frozenset([429, 503])
+
+# transport errors which happen before the request is sent, so any method can be replayed
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryPolicy:  # pylint: disable=too-many-instance-attributes
+    """
+    Describes how failed REST requests are retried.
+
+    Delays between attempts use exponential backoff with decorrelated jitter, and a Retry-After
+    header sent by the server is honored. Requests using a non-idempotent method (POST, PATCH) are
+    only retried when the server did not process them (429, 503 or a connection error), unless
+    retry_non_idempotent is set.
+
+    A policy can be set for all the clients of a config, per client or per call:
+        DeepgramClientOptions(options={"retry": RetryPolicy(max_attempts=5)})
+        client.retry_policy = RetryPolicy(max_attempts=5)
+        client.transcribe_file(payload, options, retry=RetryPolicy(max_attempts=5))
+
+    Attributes:
+        max_attempts (int): The total number of attempts, including the first one (default is 3).
+        base_delay (float): The minimum delay in seconds between attempts (default is 0.5).
+        max_delay (float): The maximum delay in seconds between attempts (default is 30.0).
+        retry_statuses (FrozenSet[int]): The HTTP status codes to retry (default is 408, 429, 500, 502, 503, 504).
+        retry_transport_errors (bool): Retry on network errors and timeouts (default is True).
+        respect_retry_after (bool): Wait at least as long as the Retry-After header asks (default is True).
+        retry_non_idempotent (bool): Retry POST/PATCH requests which the server may have processed (default is False).
+    """
+
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+    retry_statuses: FrozenSet[int]
+    retry_transport_errors: bool
+    respect_retry_after: bool
+    retry_non_idempotent: bool
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: Optional[FrozenSet[int]] = None,
+        retry_transport_errors: bool = True,
+        respect_retry_after: bool = True,
+        retry_non_idempotent: bool = False,
+    ):  # pylint: disable=too-many-positional-arguments
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        if retry_statuses is None:
+            retry_statuses = frozenset([408, 429, 500, 502, 503, 504])
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_transport_errors = retry_transport_errors
+        self.respect_retry_after = respect_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, retry_statuses={sorted(self.retry_statuses)})"
+        )
+
+    def should_retry_response(
+        self, method: str, attempt: int, response: httpx.Response
+    ) -> bool:
+        """
+        Returns True if the request should be attempted again after receiving this response.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if response.status_code not in self.retry_statuses:
+            return False
+        if response.status_code in UNPROCESSED_STATUSES:
+            return True
+        return self._is_replay_safe(method)
+
+    def should_retry_error(self, method: str, attempt: int, error: Exception) -> bool:
+        """
+        Returns True if the request should be attempted again after this transport error.
+        """
+        if attempt >= self.max_attempts or not self.retry_transport_errors:
+            return False
+        if not isinstance(error, httpx.TransportError):
+            return False
+        if isinstance(error, UNSENT_ERRORS):
+            return True
+        return self._is_replay_safe(method)
+
+    def next_delay(
+        self, previous: float, response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before the next attempt, or None to stop retrying.
+
+        Uses decorrelated jitter: a random delay between base_delay and three times the previous one.
+        """
+        delay = min(
+            self.max_delay,
+            random.uniform(self.base_delay, max(self.base_delay, previous * 3)),
+        )
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                if retry_after > self.max_delay:
+                    return None
+                delay = max(delay, retry_after)
+        return delay
+
+    def _is_replay_safe(self, method: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS or self.retry_non_idempotent
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header given either in seconds or as an HTTP date.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def resolve_retry_policy(
+    value: Union[RetryPolicy, Dict[str, Any], bool, str, None]
+) -> Optional[RetryPolicy]:
+    """
+    Converts the "retry" client option into a RetryPolicy.
+
+    The option can be a RetryPolicy, a dict of RetryPolicy arguments, or True for the defaults.
+    """
+    if value is None or value is False:
+        return None
+    if isinstance(value, RetryPolicy):
+        return value
+    if isinstance(value, dict):
+        return RetryPolicy(**value)
+    if value is True or (isinstance(value, str) and value.lower() == "true"):
+        return RetryPolicy()
+    return None
+
+
+def body_position(content: Any) -> Optional[int]:
+    """
+    Returns the position of a seekable stream body so it can be rewound before a retry.
+    """
+    if hasattr(content, "seek") and hasattr(content, "tell"):
+        seekable = getattr(content, "seekable", None)
+        if seekable is None or seekable():
+            return content.tell()
+    return None
+
+
+def rewind_body(content: Any, position: Optional[int]) -> bool:
+    """
+    Prepares the request body to be sent again.
+
+    Returns False if the body is a non-seekable stream or iterator which cannot be replayed.
+    """
+    if content is None or isinstance(
+        content, (bytes, bytearray, memoryview, str, BufferStream)
+    ):
+        return True
+    if position is None:
+        return False
+    content.seek(position)
+    return True
@@ -2,12 +2,16 @@
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
 
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Callable, Tuple
 
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields, make_dataclass
 from dataclasses_json import config as dataclass_config, DataClassJsonMixin
 
+from .decoder import get_decoder, register_compact_class
+from .json_codec import default_json_codec
+
 
 # base class
 
@@ -16,11 +20,58 @@ from dataclasses_json import config as dataclass_config, DataClassJsonMixin
 class BaseResponse(DataClassJsonMixin):
     """
     BaseResponse class used to define the common methods and properties for all response classes.
+
+    from_dict (and from_json, which calls it) uses a decoder generated for each subclass on first
+    use, which builds the same objects as the generic dataclasses_json decoder much faster.
+    from_json parses with the given JsonCodec, by default the fastest one installed.
+
+    With lazy=True the response keeps the decoded dict and builds each nested object when it
+    is first read. Missing required fields are then reported on access rather than up front.
+    With compact=True the classes that have a compact variant, such as the words, are decoded
+    as that variant, see compact_class.
     """
 
+    @classmethod
+    def from_dict(cls, kvs, *, infer_missing=False, lazy=False, compact=False):
+        if infer_missing:
+            return super().from_dict(kvs, infer_missing=infer_missing)
+        return get_decoder(cls, lazy, compact)(kvs)
+
+    @classmethod
+    def from_json(  # pylint: disable=arguments-differ
+        cls,
+        s,
+        *,
+        parse_float=None,
+        parse_int=None,
+        parse_constant=None,
+        infer_missing=False,
+        codec=None,
+        lazy=False,
+        compact=False,
+        **kw,
+    ):
+        if parse_float or parse_int or parse_constant or kw:
+            # options of json.loads
+            return super().from_json(
+                s,
+                parse_float=parse_float,
+                parse_int=parse_int,
+                parse_constant=parse_constant,
+                infer_missing=infer_missing,
+                **kw,
+            )
+        if codec is None:
+            codec = default_json_codec()
+        return cls.from_dict(
+            codec.loads(s), infer_missing=infer_missing, lazy=lazy, compact=compact
+        )
+
     def __getitem__(self, key):
-        _dict = self.to_dict()
-        return _dict[key]
+        _value = _lookup(self, key)
+        if _value is MISSING:
+            raise KeyError(key)
+        return _value
 
     def __setitem__(self, key, val):
         self.__dict__[key] = val
@@ -32,16 +83,157 @@ class BaseResponse(DataClassJsonMixin):
         """
         This method is used to evaluate a key in the response object using a dot notation style method.
         """
-        keys = key.split(".")
-        result: Dict[Any, Any] = self.to_dict()
-        for k in keys:
-            if isinstance(result, dict) and k in result:
-                result = result[k]
-            elif isinstance(result, list) and k.isdigit() and int(k) < len(result):
-                result = result[int(k)]
+        result: Any = self
+        for name, index in _compile_path(key):
+            if isinstance(result, BaseResponse):
+                result = _lookup(result, name)
+                if result is MISSING:
+                    return ""
+            elif isinstance(result, dict) and name in result:
+                result = result[name]
+            elif isinstance(result, list) and index is not None and index < len(result):
+                result = result[index]
             else:
                 return ""
-        return str(result)
+        return str(_plain(result))
+
+
+# Item and path lookups read the attributes directly instead of converting the whole response
+# with to_dict(). A key is found if to_dict() would contain it: the field exists and is not
+# excluded for its value, usually a None in an optional field.
+
+_item_fields: Dict[type, Dict[str, Optional[Callable[[Any], bool]]]] = {}
+
+
+def _lookup(obj: BaseResponse, name: str) -> Any:
+    """
+    Returns the value of the field as obj[name] sees it, or MISSING.
+    """
+    cls = type(obj)
+    excludes = _item_fields.get(cls)
+    if excludes is None:
+        excludes = {
+            f.name: f.metadata.get("dataclasses_json", {}).get("exclude")
+            for f in fields(cls)
+        }
+        _item_fields[cls] = excludes
+    if name not in excludes:
+        return MISSING
+    value = getattr(obj, name)
+    exclude = excludes[name]
+    if exclude is not None and exclude(value):
+        return MISSING
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(key: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """
+    Splits a dot notation path into its keys, each with its list index if it is one.
+    """
+    return tuple((k, int(k) if k.isdigit() else None) for k in key.split("."))
+
+
+def _plain(value: Any) -> Any:
+    # eval() prints the value found as to_dict() would have it
+    if isinstance(value, BaseResponse):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
+
+
+# compact variants
+
+
+class CompactResponse:
+    """
+    Base class of the compact variants of response classes, see compact_class.
+
+    It provides the methods of BaseResponse without adding an instance __dict__.
+    """
+
+    __slots__ = ()
+
+    # the class the variant was made from, set by compact_class
+    _compact_of: type = BaseResponse
+
+    dataclass_json_config = None
+    to_dict = DataClassJsonMixin.to_dict
+    to_json = DataClassJsonMixin.to_json
+    __getitem__ = BaseResponse.__getitem__
+    __str__ = BaseResponse.__str__
+    eval = BaseResponse.eval
+
+    @classmethod
+    def from_dict(cls, kvs):
+        """
+        Decodes the dict into an instance of the compact class.
+        """
+        return get_decoder(cls)(kvs)
+
+    @classmethod
+    def from_json(cls, s, *, codec=None):
+        """
+        Decodes the JSON document into an instance of the compact class.
+        """
+        if codec is None:
+            codec = default_json_codec()
+        return cls.from_dict(codec.loads(s))
+
+    def __setitem__(self, key, val):
+        setattr(self, key, val)
+
+    def __eq__(self, other):
+        # equal to an instance of the full class with the same values, and the other way around
+        if not isinstance(other, self._compact_of):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in fields(self)
+            if f.compare
+        )
+
+    __hash__ = None  # type: ignore
+
+
+def compact_class(cls: type, name: str) -> type:
+    """
+    Returns a compact variant of the response class and registers it for compact decoding.
+
+    The variant is a slotted dataclass with the same fields and methods as cls but without an
+    instance __dict__, saving about a third of the memory of a small object such as a word.
+    Its instances are instances of cls for isinstance and compare equal to instances of cls
+    with the same values. It must be assigned to name in the module of cls to be picklable.
+    """
+    compact = make_dataclass(
+        name,
+        [
+            (
+                f.name,
+                f.type,
+                field(
+                    default=f.default,
+                    default_factory=f.default_factory,
+                    init=f.init,
+                    repr=f.repr,
+                    compare=f.compare,
+                    metadata=f.metadata,
+                ),
+            )
+            for f in fields(cls)
+        ],
+        bases=(CompactResponse,),
+        namespace={"__doc__": cls.__doc__, "_compact_of": cls},
+        eq=False,
+        slots=True,
+    )
+    compact.__module__ = cls.__module__
+    cls.register(compact)  # type: ignore
+    register_compact_class(cls, compact)
+    return compact
 
 
 # shared classes
@@ -78,9 +270,3 @@ class Search(BaseResponse):
 
     query: str = ""
     hits: List[Hit] = field(default_factory=list)
-
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "hits" in _dict:
-            _dict["hits"] = [Hit.from_dict(hits) for hits in _dict["hits"]]
-        return _dict[key]
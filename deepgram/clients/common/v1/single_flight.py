@@ -0,0 +1,224 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import hashlib
+import io
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+# the result handed to the waiting callers when the caller sending the request was cancelled
+_ABANDONED = object()
+
+
+class _Call:  # pylint: disable=too-few-public-methods
+    """
+    A request in flight and the callers waiting for its result.
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical REST requests that are in flight at the same time into a single HTTP call.
+
+    The first caller for a key sends the request, the callers arriving while it is in flight
+    wait for it and get the same result, or the same exception. If the asyncio task sending the
+    request is cancelled, one of the waiting tasks sends it again. Nothing is kept once the
+    request completes, so a later identical request goes out again.
+
+    Requests are identical when the method, URL with its query parameters, headers and body
+    are the same. Only requests with a JSON body, a bytes-like body or no body are coalesced;
+    streamed uploads and raw streamed responses always go out on their own.
+
+    Coalescing is enabled per client or for all clients of a config:
+        client.single_flight = SingleFlight()
+        DeepgramClientOptions(options={"single_flight": True})
+
+    Attributes:
+        calls (int): The number of requests sent.
+        shared (int): The number of callers served by a request sent for another caller.
+    """
+
+    calls: int
+    shared: int
+
+    _calls: Dict[str, _Call]
+    _futures: Dict[Tuple[int, str], "asyncio.Future[Any]"]
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._calls = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently in flight.
+        """
+        with self._lock:
+            return len(self._calls) + len(self._futures)
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        copy: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Returns the result of fn(), or of the call already in flight for the key.
+
+        Args:
+            key (str): The key identifying the request, see single_flight_key.
+            fn (Callable): Sends the request and returns its result.
+            copy (Optional[Callable]): Copies the result for each waiting caller, for results that cannot be shared.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()  # type: ignore
+            if call.error is not None:  # type: ignore
+                raise call.error  # type: ignore
+            return call.result if copy is None else copy(call.result)  # type: ignore
+
+        try:
+            call.result = fn()  # type: ignore
+            return call.result  # type: ignore
+        except BaseException as e:
+            call.error = e  # type: ignore
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()  # type: ignore
+
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        copy: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Returns the result of await fn(), or of the call already in flight for the key on this event loop.
+
+        Args:
+            key (str): The key identifying the request, see single_flight_key.
+            fn (Callable): Sends the request and returns its result.
+            copy (Optional[Callable]): Copies the result for each waiting caller, for results that cannot be shared.
+        """
+        loop = asyncio.get_running_loop()
+        # futures belong to one event loop, calls on other loops are not coalesced with this one
+        loop_key = (id(loop), key)
+        with self._lock:
+            future = self._futures.get(loop_key)
+            leader = future is None
+            if leader:
+                future = loop.create_future()
+                self._futures[loop_key] = future
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            # a waiter being cancelled must not cancel the request of the others
+            result = await asyncio.shield(future)  # type: ignore
+            if result is _ABANDONED:
+                # the request was not sent for us after all, send it or wait for another one
+                with self._lock:
+                    self.shared -= 1
+                return await self.do_async(key, fn, copy)
+            return result if copy is None else copy(result)
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # only this caller was cancelled, one of the waiting callers sends the request instead
+            future.set_result(_ABANDONED)  # type: ignore
+            raise
+        except BaseException as e:
+            future.set_exception(e)  # type: ignore
+            # mark the exception as retrieved in case nobody was waiting
+            future.exception()  # type: ignore
+            raise
+        finally:
+            with self._lock:
+                del self._futures[loop_key]
+        future.set_result(result)  # type: ignore
+        return result
+
+
+def resolve_single_flight(
+    value: Union[SingleFlight, bool, str, None]
+) -> Optional[SingleFlight]:
+    """
+    Converts the "single_flight" client option, a SingleFlight or True, into a SingleFlight.
+    """
+    if isinstance(value, SingleFlight):
+        return value
+    if value is True or (isinstance(value, str) and value.lower() == "true"):
+        return SingleFlight()
+    return None
+
+
+def single_flight_key(
+    method: str, url: str, headers: Dict[str, str], kwargs: Dict[str, Any]
+) -> Optional[str]:
+    """
+    Returns the key identifying a request, or None if its body cannot be compared.
+
+    The key covers the method, the URL including its query parameters, the headers and a
+    sha256 of the body. JSON bodies are canonicalized so that key order does not matter.
+    """
+    digest = hashlib.sha256()
+    for name in ("data", "files"):
+        if kwargs.get(name) is not None:
+            return None
+
+    body = kwargs.get("json")
+    content = kwargs.get("content")
+    if body is not None:
+        digest.update(
+            json.dumps(body, sort_keys=True, separators=(",", ":"), default=str).encode(
+                "utf-8"
+            )
+        )
+    elif isinstance(content, str):
+        digest.update(content.encode("utf-8"))
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        digest.update(content)
+    elif content is not None:
+        return None
+
+    canonical_headers = sorted((k.lower(), str(v)) for k, v in headers.items())
+    head = json.dumps([method.upper(), url, canonical_headers], separators=(",", ":"))
+    return f"{hashlib.sha256(head.encode('utf-8')).hexdigest()}:{digest.hexdigest()}"
+
+
+def copy_memory_result(
+    result: Dict[str, Union[str, io.BytesIO]]
+) -> Dict[str, Union[str, io.BytesIO]]:
+    """
+    Copies an in-memory response so that each caller reads its own stream.
+    """
+    return {
+        k: io.BytesIO(v.getvalue()) if isinstance(v, io.BytesIO) else v
+        for k, v in result.items()
+    }
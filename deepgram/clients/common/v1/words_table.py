@@ -0,0 +1,126 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from .decoder import raw_field
+from .errors import DeepgramError
+
+if TYPE_CHECKING:
+    import numpy
+
+# the columns of WordsTable.words, a speaker of -1 means the word has none
+WORDS_TABLE_COLUMNS = [
+    ("start", "f8"),
+    ("end", "f8"),
+    ("confidence", "f8"),
+    ("speaker", "i4"),
+    ("word_id", "i4"),
+    ("punctuated_start", "i4"),
+    ("punctuated_end", "i4"),
+]
+
+
+@dataclass
+class WordsTable:
+    """
+    The words of a transcript as columns, see PrerecordedResponse.words_table.
+
+    words is a NumPy structured array with one row per word and the columns start, end,
+    confidence, speaker (-1 if unknown), word_id, an index into vocabulary, and
+    punctuated_start and punctuated_end, the span of the punctuated word in punctuated (empty
+    if the word has none). A column is also returned by table["start"].
+
+    Example:
+        table = response.words_table()
+        confident = table.words[table["confidence"] > 0.9]
+        speaker_time = numpy.bincount(table["speaker"], weights=table["end"] - table["start"])
+    """
+
+    words: "numpy.ndarray"
+    vocabulary: List[str] = field(default_factory=list)
+    punctuated: str = ""
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __getitem__(self, column: str) -> "numpy.ndarray":
+        return self.words[column]
+
+    def word(self, index: int) -> str:
+        """
+        Returns the word of the row.
+        """
+        return self.vocabulary[self.words["word_id"][index]]
+
+    def punctuated_word(self, index: int) -> str:
+        """
+        Returns the punctuated word of the row, an empty string if it has none.
+        """
+        row = self.words[index]
+        return self.punctuated[row["punctuated_start"] : row["punctuated_end"]]
+
+
+# pylint: disable=too-many-locals
+def words_table(words: Iterable[Any]) -> WordsTable:
+    """
+    Builds a WordsTable from the words of an alternative, either word objects or the dicts of
+    the response, in one pass and without creating an object per word.
+    """
+    try:
+        # dynamic import of numpy as not to force the requirements on the SDK (and users)
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise DeepgramError(
+            "words_table requires numpy (pip install deepgram-sdk[numpy])"
+        ) from e
+
+    start: List[float] = []
+    end: List[float] = []
+    confidence: List[float] = []
+    speaker: List[int] = []
+    word_id: List[int] = []
+    offsets: List[int] = [0]
+    punctuated: List[str] = []
+    vocabulary: Dict[str, int] = {}
+
+    position = 0
+    for word in words:
+        # dict.get and getattr take the same arguments
+        get = dict.get if word.__class__ is dict else getattr
+        start.append(get(word, "start", 0))
+        end.append(get(word, "end", 0))
+        confidence.append(get(word, "confidence", 0))
+        number: Optional[int] = get(word, "speaker", None)
+        speaker.append(-1 if number is None else number)
+        text = get(word, "word", "")
+        word_id.append(vocabulary.setdefault(text, len(vocabulary)))
+        text = get(word, "punctuated_word", None) or ""
+        punctuated.append(text)
+        position += len(text)
+        offsets.append(position)
+
+    table = numpy.empty(len(start), dtype=WORDS_TABLE_COLUMNS)
+    table["start"] = start
+    table["end"] = end
+    table["confidence"] = confidence
+    table["speaker"] = speaker
+    table["word_id"] = word_id
+    table["punctuated_start"] = offsets[:-1]
+    table["punctuated_end"] = offsets[1:]
+    return WordsTable(
+        words=table, vocabulary=list(vocabulary), punctuated="".join(punctuated)
+    )
+
+
+def alternative_words(alternative: Any) -> Iterable[Any]:
+    """
+    Returns the words of the alternative, the undecoded dicts if it is lazy and they have not
+    been read yet.
+    """
+    words = raw_field(alternative, "words")
+    if words is None:
+        return alternative.words
+    return words
@@ -37,6 +37,9 @@ from .client import (
     AsyncPrerecordedResponse,
     PrerecordedResponse,
     SyncPrerecordedResponse,
+    BatchResult,
+    ResultCache,
+    TranscriptIndex,
     # shared
     Average,
     Intent,
@@ -70,6 +73,7 @@ from .client import (
     ListenRESTAlternative,
     ListenRESTChannel,
     ListenRESTWord,
+    ListenRESTCompactWord,
 )
 
 
@@ -95,6 +99,7 @@ from .client import (
     # unique
     ListenWSMetadata,
     ListenWSWord,
+    ListenWSCompactWord,
     ListenWSAlternative,
     ListenWSChannel,
 )
@@ -11,6 +11,9 @@ from .v1 import (
     PrerecordedOptions as PrerecordedOptionsLatest,
     ListenRESTOptions as ListenRESTOptionsLatest,
 )
+from .v1 import BatchResult as BatchResultLatest
+from .v1 import ResultCache as ResultCacheLatest
+from .v1 import TranscriptIndex as TranscriptIndexLatest
 
 from .v1 import (
     UrlSource as UrlSourceLatest,
@@ -59,6 +62,7 @@ from .v1 import (
     ListenRESTAlternative as ListenRESTAlternativeLatest,
     ListenRESTChannel as ListenRESTChannelLatest,
     ListenRESTWord as ListenRESTWordLatest,
+    ListenRESTCompactWord as ListenRESTCompactWordLatest,
 )
 
 # websocket
@@ -83,6 +87,7 @@ from .v1 import (
     ListenWSAlternative as ListenWSAlternativeLatest,
     ListenWSChannel as ListenWSChannelLatest,
     ListenWSWord as ListenWSWordLatest,
+    ListenWSCompactWord as ListenWSCompactWordLatest,
 )
 
 # The vX/client.py points to the current supported version in the SDK.
@@ -139,6 +144,9 @@ ListenRestSource = ListenRestSourceLatest
 AsyncPrerecordedResponse = AsyncPrerecordedResponseLatest
 PrerecordedResponse = PrerecordedResponseLatest
 SyncPrerecordedResponse = SyncPrerecordedResponseLatest
+BatchResult = BatchResultLatest
+ResultCache = ResultCacheLatest
+TranscriptIndex = TranscriptIndexLatest
 # unique
 Entity = EntityLatest
 ListenRESTMetadata = ListenRESTMetadataLatest
@@ -155,6 +163,7 @@ Warning = WarningLatest
 ListenRESTAlternative = ListenRESTAlternativeLatest
 ListenRESTChannel = ListenRESTChannelLatest
 ListenRESTWord = ListenRESTWordLatest
+ListenRESTCompactWord: type = ListenRESTCompactWordLatest
 
 # websocket
 ## input
@@ -172,6 +181,7 @@ ListenWSMetadata = ListenWSMetadataLatest
 ListenWSAlternative = ListenWSAlternativeLatest
 ListenWSChannel = ListenWSChannelLatest
 ListenWSWord = ListenWSWordLatest
+ListenWSCompactWord: type = ListenWSCompactWordLatest
 
 # clients
 ListenRESTClient = ListenRESTClientLatest
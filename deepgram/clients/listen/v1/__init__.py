@@ -46,6 +46,7 @@ from ...common import (
 # rest
 from .rest import ListenRESTClient, AsyncListenRESTClient
 from .rest import ListenRESTOptions, PrerecordedOptions
+from .rest import BatchResult, ResultCache, TranscriptIndex
 from .rest import (
     # common
     UrlSource,
@@ -99,6 +100,7 @@ from .rest import (
     ListenRESTAlternative,
     ListenRESTChannel,
     ListenRESTWord,
+    ListenRESTCompactWord,
 )
 
 # websocket
@@ -126,6 +128,7 @@ from .websocket import (
     #### unique
     Metadata as ListenWSMetadata,
     ListenWSWord,
+    ListenWSCompactWord,
     ListenWSAlternative,
     ListenWSChannel,
 )
@@ -4,6 +4,9 @@
 
 from .client import ListenRESTClient
 from .async_client import AsyncListenRESTClient
+from .batch import BatchResult
+from .cache import ResultCache
+from .time_index import TranscriptIndex
 from .options import (
     ListenRESTOptions,
     PrerecordedOptions,
@@ -11,6 +14,7 @@ from .options import (
     UrlSource,
     BufferSource,
     StreamSource,
+    FilePathSource,
     TextSource,
     FileSource,
     # unique
@@ -56,4 +60,5 @@ from .response import (
     ListenRESTAlternative,
     ListenRESTChannel,
     ListenRESTWord,
+    ListenRESTCompactWord,
 )
@@ -2,8 +2,19 @@
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import logging
-from typing import Dict, Union, Optional
+from typing import (
+    AsyncIterator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Union,
+    Optional,
+    cast,
+)
 
 import httpx
 
@@ -12,7 +23,14 @@ from .....options import DeepgramClientOptions
 from ....common import AbstractAsyncRestClient
 from ....common import DeepgramError, DeepgramTypeError
 
-from .helpers import is_buffer_source, is_readstream_source, is_url_source
+from .helpers import (
+    is_buffer_source,
+    is_readstream_source,
+    is_url_source,
+    is_path_source,
+    file_size_headers,
+    aiter_file,
+)
 from .options import (
     ListenRESTOptions,
     PrerecordedOptions,
@@ -20,17 +38,32 @@ from .options import (
     UrlSource,
 )
 from .response import AsyncPrerecordedResponse, PrerecordedResponse
+from .batch import BatchResult
+from .cache import (
+    ResultCache,
+    resolve_result_cache,
+    file_fingerprint,
+    url_fingerprint,
+    result_cache_key,
+)
 
 
 class AsyncListenRESTClient(AbstractAsyncRestClient):
     """
     A client class for handling pre-recorded audio data.
     Provides methods for transcribing audio from URLs and files.
+
+    Results can be cached on disk by setting result_cache, or the "result_cache" option of the config,
+    to a ResultCache or a directory. Identical audio sent with identical options is then answered
+    from the cache without calling the API. A URL source is first checked with a HEAD request
+    for its ETag or Last-Modified header, on every call, and is not cached without one.
     """
 
     _logger: verboselogs.VerboseLogger
     _config: DeepgramClientOptions
 
+    result_cache: Optional[ResultCache] = None
+
     def __init__(self, config: DeepgramClientOptions):
         self._logger = verboselogs.VerboseLogger(__name__)
         self._logger.addHandler(logging.StreamHandler())
@@ -40,6 +73,100 @@ class AsyncListenRESTClient(AbstractAsyncRestClient):
 
     # pylint: disable=too-many-positional-arguments
 
+    async def _result_cache_key(
+        self,
+        source: Union[UrlSource, FileSource],
+        options: Optional[Dict],
+        addons: Optional[Dict],
+        endpoint: str,
+        timeout: Optional[httpx.Timeout],
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> Optional[str]:
+        """
+        Returns the result cache key for the request, or None if it must not be cached.
+        """
+        if self.result_cache is None:
+            self.result_cache = resolve_result_cache(
+                self._config.options.get("result_cache")
+            )
+        if self.result_cache is None:
+            return None
+
+        if is_url_source(source):
+            # the hosted file is identified by its ETag, without sending our credentials. This is
+            # asked on every call, not memoized, so a file changed in place is never served stale
+            try:
+                response = await self._send_request(
+                    "HEAD",
+                    source["url"],  # type: ignore
+                    {},
+                    timeout or httpx.Timeout(30.0, connect=10.0),
+                    follow_redirects=True,
+                    transport=transport,
+                )
+            except httpx.HTTPError as e:
+                self._logger.warning("result cache HEAD request failed: %s", e)
+                return None
+            if not response.is_success:
+                return None
+            fingerprint = url_fingerprint(source["url"], response.headers)  # type: ignore
+        else:
+            fingerprint = await asyncio.to_thread(
+                file_fingerprint, cast(FileSource, source)
+            )
+        if fingerprint is None:
+            self._logger.info("source can not be fingerprinted, skipping result cache")
+            return None
+
+        return result_cache_key(
+            self._config.url, endpoint, fingerprint, options, addons
+        )
+
+    async def _cached_transcription(
+        self,
+        name: str,
+        source: Union[UrlSource, FileSource],
+        options: Optional[Dict],
+        addons: Optional[Dict],
+        endpoint: str,
+        timeout: Optional[httpx.Timeout],
+        request: Callable[[], Awaitable[str]],
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> PrerecordedResponse:
+        """
+        Returns the transcription from the result cache, or else sends the request and stores
+        its result in the cache.
+        """
+        cache_key = await self._result_cache_key(
+            source, options, addons, endpoint, timeout, transport
+        )
+        result = None
+        if cache_key is not None and self.result_cache is not None:
+            result = await asyncio.to_thread(self.result_cache.get, cache_key)
+            if result is not None:
+                self._logger.notice("%s served from the result cache", name)
+
+        if result is None:
+            result = await request()
+            self._logger.info("json: %s", result)
+            if cache_key is not None and self.result_cache is not None:
+                try:
+                    await asyncio.to_thread(self.result_cache.set, cache_key, result)
+                except OSError as e:
+                    self._logger.warning(
+                        "failed to store the result in the cache: %s", e
+                    )
+            self._logger.notice("%s succeeded", name)
+
+        res = PrerecordedResponse.from_json(
+            result,
+            codec=self._json,
+            lazy=self._config.is_lazy_response_enabled(),
+            compact=self._config.is_compact_words_enabled(),
+        )
+        self._logger.verbose("result: %s", res)
+        return res
+
     async def transcribe_url(
         self,
         source: UrlSource,
@@ -104,19 +231,24 @@ class AsyncListenRESTClient(AbstractAsyncRestClient):
         self._logger.info("options: %s", options)
         self._logger.info("addons: %s", addons)
         self._logger.info("headers: %s", headers)
-        result = await self.post(
-            url,
-            options=options,
-            addons=addons,
-            headers=headers,
-            json=body,
-            timeout=timeout,
-            **kwargs,
+        res = await self._cached_transcription(
+            "transcribe_url",
+            source,
+            options,
+            addons,
+            endpoint,
+            timeout,
+            lambda: self.post(
+                url,
+                options=options,
+                addons=addons,
+                headers=headers,
+                json=body,
+                timeout=timeout,
+                **kwargs,
+            ),
+            kwargs.get("transport"),
         )
-        self._logger.info("json: %s", result)
-        res = PrerecordedResponse.from_json(result)
-        self._logger.verbose("result: %s", res)
-        self._logger.notice("transcribe_url succeeded")
         self._logger.debug("ListenRESTClient.transcribe_url LEAVE")
         return res
 
@@ -185,7 +317,7 @@ class AsyncListenRESTClient(AbstractAsyncRestClient):
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = AsyncPrerecordedResponse.from_json(result)
+        res = AsyncPrerecordedResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("transcribe_url_callback succeeded")
         self._logger.debug("ListenRESTClient.transcribe_url_callback LEAVE")
@@ -239,6 +371,9 @@ class AsyncListenRESTClient(AbstractAsyncRestClient):
             body = source["buffer"]  # type: ignore
         elif is_readstream_source(source):
             body = source["stream"]  # type: ignore
+        elif is_path_source(source):
+            body = aiter_file(source["path"])  # type: ignore
+            headers = file_size_headers(source["path"], headers)  # type: ignore
         else:
             self._logger.error("Unknown transcription source type")
             self._logger.debug("ListenRESTClient.transcribe_file LEAVE")
@@ -256,19 +391,24 @@ class AsyncListenRESTClient(AbstractAsyncRestClient):
         self._logger.info("options: %s", options)
         self._logger.info("addons: %s", addons)
         self._logger.info("headers: %s", headers)
-        result = await self.post(
-            url,
-            options=options,
-            addons=addons,
-            headers=headers,
-            content=body,
-            timeout=timeout,
-            **kwargs,
+        res = await self._cached_transcription(
+            "transcribe_file",
+            source,
+            options,
+            addons,
+            endpoint,
+            timeout,
+            lambda: self.post(
+                url,
+                options=options,
+                addons=addons,
+                headers=headers,
+                content=body,
+                timeout=timeout,
+                **kwargs,
+            ),
+            kwargs.get("transport"),
         )
-        self._logger.info("json: %s", result)
-        res = PrerecordedResponse.from_json(result)
-        self._logger.verbose("result: %s", res)
-        self._logger.notice("transcribe_file succeeded")
         self._logger.debug("ListenRESTClient.transcribe_file LEAVE")
         return res
 
@@ -311,6 +451,9 @@ class AsyncListenRESTClient(AbstractAsyncRestClient):
             body = source["buffer"]  # type: ignore
         elif is_readstream_source(source):
             body = source["stream"]  # type: ignore
+        elif is_path_source(source):
+            body = aiter_file(source["path"])  # type: ignore
+            headers = file_size_headers(source["path"], headers)  # type: ignore
         else:
             self._logger.error("Unknown transcription source type")
             self._logger.debug("ListenRESTClient.transcribe_file_callback LEAVE")
@@ -338,10 +481,150 @@ class AsyncListenRESTClient(AbstractAsyncRestClient):
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = AsyncPrerecordedResponse.from_json(result)
+        res = AsyncPrerecordedResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("transcribe_file_callback succeeded")
         self._logger.debug("ListenRESTClient.transcribe_file_callback LEAVE")
         return res
 
+    # pylint: disable=too-many-locals
+    def transcribe_batch(
+        self,
+        sources: Union[
+            Iterable[Union[UrlSource, FileSource]],
+            AsyncIterable[Union[UrlSource, FileSource]],
+        ],
+        options: Optional[Union[Dict, ListenRESTOptions]] = None,
+        addons: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        concurrency: int = 10,
+        endpoint: str = "v1/listen",
+        **kwargs,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Transcribes many URL and file sources concurrently, yielding each result as it completes.
+
+        At most `concurrency` requests are in flight at once, all sharing this client's connection
+        pool. Sources are only pulled from the iterable as requests complete, so a large batch is
+        never held in memory. A source which fails yields a BatchResult carrying the error instead
+        of stopping the batch.
+
+        Args:
+            sources (Iterable): The URL and file sources of the audio to transcribe.
+            options (ListenRESTOptions): Additional options applied to every transcription (default is None).
+            concurrency (int): The maximum number of requests in flight (default is 10).
+            endpoint (str): The API endpoint for the transcription (default is "v1/listen").
+
+        Returns:
+            AsyncIterator[BatchResult]: The results, in completion order.
+
+        Raises:
+            DeepgramError: Raised if concurrency is less than 1.
+        """
+        self._logger.debug("ListenRESTClient.transcribe_batch ENTER")
+
+        if concurrency < 1:
+            self._logger.error("concurrency must be at least 1")
+            self._logger.debug("ListenRESTClient.transcribe_batch LEAVE")
+            raise DeepgramError("concurrency must be at least 1")
+
+        # validated here, the generator below only runs once iteration starts
+        return self._transcribe_batch(
+            sources,
+            options,
+            addons,
+            headers,
+            timeout,
+            concurrency,
+            endpoint,
+            **kwargs,
+        )
+
+    async def _transcribe_batch(
+        self,
+        sources: Union[
+            Iterable[Union[UrlSource, FileSource]],
+            AsyncIterable[Union[UrlSource, FileSource]],
+        ],
+        options: Optional[Union[Dict, ListenRESTOptions]] = None,
+        addons: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        concurrency: int = 10,
+        endpoint: str = "v1/listen",
+        **kwargs,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Runs the batch validated by transcribe_batch().
+        """
+
+        async def transcribe(
+            index: int, source: Union[UrlSource, FileSource]
+        ) -> BatchResult:
+            try:
+                if is_url_source(source):
+                    response = await self.transcribe_url(
+                        source,  # type: ignore
+                        options=options,
+                        addons=addons,
+                        headers=headers,
+                        timeout=timeout,
+                        endpoint=endpoint,
+                        **kwargs,
+                    )
+                else:
+                    response = await self.transcribe_file(
+                        source,  # type: ignore
+                        options=options,
+                        addons=addons,
+                        headers=headers,
+                        timeout=timeout,
+                        endpoint=endpoint,
+                        **kwargs,
+                    )
+                return BatchResult(index=index, source=source, response=response)
+            except Exception as e:  # pylint: disable=broad-except
+                self._logger.error("transcribe_batch source %d failed: %s", index, e)
+                return BatchResult(index=index, source=source, error=e)
+
+        async def iterate():
+            if isinstance(sources, AsyncIterable):
+                async for source in sources:
+                    yield source
+            else:
+                for source in sources:
+                    yield source
+
+        iterator = iterate()
+        pending: set = set()
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        source = await anext(iterator)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.create_task(transcribe(index, source)))
+                    index += 1
+
+                if len(pending) == 0:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # the caller stopped iterating early
+            for task in pending:
+                task.cancel()
+            if len(pending) > 0:
+                await asyncio.gather(*pending, return_exceptions=True)
+            self._logger.debug("ListenRESTClient.transcribe_batch LEAVE")
+
     # pylint: enable=too-many-positional-arguments
@@ -0,0 +1,34 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from .options import FileSource, UrlSource
+from .response import AsyncPrerecordedResponse, PrerecordedResponse
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of transcribing one source of a batch.
+
+    Attributes:
+        index (int): The position of the source in the batch.
+        source (Union[UrlSource, FileSource]): The source which was transcribed.
+        response (Optional[Union[PrerecordedResponse, AsyncPrerecordedResponse]]): The transcription, if it succeeded.
+        error (Optional[Exception]): The exception raised while transcribing the source, if it failed.
+    """
+
+    index: int
+    source: Union[UrlSource, FileSource]
+    response: Optional[Union[PrerecordedResponse, AsyncPrerecordedResponse]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns True if the source was transcribed successfully.
+        """
+        return self.error is None
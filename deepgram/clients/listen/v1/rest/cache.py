@@ -0,0 +1,184 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Union
+
+from ....common import atomic_write, read_entry, remove_file, evict_files
+
+from .helpers import is_buffer_source, is_path_source, is_readstream_source
+from .options import FileSource
+
+# size of the chunks read when hashing a file or a stream
+CHUNK_SIZE = 1024 * 1024
+
+CACHE_SUFFIX = ".json"
+
+
+class ResultCache:
+    """
+    A content-addressed on-disk cache of prerecorded transcription results.
+
+    Results are stored as the raw JSON returned by the API, one file per request, keyed on the
+    sha256 of the audio (or the URL and its ETag), the options and the endpoint. Files are written
+    atomically, so several processes can share the same directory. Each URL request sends a HEAD
+    request for the ETag first, so a file changed in place is transcribed again.
+
+    The directory is only swept, for expired and least recently used results, when the bytes
+    written since the last sweep take it above max_bytes. The size is measured again by each
+    sweep, which also accounts for what other processes wrote meanwhile.
+
+    The cache is enabled per client or for all clients of a config:
+        client.result_cache = ResultCache("/var/cache/deepgram")
+        DeepgramClientOptions(options={"result_cache": "/var/cache/deepgram"})
+
+    Args:
+        directory (str): The directory holding the cached results. It is created if needed.
+        max_bytes (int): The size above which the least recently used results are evicted (default is 1 GiB).
+        ttl (Optional[float]): The number of seconds a result stays valid. None means forever.
+    """
+
+    directory: str
+    max_bytes: int
+    ttl: Optional[float]
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 1024 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # the bytes used by the directory at the last sweep plus those written since, None
+        # until the first write
+        self._bytes: Optional[int] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached JSON for the key, or None if it is missing or expired.
+        """
+        data = read_entry(self._path(key), self.ttl)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return data.decode("utf-8")
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Stores the JSON for the key, then evicts the least recently used results above max_bytes.
+        """
+        data = value.encode("utf-8")
+        atomic_write(self._path(key), data)
+        with self._lock:
+            if self._bytes is not None:
+                self._bytes += len(data)
+                if self._bytes <= self.max_bytes:
+                    return
+        total = evict_files(self.directory, CACHE_SUFFIX, self.max_bytes, self.ttl)
+        with self._lock:
+            self._bytes = total
+
+    def clear(self) -> None:
+        """
+        Removes all cached results.
+        """
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(CACHE_SUFFIX):
+                remove_file(entry.path)
+        with self._lock:
+            self._bytes = 0
+
+    def size(self) -> int:
+        """
+        Returns the number of bytes used by the cached results.
+        """
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(CACHE_SUFFIX)
+        )
+
+
+def resolve_result_cache(value: Union[ResultCache, str, None]) -> Optional[ResultCache]:
+    """
+    Converts the "result_cache" client option, a ResultCache or a directory, into a ResultCache.
+    """
+    if value is None or isinstance(value, ResultCache):
+        return value
+    return ResultCache(str(value))
+
+
+def file_fingerprint(source: FileSource) -> Optional[str]:
+    """
+    Returns the sha256 of the audio of a file source, or None if it cannot be read twice.
+    """
+    digest = hashlib.sha256()
+    if is_buffer_source(source):
+        digest.update(memoryview(source["buffer"]))  # type: ignore
+    elif is_path_source(source):
+        with open(source["path"], "rb") as file:  # type: ignore
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    elif is_readstream_source(source):
+        stream = source["stream"]  # type: ignore
+        if not hasattr(stream, "seek") or not stream.seekable():
+            return None
+        position = stream.tell()
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+        stream.seek(position)
+    else:
+        return None
+    return f"sha256:{digest.hexdigest()}"
+
+
+def url_fingerprint(url: str, headers: Dict[str, str]) -> Optional[str]:
+    """
+    Returns a fingerprint of a hosted file from the headers of a HEAD request, or None if the
+    server does not identify the version of the file.
+    """
+    version = headers.get("etag") or headers.get("last-modified")
+    if version is None:
+        return None
+    return f"url:{url}|{version}"
+
+
+def result_cache_key(
+    base_url: str,
+    endpoint: str,
+    fingerprint: str,
+    options: Optional[Dict[str, Any]] = None,
+    addons: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Returns the cache key for a request from the audio fingerprint, canonicalized options and endpoint.
+    """
+    canonical = json.dumps(
+        {
+            "endpoint": f"{base_url}/{endpoint}",
+            "audio": fingerprint,
+            "options": {k: v for k, v in (options or {}).items() if v is not None},
+            "addons": {k: v for k, v in (addons or {}).items() if v is not None},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
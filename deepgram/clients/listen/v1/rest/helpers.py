@@ -2,8 +2,16 @@
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
 
+import os
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+import aiofiles
+
 from .options import PrerecordedSource
 
+# size of the chunks read from disk when uploading a FilePathSource
+CHUNK_SIZE = 64 * 1024
+
 
 def is_buffer_source(provided_source: PrerecordedSource) -> bool:
     """
@@ -24,3 +32,45 @@ def is_url_source(provided_source: PrerecordedSource) -> bool:
     Check if the provided source is a URL source.
     """
     return "url" in provided_source
+
+
+def is_path_source(provided_source: PrerecordedSource) -> bool:
+    """
+    Check if the provided source is a file path source.
+    """
+    return "path" in provided_source
+
+
+def file_size_headers(path: str, headers: Optional[Dict] = None) -> Dict:
+    """
+    Returns a copy of the headers with Content-Length set to the size of the file.
+
+    Without it, a streamed upload would be sent using chunked transfer encoding.
+    """
+    combined = {} if headers is None else headers.copy()
+    combined["Content-Length"] = str(os.stat(path).st_size)
+    return combined
+
+
+def iter_file(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Reads a file in chunks for streaming it as the body of a request.
+    """
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+async def aiter_file(path: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Reads a file in chunks without blocking the event loop for streaming it as the body of a request.
+    """
+    async with aiofiles.open(path, "rb") as file:
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
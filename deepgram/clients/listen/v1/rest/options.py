@@ -13,6 +13,7 @@ from ....common import (
     TextSource,
     StreamSource,
     BufferSource,
+    FilePathSource,
     FileSource,
     UrlSource,
     BaseResponse,
@@ -10,6 +10,10 @@ from dataclasses_json import config as dataclass_config
 # between analyze and listen
 from ....common import (
     BaseResponse,
+    compact_class,
+    WordsTable,
+    words_table,
+    alternative_words,
     Average,
     Intent,
     Intents,
@@ -31,6 +35,8 @@ from ....common import (
     Search,
 )
 
+from .time_index import TranscriptIndex
+
 # Async Prerecorded Response Types:
 
 
@@ -86,29 +92,12 @@ class Metadata(BaseResponse):  # pylint: disable=too-many-instance-attributes
     )
 
     def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "models" in _dict:
-            _dict["models"] = [str(models) for models in _dict["models"]]
-        if "warnings" in _dict:
-            _dict["warnings"] = [
-                Warning.from_dict(warnings) for warnings in _dict["warnings"]
-            ]
-        if "model_info" in _dict:
-            _dict["model_info"] = [
-                ModelInfo.from_dict(model_info)
-                for _, model_info in _dict["model_info"].items()
-            ]
-        if "summary_info" in _dict:
-            _dict["summary_info"] = SummaryInfo.from_dict(_dict["summary_info"])
-        if "intents_info" in _dict:
-            _dict["intents_info"] = IntentsInfo.from_dict(_dict["intents_info"])
-        if "sentiment_info" in _dict:
-            _dict["sentiment_info"] = SentimentInfo.from_dict(_dict["sentiment_info"])
-        if "topics_info" in _dict:
-            _dict["topics_info"] = TopicsInfo.from_dict(_dict["topics_info"])
-        if "extra" in _dict:
-            _dict["extra"] = [str(extra) for _, extra in _dict["extra"].items()]
-        return _dict[key]
+        _value = super().__getitem__(key)
+        if _value is not None and key == "model_info":
+            return list(_value.values())
+        if _value is not None and key == "extra":
+            return [str(extra) for extra in _value.values()]
+        return _value
 
 
 @dataclass
@@ -167,11 +156,9 @@ class ListenRESTWord(BaseResponse):  # pylint: disable=too-many-instance-attribu
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "sentiment" in _dict:
-            _dict["sentiment"] = Sentiment.from_dict(_dict["sentiment"])
-        return _dict[key]
+
+# ListenRESTWord without an instance __dict__, for the compact_words option
+ListenRESTCompactWord: type = compact_class(ListenRESTWord, "ListenRESTCompactWord")
 
 
 @dataclass
@@ -190,12 +177,6 @@ class Sentence(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "sentiment" in _dict:
-            _dict["sentiment"] = Sentiment.from_dict(_dict["sentiment"])
-        return _dict[key]
-
 
 @dataclass
 class Paragraph(BaseResponse):
@@ -217,16 +198,6 @@ class Paragraph(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "sentences" in _dict:
-            _dict["sentences"] = [
-                Sentence.from_dict(sentences) for sentences in _dict["sentences"]
-            ]
-        if "sentiment" in _dict:
-            _dict["sentiment"] = Sentiment.from_dict(_dict["sentiment"])
-        return _dict[key]
-
 
 @dataclass
 class Paragraphs(BaseResponse):
@@ -239,14 +210,6 @@ class Paragraphs(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "paragraphs" in _dict:
-            _dict["paragraphs"] = [
-                Paragraph.from_dict(paragraphs) for paragraphs in _dict["paragraphs"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class Translation(BaseResponse):
@@ -292,16 +255,6 @@ class Utterance(BaseResponse):  # pylint: disable=too-many-instance-attributes
     )
     id: str = ""
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "words" in _dict:
-            _dict["words"] = [
-                ListenRESTWord.from_dict(words) for words in _dict["words"]
-            ]
-        if "sentiment" in _dict:
-            _dict["sentiment"] = Sentiment.from_dict(_dict["sentiment"])
-        return _dict[key]
-
 
 @dataclass
 class Entity(BaseResponse):
@@ -343,29 +296,6 @@ class ListenRESTAlternative(
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "words" in _dict:
-            _dict["words"] = [
-                ListenRESTWord.from_dict(words) for words in _dict["words"]
-            ]
-        if "summaries" in _dict:
-            _dict["summaries"] = [
-                SummaryV1.from_dict(summaries) for summaries in _dict["summaries"]
-            ]
-        if "paragraphs" in _dict:
-            _dict["paragraphs"] = Paragraphs.from_dict(_dict["paragraphs"])
-        if "entities" in _dict:
-            _dict["entities"] = [
-                Entity.from_dict(entities) for entities in _dict["entities"]
-            ]
-        if "translations" in _dict:
-            _dict["translations"] = [
-                Translation.from_dict(translations)
-                for translations in _dict["translations"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class ListenRESTChannel(BaseResponse):
@@ -384,17 +314,6 @@ class ListenRESTChannel(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "search" in _dict:
-            _dict["search"] = [Search.from_dict(search) for search in _dict["search"]]
-        if "alternatives" in _dict:
-            _dict["alternatives"] = [
-                ListenRESTAlternative.from_dict(alternatives)
-                for alternatives in _dict["alternatives"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class Results(BaseResponse):
@@ -421,26 +340,6 @@ class Results(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "channels" in _dict:
-            _dict["channels"] = [
-                ListenRESTChannel.from_dict(channels) for channels in _dict["channels"]
-            ]
-        if "utterances" in _dict:
-            _dict["utterances"] = [
-                Utterance.from_dict(utterances) for utterances in _dict["utterances"]
-            ]
-        if "summary" in _dict:
-            _dict["summary"] = SummaryV2.from_dict(_dict["summary"])
-        if "sentiments" in _dict:
-            _dict["sentiments"] = Sentiments.from_dict(_dict["sentiments"])
-        if "topics" in _dict:
-            _dict["topics"] = Topics.from_dict(_dict["topics"])
-        if "intents" in _dict:
-            _dict["intents"] = Intents.from_dict(_dict["intents"])
-        return _dict[key]
-
 
 # Prerecorded Response Result:
 
@@ -458,13 +357,24 @@ class PrerecordedResponse(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "metadata" in _dict:
-            _dict["metadata"] = Metadata.from_dict(_dict["metadata"])
-        if "results" in _dict:
-            _dict["results"] = Results.from_dict(_dict["results"])
-        return _dict[key]
+    def words_table(self, channel: int = 0, alternative: int = 0) -> WordsTable:
+        """
+        Returns the words of an alternative of a channel as NumPy columns, see WordsTable.
+
+        The table is built from the undecoded words of a lazy response, without creating the
+        word objects. Requires numpy (pip install deepgram-sdk[numpy]).
+        """
+        if self.results is None or not self.results.channels:
+            return words_table([])
+        _alternative = self.results.channels[channel].alternatives[alternative]
+        return words_table(alternative_words(_alternative))
+
+    def time_index(self, channel: int = 0, alternative: int = 0) -> TranscriptIndex:
+        """
+        Returns an index of the words, utterances and paragraphs of an alternative of a channel
+        by time, see TranscriptIndex.
+        """
+        return TranscriptIndex(self, channel, alternative)
 
 
 SyncPrerecordedResponse = PrerecordedResponse
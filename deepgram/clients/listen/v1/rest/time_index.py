@@ -0,0 +1,140 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Generic, List, Optional, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .response import PrerecordedResponse, ListenRESTWord, Utterance, Paragraph
+
+T = TypeVar("T")
+
+
+# the number of positions scanned directly before a query falls back to the tree
+SCAN_LIMIT = 32
+
+
+class _Intervals(Generic[T]):
+    """
+    Items with a start and an end, sorted by start. The items overlapping a range start before
+    its end, found with a binary search, and end after its start. Those are usually found with a
+    second binary search over the largest end seen so far at each position, then a short scan.
+    When an earlier long item, such as an utterance spanning the whole file, makes that scan
+    long, a segment tree of the largest end of each range of positions only descends into the
+    ranges holding an overlapping item, in O(log n) per item returned.
+    """
+
+    def __init__(self, items: List[T]):
+        self.items = sorted(items, key=lambda item: item.start)  # type: ignore
+        self.starts = [item.start for item in self.items]  # type: ignore
+        self.ends = [item.end for item in self.items]  # type: ignore
+        self.max_ends = []
+        max_end = float("-inf")
+        for end in self.ends:
+            max_end = max(max_end, end)
+            self.max_ends.append(max_end)
+
+        # the leaves of the tree are at size + position, the children of a node at 2 * node
+        # and 2 * node + 1
+        self.size = 1
+        while self.size < len(self.items):
+            self.size *= 2
+        self.tree = [float("-inf")] * (2 * self.size)
+        self.tree[self.size : self.size + len(self.ends)] = self.ends
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def overlapping(self, start: float, end: float) -> List[T]:
+        """
+        Returns the items overlapping [start, end], sorted by start.
+        """
+        lo = bisect_left(self.max_ends, start)
+        hi = bisect_right(self.starts, end)
+        if hi - lo <= SCAN_LIMIT:
+            ends = self.ends
+            # only items nested in a longer earlier one can end before start
+            return [self.items[i] for i in range(lo, hi) if ends[i] >= start]
+
+        found: List[T] = []
+        tree = self.tree
+        size = self.size
+        # the nodes to visit with the positions they cover, left to right
+        stack = [(1, 0, size)]
+        while stack:
+            node, node_lo, node_hi = stack.pop()
+            if node_hi <= lo or node_lo >= hi or tree[node] < start:
+                continue
+            if node >= size:
+                found.append(self.items[node - size])
+                continue
+            mid = (node_lo + node_hi) // 2
+            stack.append((2 * node + 1, mid, node_hi))
+            stack.append((2 * node, node_lo, mid))
+        return found
+
+
+class TranscriptIndex:
+    """
+    Finds the words, utterances and paragraphs of a transcript by time.
+
+    The index is built once from a PrerecordedResponse, for one channel and alternative, and
+    answers each query with binary searches, in O(log n) plus the number of results. Ranges are
+    closed: an item overlaps [start, end] if it starts at or before end and ends at or after
+    start. The index does not follow later changes to the response.
+
+    Example:
+        index = response.time_index()
+        for word in index.words(12.0, 14.5):
+            ...
+        speaker = index.speaker_at(13.2)
+    """
+
+    def __init__(
+        self, response: "PrerecordedResponse", channel: int = 0, alternative: int = 0
+    ):
+        words: List[Any] = []
+        utterances: List[Any] = []
+        paragraphs: List[Any] = []
+        results = response.results
+        if results is not None and results.channels:
+            choice = results.channels[channel].alternatives[alternative]
+            words = choice.words
+            if choice.paragraphs is not None and choice.paragraphs.paragraphs:
+                paragraphs = choice.paragraphs.paragraphs
+        if results is not None and results.utterances:
+            utterances = [u for u in results.utterances if u.channel == channel]
+
+        self._words: _Intervals["ListenRESTWord"] = _Intervals(words)
+        self._utterances: _Intervals["Utterance"] = _Intervals(utterances)
+        self._paragraphs: _Intervals["Paragraph"] = _Intervals(paragraphs)
+
+    def words(self, start: float, end: float) -> List["ListenRESTWord"]:
+        """
+        Returns the words overlapping [start, end], sorted by start.
+        """
+        return self._words.overlapping(start, end)
+
+    def utterances(self, start: float, end: float) -> List["Utterance"]:
+        """
+        Returns the utterances of the channel overlapping [start, end], sorted by start.
+        """
+        return self._utterances.overlapping(start, end)
+
+    def paragraphs(self, start: float, end: float) -> List["Paragraph"]:
+        """
+        Returns the paragraphs overlapping [start, end], sorted by start.
+        """
+        return self._paragraphs.overlapping(start, end)
+
+    def speaker_at(self, time: float) -> Optional[int]:
+        """
+        Returns the speaker at the time: the speaker of the word spoken then, or else of the
+        utterance or paragraph around it. Returns None if nothing with a speaker covers the time,
+        for example when diarization was not requested.
+        """
+        for intervals in (self._words, self._utterances, self._paragraphs):
+            for item in intervals.overlapping(time, time):
+                if item.speaker is not None:
+                    return item.speaker
+        return None
@@ -26,6 +26,7 @@ from .response import (
     #### unique
     Metadata,
     ListenWSWord,
+    ListenWSCompactWord,
     ListenWSAlternative,
     ListenWSChannel,
 )
@@ -2,9 +2,8 @@
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
 import asyncio
-import json
 import logging
-from typing import Dict, Union, Optional, cast, Any, Callable
+from typing import AsyncIterator, Dict, List, Set, Union, Optional, cast, Any, Callable
 from datetime import datetime
 import threading
 
@@ -13,6 +12,7 @@ from .....options import DeepgramClientOptions
 from ...enums import LiveTranscriptionEvents
 from ....common import AbstractAsyncWebSocketClient
 from ....common import DeepgramError
+from ....common import AsyncEventQueue
 
 from .response import (
     OpenResponse,
@@ -25,6 +25,8 @@ from .response import (
     UnhandledResponse,
 )
 from .options import ListenWebSocketOptions
+from .helpers import CONDITIONAL_EVENTS, select_handlers
+from .helpers import event_response, is_interim_response
 
 ONE_SECOND = 1
 HALF_SECOND = 0.5
@@ -49,6 +51,11 @@ class AsyncListenWebSocketClient(
     _endpoint: str
 
     _event_handlers: Dict[LiveTranscriptionEvents, list]
+    _event_conditions: Dict[LiveTranscriptionEvents, list]
+    _conditional_events: Set[LiveTranscriptionEvents]
+    _concurrent_events: Set[LiveTranscriptionEvents]
+    _direct_dispatch: bool
+    _events_queue: Optional[AsyncEventQueue] = None
 
     _keep_alive_thread: Union[asyncio.Task, None]
     _flush_thread: Union[asyncio.Task, None]
@@ -81,6 +88,12 @@ class AsyncListenWebSocketClient(
         self._event_handlers = {
             event: [] for event in LiveTranscriptionEvents.__members__.values()
         }
+        self._event_conditions = {
+            event: [] for event in LiveTranscriptionEvents.__members__.values()
+        }
+        self._conditional_events = set()
+        self._concurrent_events = set()
+        self._direct_dispatch = config.is_direct_dispatch_enabled()
 
         # call the parent constructor
         super().__init__(self._config, self._endpoint)
@@ -184,75 +197,197 @@ class AsyncListenWebSocketClient(
 
     # pylint: enable=too-many-branches,too-many-statements
 
-    def on(self, event: LiveTranscriptionEvents, handler: Callable) -> None:
+    def on(
+        self,
+        event: LiveTranscriptionEvents,
+        handler: Callable,
+        concurrent: Optional[bool] = None,
+        when: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> None:
         """
         Registers event handlers for specific events.
+
+        With the direct_dispatch option, the handlers of an event are awaited one after the other.
+        Passing concurrent=True runs all handlers of the event as concurrent tasks instead, and
+        concurrent=False turns this back off.
+
+        A Transcript, Metadata, SpeechStarted or UtteranceEnd handler can have a when condition,
+        called with the decoded JSON of each message, such as lambda data: data.get("is_final").
+        The handler is only called for the messages for which it returns True, and a message is
+        only built into a response when a handler, an events() iterator or auto flush needs it.
         """
         self._logger.info("event subscribed: %s", event)
+        if when is not None and event not in CONDITIONAL_EVENTS:
+            raise DeepgramError(f"a when condition is not supported for {event}")
         if event in LiveTranscriptionEvents.__members__.values() and callable(handler):
             self._event_handlers[event].append(handler)
+            self._event_conditions[event].append(when)
+            if when is not None:
+                self._conditional_events.add(event)
+            if concurrent is True:
+                self._concurrent_events.add(event)
+            elif concurrent is False:
+                self._concurrent_events.discard(event)
+
+    def events(self, maxsize: int = 100, overflow: str = "block") -> AsyncIterator[Any]:
+        """
+        Returns an async iterator over the responses received, an alternative to on() handlers.
+
+        The receive task puts the responses on a queue of maxsize events. With the block overflow
+        it waits for room, so a slow consumer slows down reading from the connection instead of
+        piling up responses, while drop_interim and drop_oldest drop responses as described in
+        EventQueue. The iterator ends after the CloseResponse. Call events() before start() to
+        also get the OpenResponse; only the last iterator returned gets responses.
+
+        Example:
+            responses = dg_connection.events()
+            await dg_connection.start(options)
+            async for response in responses:
+                if isinstance(response, LiveResultResponse):
+                    ...
+        """
+        events_queue = AsyncEventQueue(
+            maxsize, overflow, is_interim=is_interim_response
+        )
+        self._events_queue = events_queue
+        return self._iterate_events(events_queue)
+
+    async def _iterate_events(
+        self, events_queue: AsyncEventQueue
+    ) -> AsyncIterator[Any]:
+        try:
+            while True:
+                response = await events_queue.get()
+                if response is None:
+                    return
+                yield response
+        finally:
+            # a consumer leaving early must not hold up the receive task
+            await events_queue.close()
+            if self._events_queue is events_queue:
+                self._events_queue = None
 
     # triggers the registered event handlers for a specific event
     async def _emit(self, event: LiveTranscriptionEvents, *args, **kwargs) -> None:
         """
         Emits events to the registered event handlers.
         """
-        self._logger.debug("AsyncListenWebSocketClient._emit ENTER")
-        self._logger.debug("callback handlers for: %s", event)
-
-        # debug the threads
-        for thread in threading.enumerate():
-            self._logger.debug("after running thread: %s", thread.name)
-        self._logger.debug("number of active threads: %s", threading.active_count())
+        await self._emit_to(event, self._event_handlers[event], *args, **kwargs)
 
-        tasks = []
-        for handler in self._event_handlers[event]:
-            task = asyncio.create_task(handler(self, *args, **kwargs))
-            tasks.append(task)
+    async def _emit_to(
+        self, event: LiveTranscriptionEvents, handlers: List[Callable], *args, **kwargs
+    ) -> None:
+        """
+        Emits events to the given event handlers.
+        """
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        if debug:
+            self._logger.debug("AsyncListenWebSocketClient._emit ENTER")
+            self._logger.debug("callback handlers for: %s", event)
+            # debug the threads
+            self._log_threads()
 
-        if tasks:
-            self._logger.debug("waiting for tasks to finish...")
+        events_queue = self._events_queue
+        if events_queue is not None:
+            if event == LiveTranscriptionEvents.Close:
+                # ends the iterator, without waiting for room
+                await events_queue.close(event_response(event, args, kwargs))
+            else:
+                await events_queue.put(event_response(event, args, kwargs))
+
+        if self._direct_dispatch and event not in self._concurrent_events:
+            # awaited in the loop, in the order they were registered
+            for handler in handlers:
+                try:
+                    await handler(self, *args, **kwargs)
+                except Exception as e:  # pylint: disable=broad-except
+                    self._logger.error("handler for %s failed: %s", event, e)
+        elif handlers:
+            tasks = [
+                asyncio.create_task(handler(self, *args, **kwargs))
+                for handler in handlers
+            ]
+            if debug:
+                self._logger.debug("waiting for tasks to finish...")
             await asyncio.gather(*tasks, return_exceptions=True)
-            tasks.clear()
 
-        # debug the threads
-        for thread in threading.enumerate():
-            self._logger.debug("after running thread: %s", thread.name)
-        self._logger.debug("number of active threads: %s", threading.active_count())
+        if debug:
+            # debug the threads
+            self._log_threads()
+            self._logger.debug("AsyncListenWebSocketClient._emit LEAVE")
 
-        self._logger.debug("AsyncListenWebSocketClient._emit LEAVE")
+    def _observers(
+        self, response_type: Any, data: Dict[str, Any]
+    ) -> Optional[List[Callable]]:
+        """
+        Returns the handlers to call for a Transcript, Metadata, SpeechStarted or UtteranceEnd
+        message, those whose when condition holds, or None if nothing observes the message and
+        it need not be built.
+        """
+        if response_type not in CONDITIONAL_EVENTS:
+            return None
+        event = LiveTranscriptionEvents(response_type)
+        handlers = self._event_handlers[event]
+        if event in self._conditional_events:
+            handlers = select_handlers(
+                handlers, self._event_conditions[event], data, self._logger
+            )
+        else:
+            # a copy, the queued dispatch must not see handlers registered later
+            handlers = list(handlers)
+        if handlers or self._events_queue is not None:
+            return handlers
+        return None
 
+    # pylint: disable=too-many-return-statements,too-many-statements,too-many-locals,too-many-branches
     async def _process_text(self, message: str) -> None:
         """
         Processes messages received over the WebSocket connection.
         """
-        self._logger.debug("AsyncListenWebSocketClient._process_text ENTER")
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        verbose = self._logger.isEnabledFor(verboselogs.VERBOSE)
+        notice = self._logger.isEnabledFor(verboselogs.NOTICE)
+
+        if debug:
+            self._logger.debug("AsyncListenWebSocketClient._process_text ENTER")
 
         try:
-            self._logger.debug("Text data received")
+            if debug:
+                self._logger.debug("Text data received")
             if len(message) == 0:
-                self._logger.debug("message is empty")
-                self._logger.debug("AsyncListenWebSocketClient._process_text LEAVE")
+                if debug:
+                    self._logger.debug("message is empty")
+                    self._logger.debug("AsyncListenWebSocketClient._process_text LEAVE")
                 return
 
-            data = json.loads(message)
+            data = self._json.loads(message)
             response_type = data.get("type")
-            self._logger.debug("response_type: %s, data: %s", response_type, data)
+            if debug:
+                self._logger.debug("response_type: %s, data: %s", response_type, data)
+
+            # the messages nobody observes are not built
+            handlers = self._observers(response_type, data)
 
             match response_type:
                 case LiveTranscriptionEvents.Open:
-                    open_result: OpenResponse = OpenResponse.from_json(message)
-                    self._logger.verbose("OpenResponse: %s", open_result)
+                    open_result: OpenResponse = OpenResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("OpenResponse: %s", open_result)
                     await self._emit(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Open),
                         open=open_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.Transcript:
-                    msg_result: LiveResultResponse = LiveResultResponse.from_json(
-                        message
+                case LiveTranscriptionEvents.Transcript if (
+                    handlers is not None or self._config.is_inspecting_listen()
+                ):
+                    msg_result: LiveResultResponse = LiveResultResponse.from_dict(
+                        data,
+                        lazy=self._config.is_lazy_response_enabled(),
+                        compact=self._config.is_compact_words_enabled(),
                     )
-                    self._logger.verbose("LiveResultResponse: %s", msg_result)
+                    if verbose:
+                        self._logger.verbose("LiveResultResponse: %s", msg_result)
 
                     # auto flush
                     if self._config.is_inspecting_listen():
@@ -260,50 +395,67 @@ class AsyncListenWebSocketClient(
                         if not inspect_res:
                             self._logger.error("inspect_res failed")
 
-                    await self._emit(
+                    await self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Transcript),
+                        handlers or [],
                         result=msg_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.Metadata:
-                    meta_result: MetadataResponse = MetadataResponse.from_json(message)
-                    self._logger.verbose("MetadataResponse: %s", meta_result)
-                    await self._emit(
+                case LiveTranscriptionEvents.Metadata if handlers is not None:
+                    meta_result: MetadataResponse = MetadataResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("MetadataResponse: %s", meta_result)
+                    await self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Metadata),
+                        handlers or [],
                         metadata=meta_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.SpeechStarted:
-                    ss_result: SpeechStartedResponse = SpeechStartedResponse.from_json(
-                        message
+                case LiveTranscriptionEvents.SpeechStarted if handlers is not None:
+                    ss_result: SpeechStartedResponse = SpeechStartedResponse.from_dict(
+                        data
                     )
-                    self._logger.verbose("SpeechStartedResponse: %s", ss_result)
-                    await self._emit(
+                    if verbose:
+                        self._logger.verbose("SpeechStartedResponse: %s", ss_result)
+                    await self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.SpeechStarted),
+                        handlers or [],
                         speech_started=ss_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.UtteranceEnd:
-                    ue_result: UtteranceEndResponse = UtteranceEndResponse.from_json(
-                        message
+                case LiveTranscriptionEvents.UtteranceEnd if handlers is not None:
+                    ue_result: UtteranceEndResponse = UtteranceEndResponse.from_dict(
+                        data
                     )
-                    self._logger.verbose("UtteranceEndResponse: %s", ue_result)
-                    await self._emit(
+                    if verbose:
+                        self._logger.verbose("UtteranceEndResponse: %s", ue_result)
+                    await self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.UtteranceEnd),
+                        handlers or [],
                         utterance_end=ue_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
+                case (
+                    LiveTranscriptionEvents.Transcript
+                    | LiveTranscriptionEvents.Metadata
+                    | LiveTranscriptionEvents.SpeechStarted
+                    | LiveTranscriptionEvents.UtteranceEnd
+                ):
+                    if debug:
+                        self._logger.debug("%s is not observed", response_type)
                 case LiveTranscriptionEvents.Close:
-                    close_result: CloseResponse = CloseResponse.from_json(message)
-                    self._logger.verbose("CloseResponse: %s", close_result)
+                    close_result: CloseResponse = CloseResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("CloseResponse: %s", close_result)
                     await self._emit(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Close),
                         close=close_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case LiveTranscriptionEvents.Error:
-                    err_error: ErrorResponse = ErrorResponse.from_json(message)
-                    self._logger.verbose("ErrorResponse: %s", err_error)
+                    err_error: ErrorResponse = ErrorResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("ErrorResponse: %s", err_error)
                     await self._emit(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Error),
                         error=err_error,
@@ -325,8 +477,10 @@ class AsyncListenWebSocketClient(
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
 
-            self._logger.notice("_process_text Succeeded")
-            self._logger.debug("AsyncListenWebSocketClient._process_text LEAVE")
+            if notice:
+                self._logger.notice("_process_text Succeeded")
+            if debug:
+                self._logger.debug("AsyncListenWebSocketClient._process_text LEAVE")
 
         except Exception as e:  # pylint: disable=broad-except
             self._logger.error(
@@ -346,13 +500,14 @@ class AsyncListenWebSocketClient(
             # signal exit and close
             await super()._signal_exit()
 
-            self._logger.debug("AsyncListenWebSocketClient._process_text LEAVE")
+            if debug:
+                self._logger.debug("AsyncListenWebSocketClient._process_text LEAVE")
 
             if self._config.options.get("termination_exception") is True:
                 raise
             return
 
-    # pylint: enable=too-many-return-statements,too-many-statements
+    # pylint: enable=too-many-return-statements,too-many-statements,too-many-locals,too-many-branches
 
     async def _process_binary(self, message: bytes) -> None:
         raise NotImplementedError("no _process_binary method should be called")
@@ -476,7 +631,7 @@ class AsyncListenWebSocketClient(
         self._logger.spam("AsyncListenWebSocketClient.keep_alive ENTER")
 
         self._logger.notice("Sending KeepAlive...")
-        ret = await self.send(json.dumps({"type": "KeepAlive"}))
+        ret = await self.send(self._json.dumps({"type": "KeepAlive"}))
 
         if not ret:
             self._logger.error("keep_alive failed")
@@ -495,7 +650,7 @@ class AsyncListenWebSocketClient(
         self._logger.spam("AsyncListenWebSocketClient.finalize ENTER")
 
         self._logger.notice("Sending Finalize...")
-        ret = await self.send(json.dumps({"type": "Finalize"}))
+        ret = await self.send(self._json.dumps({"type": "Finalize"}))
 
         if not ret:
             self._logger.error("finalize failed")
@@ -508,7 +663,7 @@ class AsyncListenWebSocketClient(
         return True
 
     async def _close_message(self) -> bool:
-        return await self.send(json.dumps({"type": "CloseStream"}))
+        return await self.send(self._json.dumps({"type": "CloseStream"}))
 
     async def finish(self) -> bool:
         """
@@ -545,6 +700,9 @@ class AsyncListenWebSocketClient(
             await asyncio.wait_for(asyncio.gather(*tasks), timeout=10)
             self._logger.notice("threads joined")
 
+            if self._events_queue is not None:
+                await self._events_queue.close()
+
             # debug the threads
             for thread in threading.enumerate():
                 self._logger.debug("after running thread: %s", thread.name)
@@ -1,10 +1,9 @@
 # Copyright 2023-2024 Deepgram SDK contributors. All Rights Reserved.
 # Use of this source code is governed by a MIT license that can be found in the LICENSE file.
 # SPDX-License-Identifier: MIT
-import json
 import time
 import logging
-from typing import Dict, Union, Optional, cast, Any, Callable
+from typing import Dict, Iterator, List, Set, Union, Optional, cast, Any, Callable
 from datetime import datetime
 import threading
 
@@ -13,6 +12,7 @@ from .....options import DeepgramClientOptions
 from ...enums import LiveTranscriptionEvents
 from ....common import AbstractSyncWebSocketClient
 from ....common import DeepgramError
+from ....common import EventQueue, EventQueueStats
 
 from .response import (
     OpenResponse,
@@ -25,6 +25,8 @@ from .response import (
     UnhandledResponse,
 )
 from .options import ListenWebSocketOptions
+from .helpers import CONDITIONAL_EVENTS, select_handlers
+from .helpers import event_response, is_interim_event, is_interim_response
 
 ONE_SECOND = 1
 HALF_SECOND = 0.5
@@ -50,9 +52,14 @@ class ListenWebSocketClient(
 
     _lock_flush: threading.Lock
     _event_handlers: Dict[LiveTranscriptionEvents, list]
+    _event_conditions: Dict[LiveTranscriptionEvents, list]
+    _conditional_events: Set[LiveTranscriptionEvents]
 
     _keep_alive_thread: Union[threading.Thread, None]
     _flush_thread: Union[threading.Thread, None]
+    _handler_thread: Union[threading.Thread, None]
+    _handler_queue: Optional[EventQueue] = None
+    _events_queue: Optional[EventQueue] = None
     _last_datagram: Optional[datetime] = None
 
     _kwargs: Optional[Dict] = None
@@ -73,6 +80,7 @@ class ListenWebSocketClient(
 
         self._flush_thread = None
         self._keep_alive_thread = None
+        self._handler_thread = None
 
         # auto flush
         self._last_datagram = None
@@ -82,6 +90,10 @@ class ListenWebSocketClient(
         self._event_handlers = {
             event: [] for event in LiveTranscriptionEvents.__members__.values()
         }
+        self._event_conditions = {
+            event: [] for event in LiveTranscriptionEvents.__members__.values()
+        }
+        self._conditional_events = set()
 
         # call the parent constructor
         super().__init__(self._config, self._endpoint)
@@ -131,6 +143,22 @@ class ListenWebSocketClient(
         else:
             self._options = {}
 
+        # handler thread, started first to deliver the open event
+        handler_queue = self._config.get_handler_queue()
+        if handler_queue["maxsize"]:
+            self._logger.notice("handler queue is enabled")
+            self._handler_queue = EventQueue(
+                handler_queue["maxsize"],
+                handler_queue["overflow"],
+                is_interim=is_interim_event,
+            )
+            self._handler_thread = threading.Thread(
+                target=self._dispatching, args=(self._handler_queue,)
+            )
+            self._handler_thread.start()
+        else:
+            self._logger.notice("handler queue is disabled")
+
         try:
             # call parent start
             if (
@@ -142,6 +170,7 @@ class ListenWebSocketClient(
                 )
                 is False
             ):
+                self._stop_dispatching()
                 self._logger.error("ListenWebSocketClient.start failed")
                 self._logger.debug("ListenWebSocketClient.start LEAVE")
                 return False
@@ -180,6 +209,7 @@ class ListenWebSocketClient(
             self._logger.error(
                 "WebSocketException in ListenWebSocketClient.start: %s", e
             )
+            self._stop_dispatching()
             self._logger.debug("ListenWebSocketClient.start LEAVE")
             if self._config.options.get("termination_exception_connect") is True:
                 raise e
@@ -188,69 +218,179 @@ class ListenWebSocketClient(
     # pylint: enable=too-many-statements,too-many-branches
 
     def on(
-        self, event: LiveTranscriptionEvents, handler: Callable
+        self,
+        event: LiveTranscriptionEvents,
+        handler: Callable,
+        when: Optional[Callable[[Dict[str, Any]], bool]] = None,
     ) -> None:  # registers event handlers for specific events
         """
         Registers event handlers for specific events.
+
+        A Transcript, Metadata, SpeechStarted or UtteranceEnd handler can have a when condition,
+        called with the decoded JSON of each message, such as lambda data: data.get("is_final").
+        The handler is only called for the messages for which it returns True, and a message is
+        only built into a response when a handler, an events() iterator or auto flush needs it.
         """
         self._logger.info("event subscribed: %s", event)
+        if when is not None and event not in CONDITIONAL_EVENTS:
+            raise DeepgramError(f"a when condition is not supported for {event}")
         if event in LiveTranscriptionEvents.__members__.values() and callable(handler):
             self._event_handlers[event].append(handler)
+            self._event_conditions[event].append(when)
+            if when is not None:
+                self._conditional_events.add(event)
+
+    def events(self, maxsize: int = 100, overflow: str = "block") -> Iterator[Any]:
+        """
+        Returns an iterator over the responses received, an alternative to on() handlers.
+
+        The receive thread puts the responses on a queue of maxsize events. With the block
+        overflow it waits for room, so a slow consumer slows down reading from the connection
+        instead of piling up responses, while drop_interim and drop_oldest drop responses as
+        described in EventQueue. The iterator ends after the CloseResponse. Call events() before
+        start() to also get the OpenResponse; only the last iterator returned gets responses.
+
+        Example:
+            responses = dg_connection.events()
+            dg_connection.start(options)
+            for response in responses:
+                if isinstance(response, LiveResultResponse):
+                    ...
+        """
+        events_queue = EventQueue(maxsize, overflow, is_interim=is_interim_response)
+        self._events_queue = events_queue
+        return self._iterate_events(events_queue)
+
+    def _iterate_events(self, events_queue: EventQueue) -> Iterator[Any]:
+        try:
+            while True:
+                response = events_queue.get()
+                if response is None:
+                    return
+                yield response
+        finally:
+            # a consumer leaving early must not hold up the receive thread
+            events_queue.close()
+            if self._events_queue is events_queue:
+                self._events_queue = None
 
     def _emit(self, event: LiveTranscriptionEvents, *args, **kwargs) -> None:
         """
         Emits events to the registered event handlers.
         """
-        self._logger.debug("ListenWebSocketClient._emit ENTER")
-        self._logger.debug("callback handlers for: %s", event)
+        self._emit_to(event, self._event_handlers[event], *args, **kwargs)
 
-        # debug the threads
-        for thread in threading.enumerate():
-            self._logger.debug("after running thread: %s", thread.name)
-        self._logger.debug("number of active threads: %s", threading.active_count())
+    def _emit_to(
+        self, event: LiveTranscriptionEvents, handlers: List[Callable], *args, **kwargs
+    ) -> None:
+        """
+        Emits events to the given event handlers.
+        """
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        if debug:
+            self._logger.debug("ListenWebSocketClient._emit ENTER")
+            self._logger.debug("callback handlers for: %s", event)
+            # debug the threads
+            self._log_threads()
 
-        self._logger.debug("callback handlers for: %s", event)
-        for handler in self._event_handlers[event]:
-            handler(self, *args, **kwargs)
+        events_queue = self._events_queue
+        if events_queue is not None:
+            if event == LiveTranscriptionEvents.Close:
+                # ends the iterator, without waiting for room
+                events_queue.close(event_response(event, args, kwargs))
+            else:
+                events_queue.put(event_response(event, args, kwargs))
+
+        handler_queue = self._handler_queue
+        if (
+            handler_queue is not None
+            and threading.current_thread() is not self._handler_thread
+        ):
+            # delivered in order by the handler thread, nothing is once it has been stopped
+            if (
+                not handler_queue.put((event, args, kwargs, handlers))
+                and handler_queue.closed
+            ):
+                self._logger.debug("handler queue closed, %s not delivered", event)
+        else:
+            for handler in handlers:
+                handler(self, *args, **kwargs)
 
-        # debug the threads
-        for thread in threading.enumerate():
-            self._logger.debug("after running thread: %s", thread.name)
-        self._logger.debug("number of active threads: %s", threading.active_count())
+        if debug:
+            # debug the threads
+            self._log_threads()
+            self._logger.debug("ListenWebSocketClient._emit LEAVE")
 
-        self._logger.debug("ListenWebSocketClient._emit LEAVE")
+    def _observers(
+        self, response_type: Any, data: Dict[str, Any]
+    ) -> Optional[List[Callable]]:
+        """
+        Returns the handlers to call for a Transcript, Metadata, SpeechStarted or UtteranceEnd
+        message, those whose when condition holds, or None if nothing observes the message and
+        it need not be built.
+        """
+        if response_type not in CONDITIONAL_EVENTS:
+            return None
+        event = LiveTranscriptionEvents(response_type)
+        handlers = self._event_handlers[event]
+        if event in self._conditional_events:
+            handlers = select_handlers(
+                handlers, self._event_conditions[event], data, self._logger
+            )
+        else:
+            # a copy, the queued dispatch must not see handlers registered later
+            handlers = list(handlers)
+        if handlers or self._events_queue is not None:
+            return handlers
+        return None
 
     # pylint: disable=too-many-return-statements,too-many-statements,too-many-locals,too-many-branches
     def _process_text(self, message: str) -> None:
         """
         Processes messages received over the WebSocket connection.
         """
-        self._logger.debug("ListenWebSocketClient._process_text ENTER")
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        verbose = self._logger.isEnabledFor(verboselogs.VERBOSE)
+        notice = self._logger.isEnabledFor(verboselogs.NOTICE)
+
+        if debug:
+            self._logger.debug("ListenWebSocketClient._process_text ENTER")
 
         try:
             if len(message) == 0:
-                self._logger.debug("message is empty")
-                self._logger.debug("ListenWebSocketClient._process_text LEAVE")
+                if debug:
+                    self._logger.debug("message is empty")
+                    self._logger.debug("ListenWebSocketClient._process_text LEAVE")
                 return
 
-            data = json.loads(message)
+            data = self._json.loads(message)
             response_type = data.get("type")
-            self._logger.debug("response_type: %s, data: %s", response_type, data)
+            if debug:
+                self._logger.debug("response_type: %s, data: %s", response_type, data)
+
+            # the messages nobody observes are not built
+            handlers = self._observers(response_type, data)
 
             match response_type:
                 case LiveTranscriptionEvents.Open:
-                    open_result: OpenResponse = OpenResponse.from_json(message)
-                    self._logger.verbose("OpenResponse: %s", open_result)
+                    open_result: OpenResponse = OpenResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("OpenResponse: %s", open_result)
                     self._emit(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Open),
                         open=open_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.Transcript:
-                    msg_result: LiveResultResponse = LiveResultResponse.from_json(
-                        message
+                case LiveTranscriptionEvents.Transcript if (
+                    handlers is not None or self._config.is_inspecting_listen()
+                ):
+                    msg_result: LiveResultResponse = LiveResultResponse.from_dict(
+                        data,
+                        lazy=self._config.is_lazy_response_enabled(),
+                        compact=self._config.is_compact_words_enabled(),
                     )
-                    self._logger.verbose("LiveResultResponse: %s", msg_result)
+                    if verbose:
+                        self._logger.verbose("LiveResultResponse: %s", msg_result)
 
                     #  auto flush
                     if self._config.is_inspecting_listen():
@@ -258,50 +398,67 @@ class ListenWebSocketClient(
                         if not inspect_res:
                             self._logger.error("inspect_res failed")
 
-                    self._emit(
+                    self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Transcript),
+                        handlers or [],
                         result=msg_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.Metadata:
-                    meta_result: MetadataResponse = MetadataResponse.from_json(message)
-                    self._logger.verbose("MetadataResponse: %s", meta_result)
-                    self._emit(
+                case LiveTranscriptionEvents.Metadata if handlers is not None:
+                    meta_result: MetadataResponse = MetadataResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("MetadataResponse: %s", meta_result)
+                    self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Metadata),
+                        handlers or [],
                         metadata=meta_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.SpeechStarted:
-                    ss_result: SpeechStartedResponse = SpeechStartedResponse.from_json(
-                        message
+                case LiveTranscriptionEvents.SpeechStarted if handlers is not None:
+                    ss_result: SpeechStartedResponse = SpeechStartedResponse.from_dict(
+                        data
                     )
-                    self._logger.verbose("SpeechStartedResponse: %s", ss_result)
-                    self._emit(
+                    if verbose:
+                        self._logger.verbose("SpeechStartedResponse: %s", ss_result)
+                    self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.SpeechStarted),
+                        handlers or [],
                         speech_started=ss_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
-                case LiveTranscriptionEvents.UtteranceEnd:
-                    ue_result: UtteranceEndResponse = UtteranceEndResponse.from_json(
-                        message
+                case LiveTranscriptionEvents.UtteranceEnd if handlers is not None:
+                    ue_result: UtteranceEndResponse = UtteranceEndResponse.from_dict(
+                        data
                     )
-                    self._logger.verbose("UtteranceEndResponse: %s", ue_result)
-                    self._emit(
+                    if verbose:
+                        self._logger.verbose("UtteranceEndResponse: %s", ue_result)
+                    self._emit_to(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.UtteranceEnd),
+                        handlers or [],
                         utterance_end=ue_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
+                case (
+                    LiveTranscriptionEvents.Transcript
+                    | LiveTranscriptionEvents.Metadata
+                    | LiveTranscriptionEvents.SpeechStarted
+                    | LiveTranscriptionEvents.UtteranceEnd
+                ):
+                    if debug:
+                        self._logger.debug("%s is not observed", response_type)
                 case LiveTranscriptionEvents.Close:
-                    close_result: CloseResponse = CloseResponse.from_json(message)
-                    self._logger.verbose("CloseResponse: %s", close_result)
+                    close_result: CloseResponse = CloseResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("CloseResponse: %s", close_result)
                     self._emit(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Close),
                         close=close_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case LiveTranscriptionEvents.Error:
-                    err_error: ErrorResponse = ErrorResponse.from_json(message)
-                    self._logger.verbose("ErrorResponse: %s", err_error)
+                    err_error: ErrorResponse = ErrorResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("ErrorResponse: %s", err_error)
                     self._emit(
                         LiveTranscriptionEvents(LiveTranscriptionEvents.Error),
                         error=err_error,
@@ -323,8 +480,10 @@ class ListenWebSocketClient(
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
 
-            self._logger.notice("_process_text Succeeded")
-            self._logger.debug("SpeakStreamClient._process_text LEAVE")
+            if notice:
+                self._logger.notice("_process_text Succeeded")
+            if debug:
+                self._logger.debug("SpeakStreamClient._process_text LEAVE")
 
         except Exception as e:  # pylint: disable=broad-except
             self._logger.error(
@@ -347,7 +506,8 @@ class ListenWebSocketClient(
             # signal exit and close
             super()._signal_exit()
 
-            self._logger.debug("ListenWebSocketClient._process_text LEAVE")
+            if debug:
+                self._logger.debug("ListenWebSocketClient._process_text LEAVE")
 
             if self._config.options.get("termination_exception") is True:
                 raise
@@ -404,6 +564,61 @@ class ListenWebSocketClient(
                     raise
                 return
 
+    def _dispatching(self, handler_queue: EventQueue) -> None:
+        """
+        Runs the handlers of the queued events, until the queue is closed and empty.
+        """
+        self._logger.debug("ListenWebSocketClient._dispatching ENTER")
+
+        while True:
+            item = handler_queue.get()
+            if item is None:
+                self._logger.notice("_dispatching exiting gracefully")
+                self._logger.debug("ListenWebSocketClient._dispatching LEAVE")
+                return
+
+            event, args, kwargs, handlers = item
+            for handler in handlers:
+                try:
+                    handler(self, *args, **kwargs)
+                except Exception as e:  # pylint: disable=broad-except
+                    self._logger.error(
+                        "Exception in ListenWebSocketClient handler for %s: %s",
+                        event,
+                        e,
+                    )
+
+    def _stop_dispatching(self) -> None:
+        """
+        Closes the handler queue and waits for the handler thread to run the waiting events.
+        """
+        if self._handler_queue is not None:
+            self._handler_queue.close()
+        if self._handler_thread is not None:
+            if self._handler_thread is not threading.current_thread():
+                self._handler_thread.join()
+            self._handler_thread = None
+            self._logger.notice("processing _handler_thread thread joined")
+
+    def _signal_exit(self) -> None:
+        if (
+            self._handler_queue is not None
+            and threading.current_thread() is self._handler_thread
+        ):
+            # a handler is finishing, so nothing makes room in a full queue: wake up the listening
+            # thread waiting for some, or closing the socket and joining it would wait forever.
+            # The events already queued are still delivered once the handler returns
+            self._handler_queue.close()
+        super()._signal_exit()
+
+    def handler_queue_stats(self) -> Optional[EventQueueStats]:
+        """
+        Returns the depth metrics of the handler queue, None if the handler_queue_size option is not set.
+        """
+        if self._handler_queue is None:
+            return None
+        return self._handler_queue.stats()
+
     ## pylint: disable=too-many-return-statements,too-many-statements
     def _flush(self) -> None:
         self._logger.debug("ListenWebSocketClient._flush ENTER")
@@ -475,7 +690,7 @@ class ListenWebSocketClient(
         self._logger.spam("ListenWebSocketClient.keep_alive ENTER")
 
         self._logger.notice("Sending KeepAlive...")
-        ret = self.send(json.dumps({"type": "KeepAlive"}))
+        ret = self.send(self._json.dumps({"type": "KeepAlive"}))
 
         if not ret:
             self._logger.error("keep_alive failed")
@@ -494,7 +709,7 @@ class ListenWebSocketClient(
         self._logger.spam("ListenWebSocketClient.finalize ENTER")
 
         self._logger.notice("Sending Finalize...")
-        ret = self.send(json.dumps({"type": "Finalize"}))
+        ret = self.send(self._json.dumps({"type": "Finalize"}))
 
         if not ret:
             self._logger.error("finalize failed")
@@ -507,7 +722,7 @@ class ListenWebSocketClient(
         return True
 
     def _close_message(self) -> bool:
-        return self.send(json.dumps({"type": "CloseStream"}))
+        return self.send(self._json.dumps({"type": "CloseStream"}))
 
     # closes the WebSocket connection gracefully
     def finish(self) -> bool:
@@ -542,6 +757,11 @@ class ListenWebSocketClient(
             self._listen_thread = None
         self._logger.notice("listening thread joined")
 
+        # after the last events have been queued
+        self._stop_dispatching()
+        if self._events_queue is not None:
+            self._events_queue.close()
+
         # debug the threads
         for thread in threading.enumerate():
             self._logger.debug("before running thread: %s", thread.name)
@@ -0,0 +1,79 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...enums import LiveTranscriptionEvents
+from .response import LiveResultResponse
+
+# the keyword argument holding the response of each event passed to the handlers
+EVENT_ARGUMENTS = {
+    LiveTranscriptionEvents.Open: "open",
+    LiveTranscriptionEvents.Close: "close",
+    LiveTranscriptionEvents.Transcript: "result",
+    LiveTranscriptionEvents.Metadata: "metadata",
+    LiveTranscriptionEvents.SpeechStarted: "speech_started",
+    LiveTranscriptionEvents.UtteranceEnd: "utterance_end",
+    LiveTranscriptionEvents.Error: "error",
+    LiveTranscriptionEvents.Unhandled: "unhandled",
+}
+
+
+def event_response(event: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    """
+    Returns the response of an emitted event, passed either first or by keyword.
+    """
+    if args:
+        return args[0]
+    return kwargs.get(EVENT_ARGUMENTS[LiveTranscriptionEvents(event)])
+
+
+def is_interim_response(response: Any) -> bool:
+    """
+    Check if the response is an interim transcription result.
+    """
+    return isinstance(response, LiveResultResponse) and not response.is_final
+
+
+def is_interim_event(item: Tuple[Any, ...]) -> bool:
+    """
+    Check if the (event, args, kwargs, handlers) of an emitted event is an interim transcription
+    result.
+    """
+    return is_interim_response(event_response(*item[:3]))
+
+
+# the events whose handlers can have a when condition, their messages are only decoded when
+# something observes them
+CONDITIONAL_EVENTS = {
+    LiveTranscriptionEvents.Transcript,
+    LiveTranscriptionEvents.Metadata,
+    LiveTranscriptionEvents.SpeechStarted,
+    LiveTranscriptionEvents.UtteranceEnd,
+}
+
+
+def select_handlers(
+    handlers: List[Callable],
+    conditions: List[Optional[Callable[[Dict[str, Any]], bool]]],
+    data: Dict[str, Any],
+    logger: logging.Logger,
+) -> List[Callable]:
+    """
+    Returns the handlers without a condition or whose condition holds for the decoded JSON.
+
+    A condition which raises is logged and does not hold, so that it cannot end the connection.
+    """
+    selected = []
+    for handler, when in zip(handlers, conditions):
+        if when is not None:
+            try:
+                if not when(data):
+                    continue
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("when condition of %s failed: %s", handler, e)
+                continue
+        selected.append(handler)
+    return selected
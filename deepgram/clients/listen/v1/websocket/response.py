@@ -10,6 +10,10 @@ from dataclasses_json import config as dataclass_config
 # common websocket response
 from ....common import (
     BaseResponse,
+    compact_class,
+    WordsTable,
+    words_table,
+    alternative_words,
     OpenResponse,
     CloseResponse,
     ErrorResponse,
@@ -48,6 +52,10 @@ class ListenWSWord(BaseResponse):
     )
 
 
+# ListenWSWord without an instance __dict__, for the compact_words option
+ListenWSCompactWord: type = compact_class(ListenWSWord, "ListenWSCompactWord")
+
+
 @dataclass
 class ListenWSAlternative(BaseResponse):
     """
@@ -61,12 +69,6 @@ class ListenWSAlternative(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "words" in _dict:
-            _dict["words"] = [ListenWSWord.from_dict(words) for words in _dict["words"]]
-        return _dict[key]
-
 
 @dataclass
 class ListenWSChannel(BaseResponse):
@@ -79,17 +81,6 @@ class ListenWSChannel(BaseResponse):
     )
     alternatives: List[ListenWSAlternative] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "search" in _dict:
-            _dict["search"] = [Search.from_dict(search) for search in _dict["search"]]
-        if "alternatives" in _dict:
-            _dict["alternatives"] = [
-                ListenWSAlternative.from_dict(alternatives)
-                for alternatives in _dict["alternatives"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class Metadata(BaseResponse):
@@ -105,14 +96,10 @@ class Metadata(BaseResponse):
     )
 
     def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "model_info" in _dict:
-            _dict["model_info"] = [
-                ModelInfo.from_dict(model_info) for model_info in _dict["model_info"]
-            ]
-        if "extra" in _dict:
-            _dict["extra"] = [str(extra) for _, extra in _dict["extra"].items()]
-        return _dict[key]
+        _value = super().__getitem__(key)
+        if _value is not None and key == "extra":
+            return [str(extra) for extra in _value.values()]
+        return _value
 
 
 # live result messages
@@ -136,17 +123,15 @@ class LiveResultResponse(BaseResponse):  # pylint: disable=too-many-instance-att
     )
     speech_final: bool = False
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "channel" in _dict:
-            _dict["channel"] = [
-                ListenWSChannel.from_dict(channel) for channel in _dict["channel"]
-            ]
-        if "metadata" in _dict:
-            _dict["metadata"] = [
-                Metadata.from_dict(metadata) for metadata in _dict["metadata"]
-            ]
-        return _dict[key]
+    def words_table(self, alternative: int = 0) -> WordsTable:
+        """
+        Returns the words of an alternative as NumPy columns, see WordsTable.
+
+        The table is built from the undecoded words of a lazy response, without creating the
+        word objects. Requires numpy (pip install deepgram-sdk[numpy]).
+        """
+        _alternative = self.channel.alternatives[alternative]
+        return words_table(alternative_words(_alternative))
 
 
 # Metadata Message
@@ -176,17 +161,12 @@ class MetadataResponse(BaseResponse):  # pylint: disable=too-many-instance-attri
     )
 
     def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "models" in _dict:
-            _dict["models"] = [str(models) for models in _dict["models"]]
-        if "model_info" in _dict:
-            _dict["model_info"] = [
-                ModelInfo.from_dict(model_info)
-                for _, model_info in _dict["model_info"].items()
-            ]
-        if "extra" in _dict:
-            _dict["extra"] = [str(extra) for _, extra in _dict["extra"].items()]
-        return _dict[key]
+        _value = super().__getitem__(key)
+        if _value is not None and key == "model_info":
+            return list(_value.values())
+        if _value is not None and key == "extra":
+            return [str(extra) for extra in _value.values()]
+        return _value
 
 
 # Speech Started Message
@@ -111,7 +111,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = ProjectsResponse.from_json(result)
+        res = ProjectsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_projects succeeded")
         self._logger.debug("ManageClient.get_projects LEAVE")
@@ -141,7 +141,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Project.from_json(result)
+        res = Project.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_project succeeded")
         self._logger.debug("ManageClient.get_project LEAVE")
@@ -176,7 +176,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("update_project_option succeeded")
         self._logger.debug("ManageClient.update_project_option LEAVE")
@@ -211,7 +211,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("update_project succeeded")
         self._logger.debug("ManageClient.update_project LEAVE")
@@ -239,7 +239,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("delete_project succeeded")
         self._logger.debug("ManageClient.delete_project LEAVE")
@@ -310,7 +310,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ModelsResponse.from_json(result)
+        res = ModelsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_project_models succeeded")
         self._logger.debug("ManageClient.get_project_models LEAVE")
@@ -354,7 +354,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ModelResponse.from_json(result)
+        res = ModelResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_project_model succeeded")
         self._logger.debug("ManageClient.get_project_model LEAVE")
@@ -416,7 +416,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = ModelsResponse.from_json(result)
+        res = ModelsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_models succeeded")
         self._logger.debug("ManageClient.get_models LEAVE")
@@ -456,7 +456,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = ModelResponse.from_json(result)
+        res = ModelResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_model succeeded")
         self._logger.debug("ManageClient.get_model LEAVE")
@@ -502,7 +502,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = KeysResponse.from_json(result)
+        res = KeysResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_keys succeeded")
         self._logger.debug("ManageClient.get_keys LEAVE")
@@ -534,7 +534,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = KeyResponse.from_json(result)
+        res = KeyResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_key succeeded")
         self._logger.debug("ManageClient.get_key LEAVE")
@@ -569,7 +569,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Key.from_json(result)
+        res = Key.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("create_key succeeded")
         self._logger.debug("ManageClient.create_key LEAVE")
@@ -601,7 +601,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("delete_key succeeded")
         self._logger.debug("ManageClient.delete_key LEAVE")
@@ -647,7 +647,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = MembersResponse.from_json(result)
+        res = MembersResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_members succeeded")
         self._logger.debug("ManageClient.get_members LEAVE")
@@ -679,7 +679,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("remove_member succeeded")
         self._logger.debug("ManageClient.remove_member LEAVE")
@@ -712,7 +712,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = ScopesResponse.from_json(result)
+        res = ScopesResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_member_scopes succeeded")
         self._logger.debug("ManageClient.get_member_scopes LEAVE")
@@ -748,7 +748,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("update_member_scope succeeded")
         self._logger.debug("ManageClient.update_member_scope LEAVE")
@@ -794,7 +794,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = InvitesResponse.from_json(result)
+        res = InvitesResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_invites succeeded")
         self._logger.debug("ManageClient.get_invites LEAVE")
@@ -829,7 +829,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("send_invite_options succeeded")
         self._logger.debug("ManageClient.send_invite_options LEAVE")
@@ -866,7 +866,7 @@ class AsyncManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("send_invite succeeded")
         self._logger.debug("ManageClient.send_invite LEAVE")
@@ -898,7 +898,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("delete_invite succeeded")
         self._logger.debug("ManageClient.delete_invite LEAVE")
@@ -928,7 +928,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("leave_project succeeded")
         self._logger.debug("ManageClient.leave_project LEAVE")
@@ -969,7 +969,7 @@ class AsyncManageClient(
             **kwargs,
         )
         self._logger.info("result: %s", result)
-        res = UsageRequestsResponse.from_json(result)
+        res = UsageRequestsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_requests succeeded")
         self._logger.debug("ManageClient.get_usage_requests LEAVE")
@@ -1003,13 +1003,13 @@ class AsyncManageClient(
         self._logger.info("result: %s", result)
 
         # convert str to JSON to check response field
-        json_result = json.loads(result)
+        json_result = self._json.loads(result)
         if json_result.get("response") is None:
             raise DeepgramError(
                 "Response is not available yet. Please try again later."
             )
 
-        res = UsageRequest.from_json(result)
+        res = UsageRequest.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_request succeeded")
         self._logger.debug("ManageClient.get_usage_request LEAVE")
@@ -1049,7 +1049,7 @@ class AsyncManageClient(
             **kwargs,
         )
         self._logger.info("result: %s", result)
-        res = UsageSummaryResponse.from_json(result)
+        res = UsageSummaryResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_summary succeeded")
         self._logger.debug("ManageClient.get_usage_summary LEAVE")
@@ -1089,7 +1089,7 @@ class AsyncManageClient(
             **kwargs,
         )
         self._logger.info("result: %s", result)
-        res = UsageFieldsResponse.from_json(result)
+        res = UsageFieldsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_fields succeeded")
         self._logger.debug("ManageClient.get_usage_fields LEAVE")
@@ -1135,7 +1135,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = BalancesResponse.from_json(result)
+        res = BalancesResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_balances succeeded")
         self._logger.debug("ManageClient.get_balances LEAVE")
@@ -1167,7 +1167,7 @@ class AsyncManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("result: %s", result)
-        res = Balance.from_json(result)
+        res = Balance.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_balance succeeded")
         self._logger.debug("ManageClient.get_balance LEAVE")
@@ -112,7 +112,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ProjectsResponse.from_json(result)
+        res = ProjectsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_projects succeeded")
         self._logger.debug("ManageClient.get_projects LEAVE")
@@ -142,7 +142,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Project.from_json(result)
+        res = Project.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_project succeeded")
         self._logger.debug("ManageClient.get_project LEAVE")
@@ -177,7 +177,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("update_project_option succeeded")
         self._logger.debug("ManageClient.update_project_option LEAVE")
@@ -212,7 +212,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("update_project succeeded")
         self._logger.debug("ManageClient.update_project LEAVE")
@@ -240,7 +240,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("delete_project succeeded")
         self._logger.debug("ManageClient.delete_project LEAVE")
@@ -312,7 +312,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ModelsResponse.from_json(result)
+        res = ModelsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_project_models succeeded")
         self._logger.debug("ManageClient.get_project_models LEAVE")
@@ -356,7 +356,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ModelResponse.from_json(result)
+        res = ModelResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_project_model succeeded")
         self._logger.debug("ManageClient.get_project_model LEAVE")
@@ -419,7 +419,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ModelsResponse.from_json(result)
+        res = ModelsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_models succeeded")
         self._logger.debug("ManageClient.get_models LEAVE")
@@ -459,7 +459,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ModelResponse.from_json(result)
+        res = ModelResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_model succeeded")
         self._logger.debug("ManageClient.get_model LEAVE")
@@ -505,7 +505,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = KeysResponse.from_json(result)
+        res = KeysResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_keys succeeded")
         self._logger.debug("ManageClient.get_keys LEAVE")
@@ -537,7 +537,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = KeyResponse.from_json(result)
+        res = KeyResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_key succeeded")
         self._logger.debug("ManageClient.get_key LEAVE")
@@ -572,7 +572,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Key.from_json(result)
+        res = Key.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("create_key succeeded")
         self._logger.debug("ManageClient.create_key LEAVE")
@@ -604,7 +604,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("delete_key succeeded")
         self._logger.debug("ManageClient.delete_key LEAVE")
@@ -650,7 +650,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = MembersResponse.from_json(result)
+        res = MembersResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_members succeeded")
         self._logger.debug("ManageClient.get_members LEAVE")
@@ -682,7 +682,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("remove_member succeeded")
         self._logger.debug("ManageClient.remove_member LEAVE")
@@ -715,7 +715,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = ScopesResponse.from_json(result)
+        res = ScopesResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_member_scopes succeeded")
         self._logger.debug("ManageClient.get_member_scopes LEAVE")
@@ -751,7 +751,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("update_member_scope succeeded")
         self._logger.debug("ManageClient.update_member_scope LEAVE")
@@ -797,7 +797,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = InvitesResponse.from_json(result)
+        res = InvitesResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_invites succeeded")
         self._logger.debug("ManageClient.get_invites LEAVE")
@@ -832,7 +832,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("send_invite_options succeeded")
         self._logger.debug("ManageClient.send_invite_options LEAVE")
@@ -869,7 +869,7 @@ class ManageClient(
             url, json=options, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("send_invite succeeded")
         self._logger.debug("ManageClient.send_invite LEAVE")
@@ -901,7 +901,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("delete_invite succeeded")
         self._logger.debug("ManageClient.delete_invite LEAVE")
@@ -931,7 +931,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Message.from_json(result)
+        res = Message.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("leave_project succeeded")
         self._logger.debug("ManageClient.leave_project LEAVE")
@@ -972,7 +972,7 @@ class ManageClient(
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = UsageRequestsResponse.from_json(result)
+        res = UsageRequestsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_requests succeeded")
         self._logger.debug("ManageClient.get_usage_requests LEAVE")
@@ -1006,13 +1006,13 @@ class ManageClient(
         self._logger.info("json: %s", result)
 
         # convert str to JSON to check response field
-        json_result = json.loads(result)
+        json_result = self._json.loads(result)
         if json_result.get("response") is None:
             raise DeepgramError(
                 "Response is not available yet. Please try again later."
             )
 
-        res = UsageRequest.from_json(result)
+        res = UsageRequest.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_request succeeded")
         self._logger.debug("ManageClient.get_usage_request LEAVE")
@@ -1052,7 +1052,7 @@ class ManageClient(
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = UsageSummaryResponse.from_json(result)
+        res = UsageSummaryResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_summary succeeded")
         self._logger.debug("ManageClient.get_usage_summary LEAVE")
@@ -1092,7 +1092,7 @@ class ManageClient(
             **kwargs,
         )
         self._logger.info("json: %s", result)
-        res = UsageFieldsResponse.from_json(result)
+        res = UsageFieldsResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_usage_fields succeeded")
         self._logger.debug("ManageClient.get_usage_fields LEAVE")
@@ -1138,7 +1138,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = BalancesResponse.from_json(result)
+        res = BalancesResponse.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_balances succeeded")
         self._logger.debug("ManageClient.get_balances LEAVE")
@@ -1170,7 +1170,7 @@ class ManageClient(
             url, timeout=timeout, addons=addons, headers=headers, **kwargs
         )
         self._logger.info("json: %s", result)
-        res = Balance.from_json(result)
+        res = Balance.from_json(result, codec=self._json)
         self._logger.verbose("result: %s", res)
         self._logger.notice("get_balance succeeded")
         self._logger.debug("ManageClient.get_balance LEAVE")
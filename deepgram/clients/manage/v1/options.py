@@ -48,14 +48,6 @@ class KeyOptions(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if _dict["scopes"] is not None:
-            _dict["scopes"] = [str(scopes) for scopes in _dict["scopes"]]
-        if _dict["tags"] is not None:
-            _dict["tags"] = [str(tags) for tags in _dict["tags"]]
-        return _dict[key]
-
 
 @dataclass
 class ScopeOptions(BaseResponse):
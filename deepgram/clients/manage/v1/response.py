@@ -45,14 +45,6 @@ class ProjectsResponse(BaseResponse):
 
     projects: List[Project] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "projects" in _dict:
-            _dict["projects"] = [
-                Project.from_dict(projects) for projects in _dict["projects"]
-            ]
-        return _dict[key]
-
 
 # Models
 
@@ -73,12 +65,6 @@ class STTDetails(BaseResponse):  # pylint: disable=too-many-instance-attributes
     streaming: bool = False
     formatted_output: bool = False
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "languages" in _dict:
-            _dict["languages"] = [str(languages) for languages in _dict["languages"]]
-        return _dict[key]
-
 
 @dataclass
 class TTSMetadata(BaseResponse):
@@ -111,14 +97,6 @@ class TTSDetails(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "metadata" in _dict:
-            _dict["metadata"] = [
-                TTSMetadata.from_dict(metadata) for metadata in _dict["metadata"]
-            ]
-        return _dict[key]
-
 
 # responses
 
@@ -139,14 +117,6 @@ class ModelResponse(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "metadata" in _dict:
-            _dict["metadata"] = [
-                TTSMetadata.from_dict(metadata) for metadata in _dict["metadata"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class ModelsResponse(BaseResponse):
@@ -157,14 +127,6 @@ class ModelsResponse(BaseResponse):
     stt: List[STTDetails] = field(default_factory=list)
     tts: List[TTSDetails] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "stt" in _dict:
-            _dict["stt"] = [STTDetails.from_dict(stt) for stt in _dict["stt"]]
-        if "tts" in _dict:
-            _dict["tts"] = [TTSDetails.from_dict(tts) for tts in _dict["tts"]]
-        return _dict[key]
-
 
 # Members
 
@@ -189,14 +151,6 @@ class MembersResponse(BaseResponse):
 
     members: List[Member] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "members" in _dict:
-            _dict["members"] = [
-                Member.from_dict(members) for members in _dict["members"]
-            ]
-        return _dict[key]
-
 
 # Keys
 
@@ -218,12 +172,6 @@ class Key(BaseResponse):
         default="", metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "scopes" in _dict:
-            _dict["scopes"] = [str(scopes) for scopes in _dict["scopes"]]
-        return _dict[key]
-
 
 @dataclass
 class KeyResponse(BaseResponse):
@@ -234,14 +182,6 @@ class KeyResponse(BaseResponse):
     api_key: Key
     member: Member
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "api_key" in _dict:
-            _dict["api_key"] = Key.from_dict(_dict["api_key"])
-        if "member" in _dict:
-            _dict["member"] = Member.from_dict(_dict["member"])
-        return _dict[key]
-
 
 @dataclass
 class KeysResponse(BaseResponse):
@@ -251,14 +191,6 @@ class KeysResponse(BaseResponse):
 
     api_keys: List[KeyResponse] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "api_keys" in _dict:
-            _dict["api_keys"] = [
-                KeyResponse.from_dict(api_keys) for api_keys in _dict["api_keys"]
-            ]
-        return _dict[key]
-
 
 # Scopes
 
@@ -271,12 +203,6 @@ class ScopesResponse(BaseResponse):
 
     scopes: List[str] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "scopes" in _dict:
-            _dict["scopes"] = [str(scopes) for scopes in _dict["scopes"]]
-        return _dict[key]
-
 
 # Invites
 
@@ -299,14 +225,6 @@ class InvitesResponse(BaseResponse):
 
     invites: List[Invite] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "invites" in _dict:
-            _dict["invites"] = [
-                Invite.from_dict(invites) for invites in _dict["invites"]
-            ]
-        return _dict[key]
-
 
 # Usage
 
@@ -376,18 +294,6 @@ class STTUsageDetails(BaseResponse):  # pylint: disable=too-many-instance-attrib
     )
     features: List[str] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "models" in _dict:
-            _dict["models"] = [str(models) for models in _dict["models"]]
-        if "tags" in _dict:
-            _dict["tags"] = [str(tags) for tags in _dict["tags"]]
-        if "features" in _dict:
-            _dict["features"] = [str(features) for features in _dict["features"]]
-        if "config" in _dict:
-            _dict["config"] = Config.from_dict(_dict["config"])
-        return _dict[key]
-
 
 @dataclass
 class Callback(BaseResponse):
@@ -435,15 +341,6 @@ class TTSUsageDetails(BaseResponse):
     # TODO: audio_metadata: None
     # pylint: enable=fixme
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "speech_segments" in _dict:
-            _dict["speech_segments"] = [
-                SpeechSegment.from_dict(speech_segments)
-                for speech_segments in _dict["speech_segments"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class UsageResponse(BaseResponse):
@@ -466,19 +363,6 @@ class UsageResponse(BaseResponse):
         default_factory=list, metadata=dataclass_config(exclude=lambda f: f is list)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "details" in _dict:
-            _dict["details"] = STTUsageDetails.from_dict(_dict["details"])
-        if "tts_details" in _dict:
-            _dict["tts_details"] = TTSUsageDetails.from_dict(_dict["tts_details"])
-        if "token_details" in _dict:
-            _dict["token_details"] = [
-                TokenDetail.from_dict(token_details)
-                for token_details in _dict["token_details"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class UsageRequest(BaseResponse):  # pylint: disable=too-many-instance-attributes
@@ -499,14 +383,6 @@ class UsageRequest(BaseResponse):  # pylint: disable=too-many-instance-attribute
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "response" in _dict:
-            _dict["response"] = UsageResponse.from_dict(_dict["response"])
-        if "callback" in _dict:
-            _dict["callback"] = Callback.from_dict(_dict["callback"])
-        return _dict[key]
-
 
 @dataclass
 class UsageRequestsResponse(BaseResponse):
@@ -518,14 +394,6 @@ class UsageRequestsResponse(BaseResponse):
     limit: int = 0
     requests: List[UsageRequest] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "requests" in _dict:
-            _dict["requests"] = [
-                UsageRequest.from_dict(requests) for requests in _dict["requests"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class STTTokens(BaseResponse):
@@ -561,14 +429,6 @@ class UsageSummaryResults(BaseResponse):
     total_hours: int = 0
     requests: int = 0
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "tokens" in _dict:
-            _dict["tokens"] = STTTokens.from_dict(_dict["tokens"])
-        if "tts" in _dict:
-            _dict["tts"] = TTSTokens.from_dict(_dict["tts"])
-        return _dict[key]
-
 
 @dataclass
 class Resolution(BaseResponse):
@@ -591,16 +451,6 @@ class UsageSummaryResponse(BaseResponse):
     end: str = ""
     results: List[UsageSummaryResults] = field(default_factory=list)
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "resolution" in _dict:
-            _dict["resolution"] = Resolution.from_dict(_dict["resolution"])
-        if "results" in _dict:
-            _dict["results"] = [
-                UsageSummaryResults.from_dict(results) for results in _dict["results"]
-            ]
-        return _dict[key]
-
 
 @dataclass
 class UsageModel(BaseResponse):
@@ -630,25 +480,6 @@ class UsageFieldsResponse(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "tags" in _dict:
-            _dict["tags"] = [str(tags) for tags in _dict["tags"]]
-        if "models" in _dict:
-            _dict["models"] = [
-                UsageModel.from_dict(models) for models in _dict["models"]
-            ]
-        if "processing_methods" in _dict:
-            _dict["processing_methods"] = [
-                str(processing_methods)
-                for processing_methods in _dict["processing_methods"]
-            ]
-        if "features" in _dict:
-            _dict["features"] = [str(features) for features in _dict["features"]]
-        if "languages" in _dict:
-            _dict["languages"] = [str(languages) for languages in _dict["languages"]]
-        return _dict[key]
-
 
 # Billing
 
@@ -672,11 +503,3 @@ class BalancesResponse(BaseResponse):
     """
 
     balances: List[Balance] = field(default_factory=list)
-
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        if "balances" in _dict:
-            _dict["balances"] = [
-                Balance.from_dict(balances) for balances in _dict["balances"]
-            ]
-        return _dict[key]
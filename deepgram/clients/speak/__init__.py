@@ -27,6 +27,7 @@ from .client import (
 from .client import (
     SpeakResponse,  # backward compat
     SpeakRESTResponse,
+    SpeakCache,
 )
 
 # websocket
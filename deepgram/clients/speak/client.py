@@ -25,6 +25,7 @@ from .v1 import (
 
 from .v1 import (
     SpeakRESTResponse as SpeakRESTResponseLatest,
+    SpeakCache as SpeakCacheLatest,
 )
 
 # websocket
@@ -66,6 +67,7 @@ SpeakRESTSource = SpeakRESTSourceLatest  # pylint: disable=invalid-name
 
 # output
 SpeakRESTResponse = SpeakRESTResponseLatest
+SpeakCache = SpeakCacheLatest
 
 # websocket
 # input
@@ -23,6 +23,7 @@ from .rest import (
 )
 from .rest import SpeakRESTClient, AsyncSpeakRESTClient
 from .rest import SpeakRESTResponse
+from .rest import SpeakCache
 
 # websocket
 from .websocket import (
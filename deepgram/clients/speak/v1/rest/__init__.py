@@ -5,6 +5,7 @@
 from .client import SpeakRESTClient
 from .async_client import AsyncSpeakRESTClient
 from .response import SpeakRESTResponse
+from .cache import SpeakCache
 from .options import (
     #### top level
     SpeakRESTOptions,
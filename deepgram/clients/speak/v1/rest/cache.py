@@ -0,0 +1,184 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+from ....common import atomic_write, read_entry, remove_file, evict_files
+
+CACHE_SUFFIX = ".speak"
+
+
+class SpeakCache:  # pylint: disable=too-many-instance-attributes
+    """
+    A cache of synthesized audio for repeated text-to-speech requests, such as IVR prompts.
+
+    Entries hold the audio and the response headers, keyed on the text, the options (model,
+    encoding, sample_rate, container, bit_rate, ...) and the endpoint. They are kept in memory
+    and, if a directory is given, on disk so they survive restarts and are shared between
+    processes. Both are bounded in bytes and evict the least recently used entries first.
+
+    The cache is enabled per client or for all clients of a config:
+        client.speak_cache = SpeakCache(max_bytes=32 * 1024 * 1024)
+        DeepgramClientOptions(options={"speak_cache": True})
+
+    Args:
+        max_bytes (int): The size of the in-memory cache (default is 64 MiB).
+        directory (Optional[str]): The directory of the on-disk cache. None keeps entries in memory only.
+        max_disk_bytes (int): The size of the on-disk cache (default is 1 GiB).
+    """
+
+    max_bytes: int
+    directory: Optional[str]
+    max_disk_bytes: int
+    hits: int
+    misses: int
+
+    _entries: "OrderedDict[str, Tuple[bytes, Dict[str, str]]]"
+    _bytes: int
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of bytes of audio held in memory.
+        """
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """
+        Returns the audio and response headers for the key, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def set(self, key: str, audio: bytes, headers: Dict[str, str]) -> None:
+        """
+        Stores the audio and response headers for the key.
+        """
+        entry = (audio, headers)
+        with self._lock:
+            self._remember(key, entry)
+        if self.directory is not None:
+            data = json.dumps(headers).encode("utf-8") + b"\n" + audio
+            atomic_write(self._path(key), data)
+            evict_files(self.directory, CACHE_SUFFIX, self.max_disk_bytes)
+
+    def clear(self) -> None:
+        """
+        Removes all entries from memory. Files on disk are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(str(self.directory), key + CACHE_SUFFIX)
+
+    def _read(self, key: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        data = read_entry(path)
+        if data is None:
+            return None
+        headers, separator, audio = data.partition(b"\n")
+        try:
+            if not separator:
+                raise ValueError("missing header separator")
+            decoded = json.loads(headers)
+            if not isinstance(decoded, dict):
+                raise ValueError("headers are not an object")
+        except ValueError:
+            # a truncated or corrupt file is dropped so the request goes to the network
+            remove_file(path)
+            return None
+        return audio, decoded
+
+    def _remember(self, key: str, entry: Tuple[bytes, Dict[str, str]]) -> None:
+        # must be called holding the lock
+        size = len(entry[0])
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous[0])
+        self._entries[key] = entry
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (audio, _) = self._entries.popitem(last=False)
+            self._bytes -= len(audio)
+
+
+def resolve_speak_cache(value: Union[SpeakCache, bool, None]) -> Optional[SpeakCache]:
+    """
+    Converts the "speak_cache" client option, a SpeakCache or True for the defaults, into a SpeakCache.
+    """
+    if value is None or value is False:
+        return None
+    if isinstance(value, SpeakCache):
+        return value
+    if value is True or (isinstance(value, str) and value.lower() == "true"):
+        return SpeakCache()
+    return None
+
+
+def speak_cache_key(
+    base_url: str,
+    endpoint: str,
+    text: str,
+    options: Optional[Dict[str, Any]] = None,
+    addons: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Returns the cache key for a request from the text, canonicalized options and endpoint.
+    """
+    canonical = json.dumps(
+        {
+            "endpoint": f"{base_url}/{endpoint}",
+            "text": text,
+            "options": {k: v for k, v in (options or {}).items() if v is not None},
+            "addons": {k: v for k, v in (addons or {}).items() if v is not None},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
-from typing import Dict, Union, Optional, cast
+from typing import Dict, List, Union, Optional, cast
 import io
 
 import httpx
@@ -19,17 +19,23 @@ from .helpers import is_text_source
 
 from .options import SpeakRESTOptions, FileSource
 from .response import SpeakRESTResponse
+from .cache import SpeakCache, resolve_speak_cache, speak_cache_key
 
 
 class SpeakRESTClient(AbstractSyncRestClient):
     """
     A client class for doing Text-to-Speech.
     Provides methods for speaking from text.
+
+    Synthesized audio can be cached by setting speak_cache, or the "speak_cache" option of the config,
+    to a SpeakCache. Repeated requests for the same text and options are then answered from the cache.
     """
 
     _logger: verboselogs.VerboseLogger
     _config: DeepgramClientOptions
 
+    speak_cache: Optional[SpeakCache] = None
+
     def __init__(self, config: DeepgramClientOptions):
         self._logger = verboselogs.VerboseLogger(__name__)
         self._logger.addHandler(logging.StreamHandler())
@@ -37,6 +43,51 @@ class SpeakRESTClient(AbstractSyncRestClient):
         self._config = config
         super().__init__(config)
 
+    def _get_speak_cache(self) -> Optional[SpeakCache]:
+        """
+        Returns the SpeakCache in effect for this client, if any.
+        """
+        if self.speak_cache is None:
+            self.speak_cache = resolve_speak_cache(
+                self._config.options.get("speak_cache")
+            )
+            if self.speak_cache is not None:
+                # share the cache with the other clients created from this config
+                self._config.options["speak_cache"] = self.speak_cache
+        return self.speak_cache
+
+    def _load_speak(
+        self, cache: SpeakCache, cache_key: str
+    ) -> Optional[Dict[str, Union[str, io.BytesIO]]]:
+        """
+        Returns the cached result of stream_memory() for the key, if any.
+        """
+        cached = cache.get(cache_key)
+        if cached is None:
+            return None
+        audio, cached_headers = cached
+        self._logger.notice("speak served from the cache")
+        result: Dict[str, Union[str, io.BytesIO]] = dict(cached_headers)
+        result["stream"] = io.BytesIO(audio)
+        return result
+
+    def _store_speak(
+        self,
+        cache: SpeakCache,
+        cache_key: str,
+        result: Dict[str, Union[str, io.BytesIO]],
+        return_vals: List[str],
+    ) -> None:
+        """
+        Stores the result of stream_memory() in the cache, logging a failure to write it.
+        """
+        audio = cast(io.BytesIO, result["stream"]).getvalue()
+        cached_headers = {key: str(result[key]) for key in return_vals}
+        try:
+            cache.set(cache_key, audio, cached_headers)
+        except OSError as e:
+            self._logger.warning("failed to store the audio in the cache: %s", e)
+
     # pylint: disable=too-many-positional-arguments
 
     def stream_raw(
@@ -104,7 +155,7 @@ class SpeakRESTClient(AbstractSyncRestClient):
             **kwargs,
         )
 
-        self._logger.info("result: %s", str(result))
+        self._logger.info("result: %s", result)
         self._logger.notice("speak succeeded")
         self._logger.debug("SpeakClient.stream LEAVE")
         return result
@@ -169,16 +220,28 @@ class SpeakRESTClient(AbstractSyncRestClient):
             "transfer-encoding",
             "date",
         ]
-        result = self.post_memory(
-            url,
-            options=options,
-            addons=addons,
-            headers=headers,
-            json=body,
-            timeout=timeout,
-            file_result=return_vals,
-            **kwargs,
-        )
+        cache = self._get_speak_cache()
+        cache_key = None
+        result = None
+        if cache is not None:
+            cache_key = speak_cache_key(
+                self._config.url, endpoint, body["text"], options, addons  # type: ignore
+            )
+            result = self._load_speak(cache, cache_key)
+
+        if result is None:
+            result = self.post_memory(
+                url,
+                options=options,
+                addons=addons,
+                headers=headers,
+                json=body,
+                timeout=timeout,
+                file_result=return_vals,
+                **kwargs,
+            )
+            if cache is not None and cache_key is not None:
+                self._store_speak(cache, cache_key, result, return_vals)
 
         self._logger.info("result: %s", result)
         resp = SpeakRESTResponse(
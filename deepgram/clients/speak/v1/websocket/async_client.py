@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: MIT
 
 import asyncio
-import json
 import logging
 from typing import Dict, Union, Optional, cast, Any, Callable
 from datetime import datetime
@@ -249,13 +248,12 @@ class AsyncSpeakWSClient(
         """
         Emits events to the registered event handlers.
         """
-        self._logger.debug("AsyncSpeakWebSocketClient._emit ENTER")
-        self._logger.debug("callback handlers for: %s", event)
-
-        # debug the threads
-        for thread in threading.enumerate():
-            self._logger.debug("after running thread: %s", thread.name)
-        self._logger.debug("number of active threads: %s", threading.active_count())
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        if debug:
+            self._logger.debug("AsyncSpeakWebSocketClient._emit ENTER")
+            self._logger.debug("callback handlers for: %s", event)
+            # debug the threads
+            self._log_threads()
 
         tasks = []
         for handler in self._event_handlers[event]:
@@ -263,63 +261,75 @@ class AsyncSpeakWSClient(
             tasks.append(task)
 
         if tasks:
-            self._logger.debug("waiting for tasks to finish...")
+            if debug:
+                self._logger.debug("waiting for tasks to finish...")
             await asyncio.gather(*filter(None, tasks), return_exceptions=True)
             tasks.clear()
 
-        # debug the threads
-        for thread in threading.enumerate():
-            self._logger.debug("after running thread: %s", thread.name)
-        self._logger.debug("number of active threads: %s", threading.active_count())
-
-        self._logger.debug("AsyncSpeakWebSocketClient._emit LEAVE")
+        if debug:
+            # debug the threads
+            self._log_threads()
+            self._logger.debug("AsyncSpeakWebSocketClient._emit LEAVE")
 
+    # pylint: disable=too-many-return-statements,too-many-statements,too-many-locals,too-many-branches
     async def _process_text(self, message: Union[str, bytes]) -> None:
         """
         Processes messages received over the WebSocket connection.
         """
-        self._logger.debug("AsyncSpeakWebSocketClient._process_text ENTER")
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        verbose = self._logger.isEnabledFor(verboselogs.VERBOSE)
+        notice = self._logger.isEnabledFor(verboselogs.NOTICE)
+
+        if debug:
+            self._logger.debug("AsyncSpeakWebSocketClient._process_text ENTER")
 
         try:
-            self._logger.debug("Text data received")
+            if debug:
+                self._logger.debug("Text data received")
 
             if len(message) == 0:
-                self._logger.debug("message is empty")
-                self._logger.debug("AsyncSpeakWebSocketClient._process_text LEAVE")
+                if debug:
+                    self._logger.debug("message is empty")
+                    self._logger.debug("AsyncSpeakWebSocketClient._process_text LEAVE")
                 return
 
-            data = json.loads(message)
+            data = self._json.loads(message)
             response_type = data.get("type")
-            self._logger.debug("response_type: %s, data: %s", response_type, data)
+            if debug:
+                self._logger.debug("response_type: %s, data: %s", response_type, data)
 
             match response_type:
                 case SpeakWebSocketEvents.Open:
-                    open_result: OpenResponse = OpenResponse.from_json(message)
-                    self._logger.verbose("OpenResponse: %s", open_result)
+                    open_result: OpenResponse = OpenResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("OpenResponse: %s", open_result)
                     await self._emit(
                         SpeakWebSocketEvents(SpeakWebSocketEvents.Open),
                         open=open_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case SpeakWebSocketEvents.Metadata:
-                    meta_result: MetadataResponse = MetadataResponse.from_json(message)
-                    self._logger.verbose("MetadataResponse: %s", meta_result)
+                    meta_result: MetadataResponse = MetadataResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("MetadataResponse: %s", meta_result)
                     await self._emit(
                         SpeakWebSocketEvents(SpeakWebSocketEvents.Metadata),
                         metadata=meta_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case SpeakWebSocketEvents.Flushed:
-                    fl_result: FlushedResponse = FlushedResponse.from_json(message)
-                    self._logger.verbose("FlushedResponse: %s", fl_result)
+                    fl_result: FlushedResponse = FlushedResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("FlushedResponse: %s", fl_result)
 
                     # auto flush
                     if self._config.is_inspecting_speak():
                         self._flush_count -= 1
-                        self._logger.debug(
-                            "Decrement AutoFlush count: %d",
-                            self._flush_count,
-                        )
+                        if debug:
+                            self._logger.debug(
+                                "Decrement AutoFlush count: %d",
+                                self._flush_count,
+                            )
 
                     await self._emit(
                         SpeakWebSocketEvents(SpeakWebSocketEvents.Flushed),
@@ -327,32 +337,36 @@ class AsyncSpeakWSClient(
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case SpeakWebSocketEvents.Cleared:
-                    clear_result: ClearedResponse = ClearedResponse.from_json(message)
-                    self._logger.verbose("ClearedResponse: %s", meta_result)
+                    clear_result: ClearedResponse = ClearedResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("ClearedResponse: %s", meta_result)
                     await self._emit(
                         SpeakWebSocketEvents(SpeakWebSocketEvents.Cleared),
                         cleared=clear_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case SpeakWebSocketEvents.Close:
-                    close_result: CloseResponse = CloseResponse.from_json(message)
-                    self._logger.verbose("CloseResponse: %s", close_result)
+                    close_result: CloseResponse = CloseResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("CloseResponse: %s", close_result)
                     await self._emit(
                         SpeakWebSocketEvents(SpeakWebSocketEvents.Close),
                         close=close_result,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case SpeakWebSocketEvents.Warning:
-                    war_warning: WarningResponse = WarningResponse.from_json(message)
-                    self._logger.verbose("WarningResponse: %s", war_warning)
+                    war_warning: WarningResponse = WarningResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("WarningResponse: %s", war_warning)
                     await self._emit(
                         SpeakWebSocketEvents(SpeakWebSocketEvents.Warning),
                         warning=war_warning,
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
                 case SpeakWebSocketEvents.Error:
-                    err_error: ErrorResponse = ErrorResponse.from_json(message)
-                    self._logger.verbose("ErrorResponse: %s", err_error)
+                    err_error: ErrorResponse = ErrorResponse.from_dict(data)
+                    if verbose:
+                        self._logger.verbose("ErrorResponse: %s", err_error)
                     await self._emit(
                         SpeakWebSocketEvents(SpeakWebSocketEvents.Error),
                         error=err_error,
@@ -374,8 +388,10 @@ class AsyncSpeakWSClient(
                         **dict(cast(Dict[Any, Any], self._kwargs)),
                     )
 
-            self._logger.notice("_process_text Succeeded")
-            self._logger.debug("AsyncSpeakWebSocketClient._process_text LEAVE")
+            if notice:
+                self._logger.notice("_process_text Succeeded")
+            if debug:
+                self._logger.debug("AsyncSpeakWebSocketClient._process_text LEAVE")
 
         except Exception as e:  # pylint: disable=broad-except
             self._logger.error(
@@ -395,17 +411,22 @@ class AsyncSpeakWSClient(
             # signal exit and close
             await super()._signal_exit()
 
-            self._logger.debug("AsyncSpeakWebSocketClient._process_text LEAVE")
+            if debug:
+                self._logger.debug("AsyncSpeakWebSocketClient._process_text LEAVE")
 
             if self._config.options.get("termination_exception") is True:
                 raise
             return
 
-    # pylint: enable=too-many-return-statements,too-many-statements
+    # pylint: enable=too-many-return-statements,too-many-statements,too-many-locals,too-many-branches
 
     async def _process_binary(self, message: bytes) -> None:
-        self._logger.debug("SpeakWebSocketClient._process_binary ENTER")
-        self._logger.debug("Binary data received")
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+        notice = self._logger.isEnabledFor(verboselogs.NOTICE)
+
+        if debug:
+            self._logger.debug("SpeakWebSocketClient._process_binary ENTER")
+            self._logger.debug("Binary data received")
 
         await self._emit(
             SpeakWebSocketEvents(SpeakWebSocketEvents.AudioData),
@@ -413,8 +434,10 @@ class AsyncSpeakWSClient(
             **dict(cast(Dict[Any, Any], self._kwargs)),
         )
 
-        self._logger.notice("_process_binary Succeeded")
-        self._logger.debug("SpeakWebSocketClient._process_binary LEAVE")
+        if notice:
+            self._logger.notice("_process_binary Succeeded")
+        if debug:
+            self._logger.debug("SpeakWebSocketClient._process_binary LEAVE")
 
     ## pylint: disable=too-many-return-statements
     async def _flush(self) -> None:
@@ -489,7 +512,9 @@ class AsyncSpeakWSClient(
         Returns:
             bool: True if the text was successfully sent, False otherwise.
         """
-        return await self.send_raw(json.dumps({"type": "Speak", "text": text_input}))
+        return await self.send_raw(
+            self._json.dumps({"type": "Speak", "text": text_input})
+        )
 
     async def send(self, data: Union[bytes, str]) -> bool:
         """
@@ -515,7 +540,7 @@ class AsyncSpeakWSClient(
         Returns:
             bool: True if the control message was successfully sent, False otherwise.
         """
-        control_msg = json.dumps({"type": msg_type})
+        control_msg = self._json.dumps({"type": msg_type})
         return await self.send_raw(control_msg)
 
     # pylint: enable=unused-argument
@@ -531,15 +556,19 @@ class AsyncSpeakWSClient(
         Returns:
             bool: True if the message was successfully sent, False otherwise.
         """
-        self._logger.spam("AsyncSpeakWebSocketClient.send_raw ENTER")
+        debug = self._logger.isEnabledFor(verboselogs.DEBUG)
+
+        if debug:
+            self._logger.spam("AsyncSpeakWebSocketClient.send_raw ENTER")
 
         if self._config.is_inspecting_speak():
             try:
-                _tmp_json = json.loads(msg)
+                _tmp_json = self._json.loads(msg)
                 if "type" in _tmp_json:
-                    self._logger.debug(
-                        "Inspecting Message: Sending %s", _tmp_json["type"]
-                    )
+                    if debug:
+                        self._logger.debug(
+                            "Inspecting Message: Sending %s", _tmp_json["type"]
+                        )
                     match _tmp_json["type"]:
                         case SpeakWebSocketMessage.Speak:
                             inspect_res = await self._inspect()
@@ -548,23 +577,27 @@ class AsyncSpeakWSClient(
                         case SpeakWebSocketMessage.Flush:
                             self._last_datagram = None
                             self._flush_count += 1
-                            self._logger.debug(
-                                "Increment Flush count: %d", self._flush_count
-                            )
+                            if debug:
+                                self._logger.debug(
+                                    "Increment Flush count: %d", self._flush_count
+                                )
             except Exception as e:  # pylint: disable=broad-except
                 self._logger.error("send_raw() failed - Exception: %s", str(e))
 
         try:
             if await super().send(msg) is False:
                 self._logger.error("send_raw() failed")
-                self._logger.spam("AsyncSpeakWebSocketClient.send_raw LEAVE")
+                if debug:
+                    self._logger.spam("AsyncSpeakWebSocketClient.send_raw LEAVE")
                 return False
-            self._logger.spam("send_raw() succeeded")
-            self._logger.spam("AsyncSpeakWebSocketClient.send_raw LEAVE")
+            if debug:
+                self._logger.spam("send_raw() succeeded")
+                self._logger.spam("AsyncSpeakWebSocketClient.send_raw LEAVE")
             return True
         except Exception as e:  # pylint: disable=broad-except
             self._logger.error("send_raw() failed - Exception: %s", str(e))
-            self._logger.spam("AsyncSpeakWebSocketClient.send_raw LEAVE")
+            if debug:
+                self._logger.spam("AsyncSpeakWebSocketClient.send_raw LEAVE")
             if self._config.options.get("termination_exception_send") is True:
                 raise
             return False
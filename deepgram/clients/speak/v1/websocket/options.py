@@ -39,10 +39,6 @@ class SpeakWSOptions(BaseResponse):
         default=None, metadata=dataclass_config(exclude=lambda f: f is None)
     )
 
-    def __getitem__(self, key):
-        _dict = self.to_dict()
-        return _dict[key]
-
     def __setitem__(self, key, val):
         self.__dict__[key] = val
 
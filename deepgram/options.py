@@ -5,7 +5,7 @@
 import sys
 import re
 import os
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import logging
 import numbers
 
@@ -26,12 +26,19 @@ class DeepgramClientOptions:  # pylint: disable=too-many-instance-attributes
         verbose: (Optional) The logging level for the client. Defaults to `verboselogs.WARNING`.
         headers: (Optional) Headers for initializing the client.
         options: (Optional) Additional options for initializing the client.
+        http_pool: (Optional) The HTTP connection pool shared by the sync REST clients. Set by DeepgramClient.
+        async_http_pool: (Optional) The HTTP connection pool shared by the async REST clients. Set by DeepgramClient.
+        rate_limiter: (Optional) The RateLimiter consulted by all clients before sending. Set by DeepgramClient when rate limits are configured.
     """
 
     _logger: verboselogs.VerboseLogger
     _inspect_listen: bool = False
     _inspect_speak: bool = False
 
+    http_pool: Optional[Any] = None
+    async_http_pool: Optional[Any] = None
+    rate_limiter: Optional[Any] = None
+
     def __init__(
         self,
         api_key: str = "",
@@ -123,6 +130,104 @@ class DeepgramClientOptions:  # pylint: disable=too-many-instance-attributes
             and auto_flush_speak_delta > 0
         )
 
+    def get_http_pool_limits(self) -> Dict[str, Any]:
+        """
+        get_http_pool_limits: Returns the connection pool limits used by the REST clients.
+
+        The limits can be tuned using the following options:
+            max_connections: The maximum number of concurrent connections (default is 100).
+            max_keepalive_connections: The maximum number of idle connections kept in the pool (default is 20).
+            keepalive_expiry: The number of seconds an idle connection is kept in the pool (default is 5.0).
+        """
+        return {
+            "max_connections": int(self.options.get("max_connections", 100)),
+            "max_keepalive_connections": int(
+                self.options.get("max_keepalive_connections", 20)
+            ),
+            "keepalive_expiry": float(self.options.get("keepalive_expiry", 5.0)),
+        }
+
+    def is_http2_enabled(self) -> bool:
+        """
+        is_http2_enabled: Returns True if the REST clients are configured to use HTTP/2.
+
+        Requires the optional `h2` package (pip install deepgram-sdk[http2]).
+        """
+        http2 = self.options.get("http2", False)
+        if isinstance(http2, str):
+            return http2.lower() == "true"
+        return bool(http2)
+
+    def is_lazy_response_enabled(self) -> bool:
+        """
+        is_lazy_response_enabled: Returns True if transcription and analyze responses are decoded lazily.
+
+        Enabled with the `lazy_responses` option. Nested objects such as channels, alternatives and
+        words are then only built when they are first read.
+        """
+        lazy = self.options.get("lazy_responses", False)
+        if isinstance(lazy, str):
+            return lazy.lower() == "true"
+        return bool(lazy)
+
+    def is_compact_words_enabled(self) -> bool:
+        """
+        is_compact_words_enabled: Returns True if the words of transcription results are decoded as compact objects.
+
+        Enabled with the `compact_words` option. Words are then ListenRESTCompactWord and
+        ListenWSCompactWord objects, slotted variants of ListenRESTWord and ListenWSWord with the
+        same attributes which take about a third less memory.
+        """
+        compact = self.options.get("compact_words", False)
+        if isinstance(compact, str):
+            return compact.lower() == "true"
+        return bool(compact)
+
+    def is_direct_dispatch_enabled(self) -> bool:
+        """
+        is_direct_dispatch_enabled: Returns True if the async WebSocket clients await event handlers directly.
+
+        Enabled with the `direct_dispatch` option. The handlers of an event are then awaited one
+        after the other, in the order they were registered, instead of each being run as a task.
+        Events registered with on(..., concurrent=True) keep running their handlers as tasks.
+        """
+        direct = self.options.get("direct_dispatch", False)
+        if isinstance(direct, str):
+            return direct.lower() == "true"
+        return bool(direct)
+
+    def get_handler_queue(self) -> Dict[str, Any]:
+        """
+        get_handler_queue: Returns the queue between the receive thread of the sync WebSocket clients and their event handlers.
+
+        The queue can be set using the following options:
+            handler_queue_size: The number of events waiting for the handler thread before the overflow policy applies (default is no queue, handlers run on the receive thread).
+            handler_overflow: What happens when the queue is full, one of block, drop_interim or drop_oldest (default is block).
+        """
+        size = self.options.get("handler_queue_size")
+        return {
+            "maxsize": None if size is None else int(size),
+            "overflow": self.options.get("handler_overflow", "block"),
+        }
+
+    def get_rate_limits(self) -> Dict[str, Any]:
+        """
+        get_rate_limits: Returns the client-side rate limits shared by all clients of a DeepgramClient.
+
+        The limits can be set using the following options:
+            rate_limit: The maximum number of requests per second (default is no limit).
+            rate_limit_burst: The number of requests which can be sent at once before the rate applies (default is the rate).
+            max_concurrent_requests: The maximum number of requests and WebSocket connections in flight (default is no limit).
+        """
+        rate_limit = self.options.get("rate_limit")
+        burst = self.options.get("rate_limit_burst")
+        max_concurrent = self.options.get("max_concurrent_requests")
+        return {
+            "requests_per_second": None if rate_limit is None else float(rate_limit),
+            "burst": None if burst is None else int(burst),
+            "max_concurrent": None if max_concurrent is None else int(max_concurrent),
+        }
+
     def is_inspecting_listen(self) -> bool:
         """
         is_inspecting_listen: Returns True if the client is inspecting listen messages.
@@ -36,6 +36,12 @@ setup(
         "aenum>=3.1.0",
         "deprecation>=2.1.0",
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.25.2"],
+        "json": ["orjson>=3.9.0"],
+        "numpy": ["numpy>=1.22"],
+        "arrow": ["pyarrow>=12.0.0"],
+    },
     keywords=["deepgram", "deepgram speech-to-text"],
     classifiers=[
         "Intended Audience :: Developers",
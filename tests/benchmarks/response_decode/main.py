@@ -0,0 +1,92 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+# Compares decoding the recorded responses in tests/response_data with the generic
+# dataclasses_json decoder against the decoders generated for each response class.
+#
+# For each fixture the JSON is parsed once up front, so the numbers only cover building the
+# response objects from the dict. Allocations are the memory blocks and bytes still allocated
+# after one decode (the response and anything cached), counted with tracemalloc.
+#
+# usage: python tests/benchmarks/response_decode/main.py [iterations]
+
+import glob
+import json
+import sys
+import time
+import tracemalloc
+
+from dataclasses_json.core import _decode_dataclass
+
+from deepgram import PrerecordedResponse, LiveResultResponse, AnalyzeResponse
+
+FIXTURES = [
+    ("listen/rest", PrerecordedResponse),
+    ("listen/websocket", LiveResultResponse),
+    ("read/rest", AnalyzeResponse),
+]
+
+
+def generic(cls, data):
+    return _decode_dataclass(cls, data, False)
+
+
+def generated(cls, data):
+    return cls.from_dict(data)
+
+
+def measure(decode, cls, data, iterations):
+    decode(cls, data)  # warm up, generates the decoder on first use
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(cls, data)
+    elapsed = (time.perf_counter() - start) / iterations
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = decode(cls, data)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    size = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    del result
+    return elapsed, blocks, size
+
+
+def count_words(data):
+    # number of word objects in the response, for context
+    return json.dumps(data).count('"word":')
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    print(
+        f"{'fixture':<44} {'words':>6} {'generic':>11} {'generated':>11} {'speedup':>8}"
+        f" {'allocs':>15} {'bytes':>19}"
+    )
+    for directory, cls in FIXTURES:
+        for path in sorted(
+            glob.glob(f"tests/response_data/{directory}/*-response.json")
+        ):
+            with open(path, "rb") as file:
+                data = json.load(file)
+            words = count_words(data)
+
+            slow, slow_blocks, slow_size = measure(generic, cls, data, iterations)
+            fast, fast_blocks, fast_size = measure(generated, cls, data, iterations)
+            assert repr(generic(cls, data)) == repr(generated(cls, data))
+
+            name = f"{directory}/{path.rsplit('/', 1)[-1][:12]}..{path[-26:-14]}"
+            print(
+                f"{name:<44} {words:>6} {slow * 1000:>9.3f}ms {fast * 1000:>9.3f}ms"
+                f" {slow / fast:>7.1f}x {slow_blocks:>7}>{fast_blocks:<7}"
+                f" {slow_size:>9}>{fast_size:<9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+# Compares the throughput of the async REST client using pooled HTTP/1.1 connections
+# against a single multiplexed HTTP/2 connection. Both runs hit a local stand-in server
+# which replies to /v1/listen with a recorded response from tests/response_data.
+#
+# Requests go through AbstractAsyncRestClient.post() so that the numbers measure the
+# transport and are not dominated by decoding the response into PrerecordedResponse.
+#
+# requires: pip install h2
+# usage: python tests/benchmarks/rest_http2/main.py [requests] [concurrency]
+
+import asyncio
+import glob
+import sys
+import time
+
+import h11
+import h2.config
+import h2.connection
+import h2.events
+
+from deepgram import DeepgramClient, DeepgramClientOptions
+
+HOST = "127.0.0.1"
+PORT_HTTP1 = 13281
+PORT_HTTP2 = 13282
+
+AUDIO_URL = {
+    "url": "https://static.deepgram.com/examples/Bueller-Life-moves-pretty-fast.wav"
+}
+
+BODY = b""
+CONNECTIONS = {"http1": 0, "http2": 0}
+
+
+class Http1Protocol(asyncio.Protocol):
+    """
+    Minimal keep-alive HTTP/1.1 server which always returns BODY.
+    """
+
+    def __init__(self):
+        self._conn = h11.Connection(h11.SERVER)
+        self._transport = None
+
+    def connection_made(self, transport):
+        CONNECTIONS["http1"] += 1
+        self._transport = transport
+
+    def data_received(self, data):
+        self._conn.receive_data(data)
+        while True:
+            event = self._conn.next_event()
+            if event is h11.NEED_DATA or event is h11.PAUSED:
+                break
+            if isinstance(event, h11.EndOfMessage):
+                self._respond()
+            elif isinstance(event, h11.ConnectionClosed):
+                self._transport.close()
+                return
+
+    def _respond(self):
+        headers = [
+            ("content-type", "application/json"),
+            ("content-length", str(len(BODY))),
+        ]
+        out = self._conn.send(h11.Response(status_code=200, headers=headers))
+        out += self._conn.send(h11.Data(data=BODY))
+        out += self._conn.send(h11.EndOfMessage())
+        self._transport.write(out)
+        self._conn.start_next_cycle()
+
+
+class Http2Protocol(asyncio.Protocol):
+    """
+    Minimal h2c (prior knowledge) server which always returns BODY, honoring flow control.
+    """
+
+    def __init__(self):
+        config = h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        self._conn = h2.connection.H2Connection(config=config)
+        self._transport = None
+        self._pending = {}
+
+    def connection_made(self, transport):
+        CONNECTIONS["http2"] += 1
+        self._transport = transport
+        self._conn.initiate_connection()
+        transport.write(self._conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self._conn.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self._conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                self._conn.send_headers(
+                    event.stream_id,
+                    [
+                        (":status", "200"),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(BODY))),
+                    ],
+                )
+                self._pending[event.stream_id] = BODY
+            elif isinstance(event, h2.events.StreamReset):
+                self._pending.pop(event.stream_id, None)
+        self._flush()
+
+    def _flush(self):
+        for stream_id in list(self._pending):
+            data = self._pending[stream_id]
+            while data:
+                window = min(
+                    self._conn.local_flow_control_window(stream_id),
+                    self._conn.max_outbound_frame_size,
+                )
+                if window <= 0:
+                    break
+                self._conn.send_data(stream_id, data[:window])
+                data = data[window:]
+            if data:
+                self._pending[stream_id] = data
+            else:
+                self._conn.end_stream(stream_id)
+                del self._pending[stream_id]
+        self._transport.write(self._conn.data_to_send())
+
+
+async def run(label, port, options, total, concurrency):
+    config = DeepgramClientOptions(
+        api_key="bench", url=f"http://{HOST}:{port}", options=options
+    )
+    async with DeepgramClient("bench", config) as deepgram:
+        client = deepgram.listen.asyncrest.v("1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        url = f"{config.url}/v1/listen"
+
+        async def one():
+            async with semaphore:
+                await client.post(url, json=AUDIO_URL)
+
+        # warm up the pool
+        await asyncio.gather(*[one() for _ in range(concurrency)])
+
+        start = time.perf_counter()
+        await asyncio.gather(*[one() for _ in range(total)])
+        elapsed = time.perf_counter() - start
+
+    key = "http2" if options.get("http2") else "http1"
+    print(
+        f"{label:<22} {total / elapsed:>10.1f} req/s {elapsed * 1000:>10.1f} ms total"
+        f" {CONNECTIONS[key]:>6} connections"
+    )
+
+
+async def main():
+    global BODY  # pylint: disable=global-statement
+
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    fixture = sorted(glob.glob("tests/response_data/listen/rest/*-response.json"))[0]
+    with open(fixture, "rb") as file:
+        BODY = file.read()
+
+    loop = asyncio.get_running_loop()
+    server1 = await loop.create_server(Http1Protocol, HOST, PORT_HTTP1)
+    server2 = await loop.create_server(Http2Protocol, HOST, PORT_HTTP2)
+
+    print(f"requests: {total}, concurrency: {concurrency}, body: {len(BODY)} bytes")
+    await run(
+        "HTTP/1.1 pooled",
+        PORT_HTTP1,
+        {"max_connections": concurrency, "max_keepalive_connections": concurrency},
+        total,
+        concurrency,
+    )
+    await run("HTTP/2 multiplexed", PORT_HTTP2, {"http2": True}, total, concurrency)
+
+    server1.close()
+    server2.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+# Measures the cost of dispatching a message received over the WebSocket connection to its
+# event handler, at each log level of the client.
+#
+# Each message is processed as it is when read from the socket: _process_text parses the frame,
+# builds the response and calls _emit, which calls a handler doing nothing. Log records are
+# formatted and written to os.devnull, so enabled levels include the cost of the output.
+#
+# The async client is then measured at the WARNING level, with its handlers run as tasks and
+# gathered (the default) and awaited directly (the direct_dispatch option).
+#
+# usage: python tests/benchmarks/websocket_dispatch/main.py [iterations]
+
+import asyncio
+import glob
+import json
+import os
+import sys
+import threading
+import time
+
+from deepgram import (
+    AsyncListenWebSocketClient,
+    DeepgramClientOptions,
+    ListenWebSocketClient,
+    LiveTranscriptionEvents,
+)
+from deepgram.utils import verboselogs
+
+LEVELS = [
+    ("WARNING", verboselogs.WARNING),
+    ("NOTICE", verboselogs.NOTICE),
+    ("INFO", verboselogs.INFO),
+    ("VERBOSE", verboselogs.VERBOSE),
+    ("DEBUG", verboselogs.DEBUG),
+]
+
+FIXTURE = sorted(glob.glob("tests/response_data/listen/websocket/*-response.json"))[0]
+
+MESSAGES = [
+    (
+        "SpeechStarted",
+        json.dumps({"type": "SpeechStarted", "channel": [0], "timestamp": 1.5}),
+    ),
+    ("Results", open(FIXTURE, "r", encoding="utf-8").read()),
+]
+
+
+def measure(level, message, iterations, devnull):
+    client = ListenWebSocketClient(DeepgramClientOptions(verbose=level))
+    # every client adds a handler to the logger of the module, keep the one just added
+    client._logger.handlers = client._logger.handlers[-1:]
+    client._logger.handlers[0].setStream(devnull)
+    client._kwargs = {}
+    for event in (
+        LiveTranscriptionEvents.SpeechStarted,
+        LiveTranscriptionEvents.Transcript,
+    ):
+        client.on(event, lambda *args, **kwargs: None)
+
+    client._process_text(message)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client._process_text(message)
+    return (time.perf_counter() - start) / iterations
+
+
+async def measure_async(direct, message, iterations):
+    client = AsyncListenWebSocketClient(
+        DeepgramClientOptions(
+            verbose=verboselogs.WARNING, options={"direct_dispatch": direct}
+        )
+    )
+    client._kwargs = {}
+
+    async def handler(*args, **kwargs):
+        pass
+
+    for event in (
+        LiveTranscriptionEvents.SpeechStarted,
+        LiveTranscriptionEvents.Transcript,
+    ):
+        client.on(event, handler)
+
+    await client._process_text(message)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await client._process_text(message)
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    # a few idle threads, as in an application with a microphone and a keep alive
+    stop = threading.Event()
+    for _ in range(4):
+        threading.Thread(target=stop.wait, daemon=True).start()
+
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        print(f"{'level':<10}" + "".join(f"{name:>16}" for name, _ in MESSAGES))
+        for name, level in LEVELS:
+            row = [
+                measure(level, message, iterations, devnull) for _, message in MESSAGES
+            ]
+            print(f"{name:<10}" + "".join(f"{t * 1e6:>14.1f}us" for t in row))
+
+    print()
+    print(f"{'async':<10}" + "".join(f"{name:>16}" for name, _ in MESSAGES))
+    for name, direct in (("gather", False), ("direct", True)):
+        row = [
+            asyncio.run(measure_async(direct, message, iterations))
+            for _, message in MESSAGES
+        ]
+        print(f"{name:<10}" + "".join(f"{t * 1e6:>14.1f}us" for t in row))
+    stop.set()
+
+
+if __name__ == "__main__":
+    main()
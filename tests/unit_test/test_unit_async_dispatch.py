@@ -0,0 +1,66 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import json
+
+import pytest
+
+from deepgram import (
+    AsyncListenWebSocketClient,
+    DeepgramClientOptions,
+    LiveTranscriptionEvents,
+)
+
+MESSAGE1 = json.dumps({"type": "SpeechStarted", "channel": [0], "timestamp": 1.5})
+
+
+def new_client(direct):
+    client = AsyncListenWebSocketClient(
+        DeepgramClientOptions(api_key="test", options={"direct_dispatch": direct})
+    )
+    client._kwargs = {}
+    return client
+
+
+@pytest.mark.asyncio
+async def test_unit_async_dispatch_direct():
+    client = new_client(True)
+    calls = []
+
+    async def first(_, speech_started, **kwargs):
+        calls.append(("first", asyncio.current_task()))
+        raise ValueError("handler error")
+
+    async def second(_, speech_started, **kwargs):
+        calls.append(("second", asyncio.current_task()))
+
+    client.on(LiveTranscriptionEvents.SpeechStarted, first)
+    client.on(LiveTranscriptionEvents.SpeechStarted, second)
+    await client._process_text(MESSAGE1)
+
+    # in order, in the task reading the messages, and an error does not stop the others
+    assert [name for name, _ in calls] == ["first", "second"]
+    assert all(task is asyncio.current_task() for _, task in calls)
+
+
+@pytest.mark.parametrize("direct, concurrent", [(False, None), (True, True)])
+@pytest.mark.asyncio
+async def test_unit_async_dispatch_concurrent(direct, concurrent):
+    client = new_client(direct)
+    started = asyncio.Event()
+    calls = []
+
+    async def waiting(_, speech_started, **kwargs):
+        await started.wait()
+        calls.append("waiting")
+
+    async def starting(_, speech_started, **kwargs):
+        started.set()
+        calls.append("starting")
+
+    client.on(LiveTranscriptionEvents.SpeechStarted, waiting, concurrent=concurrent)
+    client.on(LiveTranscriptionEvents.SpeechStarted, starting)
+    await asyncio.wait_for(client._process_text(MESSAGE1), 5)
+    assert calls == ["starting", "waiting"]
@@ -0,0 +1,155 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import gc
+import json
+import threading
+import pytest
+from http import HTTPStatus
+
+import httpx
+
+from deepgram import (
+    DeepgramClient,
+    DeepgramClientOptions,
+    AsyncListenRESTClient,
+    RetryPolicy,
+)
+from deepgram.clients import AsyncHttpClientPool
+from tests.utils import RESPONSE1, mock_transport
+
+
+@pytest.mark.asyncio
+async def test_unit_async_rest_client_context_manager():
+    config = DeepgramClientOptions(api_key="test", options={"max_connections": 8})
+    async with AsyncListenRESTClient(config) as client:
+        pooled = client._get_client()
+        assert pooled is client._get_client()
+        assert pooled._transport._pool._max_connections == 8
+
+        calls = []
+        pooled._transport = mock_transport(calls)
+        for _ in range(3):
+            response = await client.transcribe_url(
+                {"url": "https://example.com/audio.wav"}
+            )
+            assert response.metadata.request_id == "abc"
+        assert len(calls) == 3
+    assert pooled.is_closed
+
+
+@pytest.mark.asyncio
+async def test_unit_async_rest_client_shared_pool():
+    async with DeepgramClient("test") as deepgram:
+        listen = deepgram.listen.asyncrest.v("1")
+        speak = deepgram.speak.asyncrest.v("1")
+        read = deepgram.read.asyncanalyze.v("1")
+        manage = deepgram.asyncmanage.v("1")
+
+        pooled = listen._get_client()
+        assert speak._get_client() is pooled
+        assert read._get_client() is pooled
+        assert manage._get_client() is pooled
+
+        # closing a single client leaves the shared pool open
+        await listen.aclose()
+        assert not pooled.is_closed
+    assert pooled.is_closed
+
+
+def test_unit_async_rest_client_pool_loops():
+    pool = AsyncHttpClientPool(DeepgramClientOptions(api_key="test"))
+
+    # a loop running in another thread keeps its own client
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+
+    async def get_client():
+        return pool.get_client()
+
+    first = asyncio.run_coroutine_threadsafe(get_client(), other).result()
+    second = asyncio.run(get_client())
+    assert second is not first and not first.is_closed
+
+    async def close():
+        assert pool.get_client() is not second
+        await pool.aclose()
+
+    # the client of the closed loop is dropped, aclose() waits for those of running loops
+    asyncio.run(close())
+    assert first.is_closed
+    other.call_soon_threadsafe(other.stop)
+    thread.join()
+    other.close()
+
+    # the pool does not keep a loop alive
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(get_client())
+    assert len(pool._clients) == 1
+    loop.close()
+    del loop
+    gc.collect()
+    assert len(pool._clients) == 0
+
+
+@pytest.mark.asyncio
+async def test_unit_async_rest_client_retry():
+    statuses = [429, 200]
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < len(statuses):
+            return httpx.Response(statuses[len(calls) - 1], content=b"{}")
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    config = DeepgramClientOptions(api_key="test")
+    async with AsyncListenRESTClient(config) as client:
+        client.retry_policy = RetryPolicy(base_delay=0.001, max_delay=0.01)
+        response = await client.transcribe_url(
+            {"url": "https://example.com/audio.wav"},
+            transport=httpx.MockTransport(handler),
+        )
+    assert response.metadata.request_id == "abc"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unit_async_rest_client_path_source(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"0123456789" * 20000)
+
+    received = []
+
+    async def handler(request):
+        received.append(await request.aread())
+        assert request.headers["Content-Length"] == "200000"
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    async with AsyncListenRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        response = await client.transcribe_file(
+            {"path": str(audio)}, transport=httpx.MockTransport(handler)
+        )
+    assert response.metadata.request_id == "abc"
+    assert received == [audio.read_bytes()]
+
+
+@pytest.mark.asyncio
+async def test_unit_async_rest_client_buffer_protocol():
+    data = bytearray(b"0123456789" * 10000)
+    received = []
+
+    async def handler(request):
+        received.append(await request.aread())
+        assert request.headers["Content-Length"] == "50000"
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    async with AsyncListenRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        await client.transcribe_file(
+            {"buffer": memoryview(data)[25000:75000]},
+            transport=httpx.MockTransport(handler),
+        )
+    assert received == [bytes(data[25000:75000])]
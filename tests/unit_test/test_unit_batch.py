@@ -0,0 +1,123 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import json
+import threading
+import time
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from deepgram import (
+    DeepgramClientOptions,
+    DeepgramError,
+    ListenRESTClient,
+    AsyncListenRESTClient,
+    BatchResult,
+)
+
+SOURCES = [
+    {"url": "https://example.com/0.wav"},
+    {"buffer": b"audio-1"},
+    {"url": "https://example.com/fail.wav"},
+    {"url": "https://example.com/3.wav"},
+    {"buffer": b"audio-4"},
+]
+
+
+class Handler:
+    def __init__(self, delay):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def respond(self, request):
+        body = request.read()
+        if b"fail" in body:
+            return httpx.Response(HTTPStatus.BAD_REQUEST, content=b'{"err_msg": "bad"}')
+        return httpx.Response(
+            HTTPStatus.OK,
+            content=json.dumps(
+                {"metadata": {"request_id": body.decode()}, "results": {"channels": []}}
+            ),
+        )
+
+    def __call__(self, request):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return self.respond(request)
+
+    async def handle_async(self, request):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self.respond(request)
+
+
+def check(results):
+    assert sorted(result.index for result in results) == list(range(len(SOURCES)))
+    for result in results:
+        assert isinstance(result, BatchResult)
+        assert result.source is SOURCES[result.index]
+        if result.index == 2:
+            assert not result.ok
+            assert result.response is None
+        else:
+            assert result.ok
+            assert result.response.metadata.request_id is not None
+
+
+def test_unit_batch_sync():
+    handler = Handler(0.02)
+    with ListenRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        client._get_client()._transport = httpx.MockTransport(handler)
+        results = list(client.transcribe_batch(SOURCES, concurrency=2))
+    check(results)
+    assert handler.peak == 2
+
+
+def test_unit_batch_sync_none_source():
+    handler = Handler(0)
+    with ListenRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        client._get_client()._transport = httpx.MockTransport(handler)
+        results = list(client.transcribe_batch([None, SOURCES[0]]))
+    # a None source fails on its own, it does not end the batch
+    assert sorted((result.index, result.ok) for result in results) == [
+        (0, False),
+        (1, True),
+    ]
+
+
+def test_unit_batch_concurrency():
+    client = ListenRESTClient(DeepgramClientOptions(api_key="test"))
+    with pytest.raises(DeepgramError):
+        client.transcribe_batch(SOURCES, concurrency=0)
+    client = AsyncListenRESTClient(DeepgramClientOptions(api_key="test"))
+    with pytest.raises(DeepgramError):
+        client.transcribe_batch(SOURCES, concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_unit_batch_async():
+    handler = Handler(0.02)
+
+    async def sources():
+        for source in SOURCES:
+            yield source
+
+    async with AsyncListenRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        client._get_client()._transport = httpx.MockTransport(handler.handle_async)
+        results = [
+            result async for result in client.transcribe_batch(sources(), concurrency=3)
+        ]
+    check(results)
+    assert handler.peak == 3
@@ -0,0 +1,79 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import copy
+import glob
+import pickle
+
+import pytest
+
+from deepgram import (
+    DeepgramClientOptions,
+    ListenWebSocketClient,
+    LiveTranscriptionEvents,
+    PrerecordedResponse,
+    LiveResultResponse,
+    ListenRESTWord,
+    ListenRESTCompactWord,
+    ListenWSCompactWord,
+)
+
+CASES = [
+    (cls, path)
+    for directory, cls in [
+        ("listen/rest", PrerecordedResponse),
+        ("listen/websocket", LiveResultResponse),
+    ]
+    for path in sorted(glob.glob(f"tests/response_data/{directory}/*-response.json"))
+]
+
+
+def test_unit_compact_word():
+    data = {"word": "hi", "start": 1, "end": 2.5, "confidence": 0.9, "speaker": 1}
+    word = ListenRESTCompactWord.from_dict(data)
+    assert not hasattr(word, "__dict__")
+    assert isinstance(word, ListenRESTWord)
+    assert isinstance(word.start, float) and word.speaker == 1
+    assert word == ListenRESTWord.from_dict(data)
+    assert ListenRESTWord.from_dict(data) == word
+    assert word != ListenRESTWord.from_dict({**data, "word": "ho"})
+    assert word["word"] == "hi"
+    assert word.to_json() == ListenRESTWord.from_dict(data).to_json()
+    assert pickle.loads(pickle.dumps(word)) == word
+    assert copy.copy(word) == word
+    with pytest.raises(AttributeError):
+        word.unknown = 1
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("cls, path", CASES)
+def test_unit_compact_word_responses(cls, path, lazy):
+    with open(path, "r", encoding="utf-8") as file:
+        raw = file.read()
+    expected = cls.from_json(raw)
+    response = cls.from_json(raw, lazy=lazy, compact=True)
+    assert response == expected
+    assert response.to_json() == expected.to_json()
+
+    channel = (
+        response.channel if cls is LiveResultResponse else response.results.channels[0]
+    )
+    words = channel.alternatives[0].words
+    assert words and all(type(w).__name__.endswith("CompactWord") for w in words)
+
+
+def test_unit_compact_word_option():
+    client = ListenWebSocketClient(
+        DeepgramClientOptions(api_key="test", options={"compact_words": "true"})
+    )
+    client._kwargs = {}
+    results = []
+    client.on(
+        LiveTranscriptionEvents.Transcript,
+        lambda _, result, **kwargs: results.append(result),
+    )
+    path = [path for cls, path in CASES if cls is LiveResultResponse][0]
+    with open(path, "r", encoding="utf-8") as file:
+        client._process_text(file.read())
+    assert isinstance(results[0].channel.alternatives[0].words[0], ListenWSCompactWord)
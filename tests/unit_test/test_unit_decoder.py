@@ -0,0 +1,126 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import copy
+import glob
+import json
+import pickle
+import warnings
+from http import HTTPStatus
+
+import httpx
+import pytest
+from dataclasses_json.core import _decode_dataclass
+
+from deepgram import (
+    DeepgramClientOptions,
+    ListenRESTClient,
+    ListenWSWord,
+    PrerecordedResponse,
+    LiveResultResponse,
+    AnalyzeResponse,
+    ListenRESTWord,
+    ListenRESTMetadata as Metadata,
+)
+from tests.utils import RESPONSE1
+
+FIXTURES = [
+    ("listen/rest", PrerecordedResponse),
+    ("listen/websocket", LiveResultResponse),
+    ("read/rest", AnalyzeResponse),
+]
+
+CASES = [
+    (cls, path)
+    for directory, cls in FIXTURES
+    for path in sorted(glob.glob(f"tests/response_data/{directory}/*-response.json"))
+]
+
+
+@pytest.mark.parametrize("cls, path", CASES)
+def test_unit_decoder_fixtures(cls, path):
+    with open(path, "r", encoding="utf-8") as file:
+        raw = file.read()
+    expected = _decode_dataclass(cls, json.loads(raw), False)
+    response = cls.from_json(raw)
+    # repr also tells 0 from 0.0, so coercions must match as well as values
+    assert repr(response) == repr(expected)
+    assert response.to_json() == expected.to_json()
+
+
+def test_unit_decoder_coercion():
+    data = {
+        "word": "hi",
+        "start": 1,
+        "confidence": "0.5",
+        "speaker": 0,
+        "sentiment": None,
+        "unknown": "dropped",
+    }
+    expected = _decode_dataclass(ListenRESTWord, data, False)
+    word = ListenRESTWord.from_dict(data)
+    assert repr(word) == repr(expected)
+    assert isinstance(word.start, float) and isinstance(word.end, float)
+    assert word.confidence == 0.5
+
+    # already decoded objects are passed through
+    assert ListenRESTWord.from_dict(word) is word
+
+    data = {"request_id": None, "warnings": [{"parameter": "x", "type": "y"}]}
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        metadata = Metadata.from_dict(data)
+        assert len(caught) == 1 and "request_id" in str(caught[0].message)
+        assert repr(metadata) == repr(_decode_dataclass(Metadata, data, False))
+
+
+@pytest.mark.parametrize("cls, path", CASES)
+def test_unit_decoder_lazy(cls, path):
+    with open(path, "r", encoding="utf-8") as file:
+        raw = file.read()
+    expected = cls.from_json(raw)
+    response = cls.from_json(raw, lazy=True)
+    assert isinstance(response, cls)
+    assert response == expected and expected == response
+    assert repr(response) == repr(expected)
+    assert response.to_json() == expected.to_json()
+    assert pickle.loads(pickle.dumps(cls.from_json(raw, lazy=True))) == expected
+    assert copy.deepcopy(cls.from_json(raw, lazy=True)) == expected
+
+
+def test_unit_decoder_lazy_access():
+    path = [path for cls, path in CASES if cls is LiveResultResponse][0]
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    response = LiveResultResponse.from_dict(data, lazy=True)
+    alternative = response.channel.alternatives[0]
+    assert alternative.transcript == data["channel"]["alternatives"][0]["transcript"]
+    assert response.is_final == data["is_final"]
+    # nothing else has been built
+    assert "words" not in vars(alternative)
+    assert "metadata" not in vars(response)
+
+    # values are decoded once and then kept, including changes
+    assert response.channel is response.channel
+    alternative.transcript = "changed"
+    assert response.channel.alternatives[0].transcript == "changed"
+    assert isinstance(alternative.words[0], ListenWSWord)
+    assert isinstance(alternative.words[0].start, float)
+
+
+def test_unit_decoder_lazy_option():
+    def handler(request):
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    client = ListenRESTClient(
+        DeepgramClientOptions(api_key="test", options={"lazy_responses": True})
+    )
+    response = client.transcribe_url(
+        {"url": "https://example.com/audio.wav"},
+        transport=httpx.MockTransport(handler),
+    )
+    assert "results" not in vars(response)
+    assert response.metadata.request_id == "abc"
+    assert response == PrerecordedResponse.from_dict(RESPONSE1)
@@ -0,0 +1,137 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import json
+import threading
+import time
+
+import pytest
+from websocket_server import WebsocketServer, WebsocketServerThread
+
+from deepgram import (
+    DeepgramClientOptions,
+    DeepgramError,
+    ListenWebSocketClient,
+    LiveTranscriptionEvents,
+)
+from deepgram.clients.common.v1.event_queue import EventQueue
+
+
+def is_interim(item):
+    return item.startswith("interim")
+
+
+def test_unit_event_queue_overflow():
+    queue = EventQueue(2, "drop_oldest")
+    for item in ("a", "b", "c"):
+        assert queue.put(item)
+    assert [queue.get(0), queue.get(0), queue.get(0)] == ["b", "c", None]
+    stats = queue.stats()
+    assert (stats.delivered, stats.dropped, stats.max_depth) == (2, 1, 2)
+
+    queue = EventQueue(2, "drop_interim", is_interim=is_interim)
+    assert queue.put("final 1") and queue.put("interim 1")
+    # the waiting interim event makes room for the new one
+    assert queue.put("interim 2")
+    # and a new interim event is dropped when only finals wait
+    assert queue.put("final 2")
+    assert not queue.put("interim 3")
+    assert [queue.get(0), queue.get(0)] == ["final 1", "final 2"]
+    assert queue.stats().dropped == 3
+
+    queue = EventQueue(1, "block")
+    queue.put("a")
+    threading.Timer(0.1, queue.get).start()
+    assert queue.put("b") and queue.stats().dropped == 0
+
+    queue.close()
+    assert not queue.put("c")
+    assert queue.get() == "b" and queue.get() is None
+
+    with pytest.raises(DeepgramError):
+        EventQueue(1, "drop_newest")
+
+
+def test_unit_event_queue_client():
+    messages = [
+        json.dumps({"type": "SpeechStarted", "channel": [0], "timestamp": i})
+        for i in range(5)
+    ]
+
+    def new_client(client, server):
+        for message in messages:
+            server.send_message(client, message)
+
+    server = WebsocketServer(host="127.0.0.1", port=13260)
+    server.set_fn_new_client(new_client)
+    server.daemon = True
+    server.thread = WebsocketServerThread(
+        target=server.serve_forever, daemon=True, logger=None
+    )
+    server.thread.start()
+
+    client = ListenWebSocketClient(
+        DeepgramClientOptions(
+            url="ws://127.0.0.1:13260", options={"handler_queue_size": 2}
+        )
+    )
+    received = []
+
+    def on_speech_started(_, speech_started, **kwargs):
+        # a slow handler, running on its own thread
+        time.sleep(0.05)
+        received.append((speech_started.timestamp, threading.current_thread()))
+
+    client.on(LiveTranscriptionEvents.SpeechStarted, on_speech_started)
+    assert client.start() is True
+    for _ in range(50):
+        if len(received) == len(messages):
+            break
+        time.sleep(0.1)
+    client.finish()
+    server.shutdown_gracefully()
+
+    assert [timestamp for timestamp, _ in received] == list(range(5))
+    assert all(thread is not threading.current_thread() for _, thread in received)
+    stats = client.handler_queue_stats()
+    assert stats.dropped == 0 and stats.depth == 0 and stats.max_depth <= 2
+
+
+def test_unit_event_queue_finish_from_handler():
+    messages = [
+        json.dumps({"type": "SpeechStarted", "channel": [0], "timestamp": i})
+        for i in range(20)
+    ]
+
+    def new_client(client, server):
+        for message in messages:
+            server.send_message(client, message)
+
+    server = WebsocketServer(host="127.0.0.1", port=13261)
+    server.set_fn_new_client(new_client)
+    server.daemon = True
+    server.thread = WebsocketServerThread(
+        target=server.serve_forever, daemon=True, logger=None
+    )
+    server.thread.start()
+
+    client = ListenWebSocketClient(
+        DeepgramClientOptions(
+            url="ws://127.0.0.1:13261",
+            options={"handler_queue_size": 1, "handler_overflow": "block"},
+        )
+    )
+    finished = threading.Event()
+
+    def on_speech_started(_, speech_started, **kwargs):
+        if speech_started.timestamp == 0:
+            # the listening thread is now waiting for room in the full queue
+            time.sleep(0.2)
+            client.finish()
+            finished.set()
+
+    client.on(LiveTranscriptionEvents.SpeechStarted, on_speech_started)
+    assert client.start() is True
+    assert finished.wait(timeout=5)
+    server.shutdown_gracefully()
@@ -0,0 +1,115 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import glob
+import importlib.util
+import json
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from deepgram import (
+    DeepgramClientOptions,
+    DeepgramError,
+    DeepgramApiError,
+    JsonCodec,
+    ListenRESTClient,
+    ListenWebSocketClient,
+    LiveTranscriptionEvents,
+)
+from deepgram.clients.common.v1.json_codec import CODECS, resolve_json_codec
+from tests.utils import RESPONSE1
+
+FIXTURE = sorted(glob.glob("tests/response_data/listen/websocket/*-response.json"))[0]
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.decoded = 0
+        self.encoded = 0
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.encoded += 1
+        return super().dumps(obj)
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+def test_unit_json_codec_round_trip(name):
+    if name != "json" and importlib.util.find_spec(name) is None:
+        with pytest.raises(DeepgramError):
+            resolve_json_codec(name)
+        return
+    codec = resolve_json_codec(name)
+    assert codec.name == name
+    data = {"type": "Results", "text": "héllo", "start": 1.5, "words": [1, None]}
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumps(data).encode("utf-8")) == data
+    with pytest.raises(ValueError):
+        codec.loads("{not json")
+
+
+def test_unit_json_codec_resolve():
+    assert resolve_json_codec("auto").name in CODECS
+    assert type(resolve_json_codec("JSON")) is JsonCodec
+    with pytest.raises(DeepgramError):
+        resolve_json_codec("simplejson")
+
+
+def test_unit_json_codec_rest():
+    codec = CountingCodec()
+    client = ListenRESTClient(
+        DeepgramClientOptions(api_key="test", options={"json_codec": codec})
+    )
+
+    def handler(request):
+        if b"fail" in request.content:
+            return httpx.Response(HTTPStatus.BAD_REQUEST, json={"err_msg": "bad"})
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    response = client.transcribe_url(
+        {"url": "https://example.com/ok.wav"}, transport=httpx.MockTransport(handler)
+    )
+    assert response.metadata.request_id == "abc"
+    assert codec.decoded == 1
+
+    with pytest.raises(DeepgramApiError):
+        client.transcribe_url(
+            {"url": "https://example.com/fail.wav"},
+            transport=httpx.MockTransport(handler),
+        )
+    assert codec.decoded == 2
+
+
+def test_unit_json_codec_websocket():
+    codec = CountingCodec()
+    client = ListenWebSocketClient(
+        DeepgramClientOptions(api_key="test", options={"json_codec": codec})
+    )
+    client._kwargs = {}
+    results = []
+    client.on(
+        LiveTranscriptionEvents.SpeechStarted,
+        lambda _, speech_started, **kwargs: results.append(speech_started),
+    )
+
+    client._process_text(
+        json.dumps({"type": "SpeechStarted", "channel": [0], "timestamp": 1.5})
+    )
+    assert results[0].timestamp == 1.5
+    # each frame is parsed once, the response is built from the decoded dict
+    assert codec.decoded == 1
+
+    client.on(
+        LiveTranscriptionEvents.Transcript,
+        lambda _, result, **kwargs: results.append(result),
+    )
+    with open(FIXTURE, "r", encoding="utf-8") as file:
+        client._process_text(file.read())
+    assert results[1].channel.alternatives[0].transcript
+    assert codec.decoded == 2
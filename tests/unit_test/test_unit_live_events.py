@@ -0,0 +1,76 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+from websocket_server import WebsocketServer, WebsocketServerThread
+
+from deepgram import (
+    AsyncListenWebSocketClient,
+    CloseResponse,
+    DeepgramClientOptions,
+    ListenWebSocketClient,
+    OpenResponse,
+    SpeechStartedResponse,
+)
+
+MESSAGES = [
+    json.dumps({"type": "SpeechStarted", "channel": [0], "timestamp": i})
+    for i in range(3)
+]
+
+
+def start_server(port):
+    def new_client(client, server):
+        for message in MESSAGES:
+            server.send_message(client, message)
+
+    server = WebsocketServer(host="127.0.0.1", port=port)
+    server.set_fn_new_client(new_client)
+    server.daemon = True
+    server.thread = WebsocketServerThread(
+        target=server.serve_forever, daemon=True, logger=None
+    )
+    server.thread.start()
+    return server
+
+
+def check(responses):
+    # the sync client may receive a message before it emits the open event
+    assert sum(isinstance(r, OpenResponse) for r in responses) == 1
+    speech_started = [r for r in responses if isinstance(r, SpeechStartedResponse)]
+    assert [r.timestamp for r in speech_started] == [0, 1, 2]
+    assert isinstance(responses[-1], CloseResponse)
+
+
+def test_unit_live_events():
+    server = start_server(13261)
+    client = ListenWebSocketClient(DeepgramClientOptions(url="ws://127.0.0.1:13261"))
+    responses = []
+    events = client.events(maxsize=2)
+    assert client.start() is True
+    for response in events:
+        responses.append(response)
+        if len(responses) == len(MESSAGES) + 1:
+            client.finish()
+    server.shutdown_gracefully()
+    check(responses)
+
+
+@pytest.mark.asyncio
+async def test_unit_async_live_events():
+    server = start_server(13262)
+    client = AsyncListenWebSocketClient(
+        DeepgramClientOptions(url="ws://127.0.0.1:13262")
+    )
+    responses = []
+    events = client.events(maxsize=2)
+    assert await client.start() is True
+    async for response in events:
+        responses.append(response)
+        if len(responses) == len(MESSAGES) + 1:
+            await client.finish()
+    server.shutdown_gracefully()
+    check(responses)
@@ -0,0 +1,112 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import glob
+import json
+
+import pytest
+
+from deepgram import (
+    AsyncListenWebSocketClient,
+    DeepgramClientOptions,
+    DeepgramError,
+    ListenWebSocketClient,
+    LiveResultResponse,
+    LiveTranscriptionEvents,
+)
+
+FIXTURE = sorted(glob.glob("tests/response_data/listen/websocket/*-response.json"))[0]
+
+
+def messages():
+    with open(FIXTURE, "r", encoding="utf-8") as file:
+        final = json.load(file)
+    interim = dict(final, is_final=False)
+    return [json.dumps(interim), json.dumps(final)]
+
+
+def count_decoded(monkeypatch):
+    decoded = []
+    from_dict = LiveResultResponse.from_dict
+
+    def counting(data, **kwargs):
+        decoded.append(data)
+        return from_dict(data, **kwargs)
+
+    monkeypatch.setattr(LiveResultResponse, "from_dict", counting)
+    return decoded
+
+
+def test_unit_live_subscriptions(monkeypatch):
+    decoded = count_decoded(monkeypatch)
+    client = ListenWebSocketClient(DeepgramClientOptions(api_key="test"))
+    client._kwargs = {}
+    unhandled = []
+    client.on(
+        LiveTranscriptionEvents.Unhandled,
+        lambda *args, **kwargs: unhandled.append(args),
+    )
+
+    # nobody observes the results, they are not built
+    for message in messages():
+        client._process_text(message)
+    assert decoded == [] and unhandled == []
+
+    finals = []
+    client.on(
+        LiveTranscriptionEvents.Transcript,
+        lambda _, result, **kwargs: finals.append(result),
+        when=lambda data: data["is_final"],
+    )
+    for message in messages():
+        client._process_text(message)
+    assert len(decoded) == 1 and [r.is_final for r in finals] == [True]
+
+    # a failing condition does not match, the connection goes on
+    client.on(
+        LiveTranscriptionEvents.Transcript,
+        lambda _, result, **kwargs: finals.append(result),
+        when=lambda data: data["missing"],
+    )
+    client._exit_event.clear()
+    for message in messages():
+        client._process_text(message)
+    assert [r.is_final for r in finals] == [True, True]
+    assert not client._exit_event.is_set()
+
+    with pytest.raises(DeepgramError):
+        client.on(LiveTranscriptionEvents.Open, print, when=lambda data: True)
+
+
+def test_unit_live_subscriptions_snapshot():
+    client = ListenWebSocketClient(DeepgramClientOptions(api_key="test"))
+    data = json.loads(messages()[1])
+    client.on(LiveTranscriptionEvents.Transcript, print)
+
+    # the handlers returned for a message do not change with later registrations
+    handlers = client._observers(data["type"], data)
+    assert handlers == [print]
+    client.on(LiveTranscriptionEvents.Transcript, repr)
+    assert handlers == [print]
+    assert handlers is not client._event_handlers[LiveTranscriptionEvents.Transcript]
+
+
+@pytest.mark.asyncio
+async def test_unit_async_live_subscriptions(monkeypatch):
+    decoded = count_decoded(monkeypatch)
+    client = AsyncListenWebSocketClient(DeepgramClientOptions(api_key="test"))
+    client._kwargs = {}
+    interims = []
+
+    async def on_interim(_, result, **kwargs):
+        interims.append(result)
+
+    client.on(
+        LiveTranscriptionEvents.Transcript,
+        on_interim,
+        when=lambda data: not data["is_final"],
+    )
+    for message in messages():
+        await client._process_text(message)
+    assert len(decoded) == 1 and [r.is_final for r in interims] == [False]
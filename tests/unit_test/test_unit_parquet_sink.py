@@ -0,0 +1,103 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import glob
+import os
+import sys
+
+import pytest
+
+from deepgram import DeepgramError, ParquetSink, PrerecordedResponse, LiveResultResponse
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+REST_FIXTURES = sorted(glob.glob("tests/response_data/listen/rest/*-response.json"))
+WS_FIXTURE = sorted(glob.glob("tests/response_data/listen/websocket/*-response.json"))[
+    0
+]
+
+DIARIZED_RESPONSE = {
+    "metadata": {"request_id": "abc"},
+    "results": {
+        "channels": [
+            {
+                "alternatives": [
+                    {
+                        "words": [
+                            {"word": "hi", "start": 0, "end": 0.5, "speaker": 0},
+                            {"word": "there", "start": 0.5, "end": 1, "speaker": 1},
+                        ],
+                        "paragraphs": {
+                            "paragraphs": [
+                                {
+                                    "sentences": [
+                                        {"text": "Hi.", "start": 0, "end": 0.5},
+                                        {"text": "There.", "start": 0.5, "end": 1},
+                                    ],
+                                    "num_words": 2,
+                                    "start": 0,
+                                    "end": 1,
+                                    "speaker": 0,
+                                }
+                            ]
+                        },
+                    }
+                ]
+            }
+        ],
+        "utterances": [
+            {"id": "u1", "start": 0, "end": 1, "speaker": 0, "transcript": "hi there"}
+        ],
+    },
+}
+
+
+def read(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def test_unit_parquet_sink(tmp_path):
+    with ParquetSink(str(tmp_path)) as sink:
+        sink.write(PrerecordedResponse.from_dict(DIARIZED_RESPONSE))
+        sink.write(PrerecordedResponse.from_dict(DIARIZED_RESPONSE), request_id="def")
+
+    words = pq.read_table(tmp_path / "words.parquet").to_pylist()
+    assert [w["word"] for w in words] == ["hi", "there"] * 2
+    assert [w["request_id"] for w in words] == ["abc", "abc", "def", "def"]
+    assert words[1]["speaker"] == 1 and words[1]["index"] == 1
+    assert words[1]["punctuated_word"] is None
+
+    paragraph = pq.read_table(tmp_path / "paragraphs.parquet").to_pylist()[0]
+    assert paragraph["text"] == "Hi. There." and paragraph["num_words"] == 2
+    utterances = pq.read_table(tmp_path / "utterances.parquet").to_pylist()
+    assert [u["id"] for u in utterances] == ["u1", "u1"]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_unit_parquet_sink_row_groups(tmp_path, lazy):
+    expected = []
+    with ParquetSink(str(tmp_path), row_group_size=50) as sink:
+        for path in REST_FIXTURES:
+            response = PrerecordedResponse.from_json(read(path), lazy=lazy)
+            sink.write(response)
+            channel = PrerecordedResponse.from_json(read(path)).results.channels[0]
+            expected.extend(w.word for w in channel.alternatives[0].words)
+        response = LiveResultResponse.from_json(read(WS_FIXTURE))
+        sink.write(response)
+        expected.extend(w.word for w in response.channel.alternatives[0].words)
+        assert sink.rows["words"] == len(expected)
+
+    file = pq.ParquetFile(tmp_path / "words.parquet")
+    assert file.metadata.num_rows == len(expected)
+    assert file.metadata.num_row_groups == -(-len(expected) // 50)
+    assert file.read().column("word").to_pylist() == expected
+    # no utterances in the fixtures, no file
+    assert not os.path.exists(tmp_path / "utterances.parquet")
+
+
+def test_unit_parquet_sink_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(DeepgramError):
+        ParquetSink(str(tmp_path))
@@ -0,0 +1,155 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import json
+import threading
+import time
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from deepgram import DeepgramClient, DeepgramClientOptions, RateLimiter
+from tests.utils import RESPONSE1
+
+
+def test_unit_rate_limiter_tokens():
+    limiter = RateLimiter(requests_per_second=20, burst=2)
+    assert limiter.acquire(timeout=0)
+    assert limiter.acquire(timeout=0)
+    assert limiter.tokens < 1
+    assert not limiter.acquire(timeout=0)
+
+    start = time.monotonic()
+    assert limiter.acquire()
+    assert time.monotonic() - start >= 0.03
+
+
+def test_unit_rate_limiter_concurrency_threads():
+    limiter = RateLimiter(max_concurrent=2)
+    peak = []
+    lock = threading.Lock()
+
+    def worker():
+        with limiter:
+            with lock:
+                peak.append(limiter.in_flight)
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.005)
+    assert limiter.queue_depth > 0
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
+    assert limiter.stats() == {"tokens": 1.0, "in_flight": 0, "queue_depth": 0}
+
+
+@pytest.mark.asyncio
+async def test_unit_rate_limiter_concurrency_asyncio():
+    limiter = RateLimiter(max_concurrent=3)
+    peak = []
+
+    async def worker():
+        async with limiter:
+            peak.append(limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[worker() for _ in range(9)])
+    assert max(peak) == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_unit_rate_limiter_asyncio_woken_by_release():
+    limiter = RateLimiter(max_concurrent=1)
+    assert limiter.acquire(timeout=0)
+    assert not await limiter.acquire_async(timeout=0.01)
+
+    # released from another thread, the waiting task is woken up rather than polling
+    waiter = asyncio.create_task(limiter.acquire_async(timeout=5))
+    await asyncio.sleep(0.01)
+    assert limiter.queue_depth == 1
+    threading.Timer(0.01, limiter.release).start()
+    start = time.monotonic()
+    assert await waiter
+    assert time.monotonic() - start < 1
+    assert limiter.in_flight == 1 and limiter.queue_depth == 0
+    assert len(limiter._async_waiters) == 0
+    limiter.release()
+
+
+def test_unit_rate_limiter_shared_by_clients():
+    config = DeepgramClientOptions(
+        api_key="test", options={"rate_limit": 1000, "max_concurrent_requests": 1}
+    )
+    deepgram = DeepgramClient("test", config)
+    limiter = config.rate_limiter
+    assert isinstance(limiter, RateLimiter)
+
+    calls = []
+
+    def handler(request):
+        calls.append(limiter.in_flight)
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    listen = deepgram.listen.rest.v("1")
+    listen.transcribe_url(
+        {"url": "https://example.com/audio.wav"},
+        transport=httpx.MockTransport(handler),
+    )
+    assert calls == [1]
+    assert limiter.in_flight == 0
+
+    # no limits configured, no limiter
+    assert DeepgramClient("test").listen.rest.v("1")._config.rate_limiter is None
+
+
+def test_unit_rate_limiter_streamed_response():
+    config = DeepgramClientOptions(
+        api_key="test", options={"max_concurrent_requests": 1}
+    )
+    deepgram = DeepgramClient("test", config)
+    limiter = config.rate_limiter
+
+    def handler(request):
+        return httpx.Response(HTTPStatus.OK, content=iter([b"au", b"dio"]))
+
+    speak = deepgram.speak.rest.v("1")
+    response = speak.stream_raw(
+        {"text": "hello"}, transport=httpx.MockTransport(handler)
+    )
+    # the slot is held while the body is read
+    assert limiter.in_flight == 1
+    assert response.read() == b"audio"
+    assert limiter.in_flight == 0
+    response.close()
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_unit_rate_limiter_streamed_response_async():
+    config = DeepgramClientOptions(
+        api_key="test", options={"max_concurrent_requests": 1}
+    )
+    deepgram = DeepgramClient("test", config)
+    limiter = config.rate_limiter
+
+    async def chunks():
+        yield b"audio"
+
+    async def handler(request):
+        return httpx.Response(HTTPStatus.OK, content=chunks())
+
+    speak = deepgram.speak.asyncrest.v("1")
+    response = await speak.stream_raw(
+        {"text": "hello"}, transport=httpx.MockTransport(handler)
+    )
+    assert limiter.in_flight == 1
+    await response.aclose()
+    assert limiter.in_flight == 0
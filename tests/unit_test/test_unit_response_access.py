@@ -0,0 +1,94 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import glob
+
+import pytest
+
+from deepgram import PrerecordedResponse, LiveResultResponse
+from deepgram.clients.common.v1.shared_response import BaseResponse
+
+REST_FIXTURE = sorted(glob.glob("tests/response_data/listen/rest/*-response.json"))[0]
+WS_FIXTURE = sorted(glob.glob("tests/response_data/listen/websocket/*-response.json"))[
+    0
+]
+
+
+def load(cls, path):
+    with open(path, "r", encoding="utf-8") as file:
+        return cls.from_json(file.read())
+
+
+def dict_eval(response, key):
+    # what eval() returned when it walked response.to_dict()
+    result = response.to_dict()
+    for k in key.split("."):
+        if isinstance(result, dict) and k in result:
+            result = result[k]
+        elif isinstance(result, list) and k.isdigit() and int(k) < len(result):
+            result = result[int(k)]
+        else:
+            return ""
+    return str(result)
+
+
+@pytest.fixture
+def no_to_dict(monkeypatch):
+    def to_dict(self, encode_json=False):
+        raise AssertionError("to_dict called")
+
+    monkeypatch.setattr(BaseResponse, "to_dict", to_dict)
+
+
+def test_unit_response_getitem(no_to_dict):
+    response = load(PrerecordedResponse, REST_FIXTURE)
+    channel = response["results"]["channels"][0]
+    assert channel is response.results.channels[0]
+    words = channel["alternatives"][0]["words"]
+    assert words is response.results.channels[0].alternatives[0].words
+    assert words[0]["word"] == words[0].word
+
+    # keys to_dict() leaves out are missing
+    assert response.results.utterances is None
+    with pytest.raises(KeyError):
+        response["results"]["utterances"]  # pylint: disable=pointless-statement
+    with pytest.raises(KeyError):
+        response["unknown"]  # pylint: disable=pointless-statement
+
+    transcript = response.eval("results.channels.0.alternatives.0.transcript")
+    assert transcript == channel.alternatives[0].transcript
+
+    # model_info is given as a list of its values
+    assert response["metadata"]["model_info"] == list(
+        response.metadata.model_info.values()
+    )
+
+
+def test_unit_response_getitem_websocket():
+    response = load(LiveResultResponse, WS_FIXTURE)
+    assert response["channel"]["alternatives"][0]["transcript"]
+    assert (
+        response["metadata"]["model_info"]["name"] == response.metadata.model_info.name
+    )
+    assert response["is_final"] is response.is_final
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "results.channels.0.alternatives.0.transcript",
+        "results.channels.0.alternatives.0.words.1",
+        "results.channels.0.alternatives.0.words.1.start",
+        "metadata.model_info",
+        "metadata.models.0",
+        "results.channels.5",
+        "results.utterances",
+        "results.channels.0.alternatives.0.unknown",
+        "metadata.request_id.0",
+    ],
+)
+def test_unit_response_eval(key):
+    response = load(PrerecordedResponse, REST_FIXTURE)
+    expected = dict_eval(response, key)
+    assert response.eval(key) == expected
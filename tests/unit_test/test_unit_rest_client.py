@@ -0,0 +1,209 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import io
+import json
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from deepgram import (
+    DeepgramApiError,
+    DeepgramClient,
+    DeepgramClientOptions,
+    ListenRESTClient,
+    RetryPolicy,
+    mmap_file,
+)
+from deepgram.clients.common.v1.retry import parse_retry_after
+from tests.utils import RESPONSE1, mock_transport
+
+
+def test_unit_rest_client_pool_reused():
+    config = DeepgramClientOptions(
+        api_key="test",
+        options={"max_connections": 4, "keepalive_expiry": 30},
+    )
+    client = ListenRESTClient(config)
+
+    pooled = client._get_client()
+    assert pooled is client._get_client()
+    assert pooled._transport._pool._max_connections == 4
+    assert pooled._transport._pool._keepalive_expiry == 30.0
+
+    calls = []
+    pooled._transport = mock_transport(calls)
+    for _ in range(3):
+        response = client.transcribe_url({"url": "https://example.com/audio.wav"})
+        assert response.metadata.request_id == "abc"
+    assert len(calls) == 3
+    assert client._get_client() is pooled
+
+    client.close()
+    assert pooled.is_closed
+
+
+def test_unit_rest_client_shared_pool():
+    with DeepgramClient("test") as deepgram:
+        listen = deepgram.listen.rest.v("1")
+        pooled = listen._get_client()
+        # each v() call returns a new client, on the same connections
+        assert deepgram.listen.rest.v("1")._get_client() is pooled
+        assert deepgram.speak.rest.v("1")._get_client() is pooled
+        assert deepgram.manage.v("1")._get_client() is pooled
+
+        # closing a single client leaves the shared pool open
+        listen.close()
+        assert not pooled.is_closed
+    assert pooled.is_closed
+
+
+def test_unit_rest_client_context_manager():
+    config = DeepgramClientOptions(api_key="test")
+    with ListenRESTClient(config) as client:
+        pooled = client._get_client()
+        assert not pooled.is_closed
+    assert pooled.is_closed
+
+    # the client is recreated on demand after close
+    assert not client._get_client().is_closed
+    client.close()
+
+
+def test_unit_rest_client_http2():
+    config = DeepgramClientOptions(api_key="test", options={"http2": True})
+    with ListenRESTClient(config) as client:
+        pool = client._get_client()._transport._pool
+        assert pool._http2 is True
+        assert pool._http1 is True
+
+    # plain http:// has no ALPN negotiation, so HTTP/2 is spoken with prior knowledge
+    config = DeepgramClientOptions(
+        api_key="test", url="http://localhost:8080", options={"http2": "true"}
+    )
+    with ListenRESTClient(config) as client:
+        pool = client._get_client()._transport._pool
+        assert pool._http2 is True
+        assert pool._http1 is False
+
+
+def flaky_transport(calls, statuses, headers=None):
+    def handler(request):
+        calls.append(request.read())
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        if status != HTTPStatus.OK:
+            return httpx.Response(status, headers=headers, content=b"{}")
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    return httpx.MockTransport(handler)
+
+
+def test_unit_rest_client_retry():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+    client = ListenRESTClient(DeepgramClientOptions(api_key="test"))
+
+    # 429 means the request was not processed, so POST is replayed
+    calls = []
+    response = client.transcribe_file(
+        {"buffer": b"audio"},
+        transport=flaky_transport(calls, [429, 503, 200]),
+        retry=policy,
+    )
+    assert response.metadata.request_id == "abc"
+    assert calls == [b"audio", b"audio", b"audio"]
+
+    # a 500 may have been processed, so POST is not replayed unless asked
+    calls = []
+    with pytest.raises(DeepgramApiError):
+        client.transcribe_file(
+            {"buffer": b"audio"},
+            transport=flaky_transport(calls, [500, 200]),
+            retry=policy,
+        )
+    assert len(calls) == 1
+
+    # a Retry-After beyond max_delay gives up instead of waiting
+    calls = []
+    client.retry_policy = policy
+    with pytest.raises(DeepgramApiError):
+        client.transcribe_url(
+            {"url": "https://example.com/audio.wav"},
+            transport=flaky_transport(calls, [429, 200], {"Retry-After": "120"}),
+        )
+    assert len(calls) == 1
+
+
+def test_unit_rest_client_retry_stream_rewound():
+    config = DeepgramClientOptions(
+        api_key="test", options={"retry": {"base_delay": 0.001, "max_delay": 0.01}}
+    )
+    client = ListenRESTClient(config)
+
+    calls = []
+    stream = io.BytesIO(b"header-audio")
+    stream.seek(7)
+    client.transcribe_file(
+        {"stream": stream}, transport=flaky_transport(calls, [503, 200])
+    )
+    assert calls == [b"audio", b"audio"]
+
+
+def test_unit_rest_client_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_unit_rest_client_path_source(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"0123456789" * 20000)
+
+    received = []
+
+    def handler(request):
+        received.append(request)
+        request.read()
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    client = ListenRESTClient(DeepgramClientOptions(api_key="test"))
+    response = client.transcribe_file(
+        {"path": str(audio)}, transport=httpx.MockTransport(handler)
+    )
+    assert response.metadata.request_id == "abc"
+    assert received[0].headers["Content-Length"] == "200000"
+    assert "Transfer-Encoding" not in received[0].headers
+    assert received[0].content == audio.read_bytes()
+
+    # the per-request Content-Length must not leak into the shared config headers
+    assert "Content-Length" not in client._config.headers
+
+
+def test_unit_rest_client_buffer_protocol(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(bytes(range(256)) * 1000)
+    data = audio.read_bytes()
+
+    received = []
+
+    def handler(request):
+        received.append((request.headers["Content-Length"], request.read()))
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    client = ListenRESTClient(DeepgramClientOptions(api_key="test"))
+    mapped = mmap_file(str(audio))
+    for buffer in [bytearray(data), memoryview(mapped)[100:70000], mapped]:
+        client.transcribe_file(
+            {"buffer": buffer}, transport=httpx.MockTransport(handler)
+        )
+
+    # the view on the mapping is released once the request is sent
+    mapped.close()
+
+    assert received == [
+        (str(len(data)), data),
+        ("69900", data[100:70000]),
+        (str(len(data)), data),
+    ]
@@ -0,0 +1,141 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import json
+import os
+import time
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from deepgram import (
+    DeepgramClientOptions,
+    ListenRESTClient,
+    AsyncListenRESTClient,
+    PrerecordedOptions,
+    ResultCache,
+)
+from deepgram.clients.listen.v1.rest import cache as cache_module
+from tests.utils import RESPONSE1
+
+
+class Handler:
+    def __init__(self, etag=None):
+        self.etag = etag
+        self.posts = []
+        self.heads = []
+
+    def __call__(self, request):
+        if request.method == "HEAD":
+            self.heads.append(request)
+            headers = {"ETag": self.etag} if self.etag else {}
+            return httpx.Response(HTTPStatus.OK, headers=headers)
+        self.posts.append(request)
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+
+def test_unit_result_cache_lru_and_ttl(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=250)
+    for key in ["a", "b"]:
+        cache.set(key, "x" * 100)
+    # touch "a" so that "b" is the least recently used
+    os.utime(tmp_path / "b.json", (time.time() - 10, time.time()))
+    assert cache.get("a") == "x" * 100
+    cache.set("c", "x" * 100)
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.size() <= 250
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+    cache = ResultCache(str(tmp_path), ttl=60)
+    os.utime(tmp_path / "c.json", (time.time(), time.time() - 120))
+    assert cache.get("c") is None
+    assert not (tmp_path / "c.json").exists()
+
+
+def test_unit_result_cache_sweeps(tmp_path, monkeypatch):
+    sweeps = []
+    evict_files = cache_module.evict_files
+
+    def counting(*args, **kwargs):
+        sweeps.append(args)
+        return evict_files(*args, **kwargs)
+
+    monkeypatch.setattr(cache_module, "evict_files", counting)
+    cache = ResultCache(str(tmp_path), max_bytes=1000)
+    # the directory is measured by the first write, then only once it is over max_bytes
+    for key in range(9):
+        cache.set(str(key), "x" * 100)
+    assert len(sweeps) == 1
+    cache.set("9", "x" * 200)
+    assert len(sweeps) == 2
+    assert cache.size() <= 1000
+
+
+def test_unit_result_cache_file(tmp_path):
+    handler = Handler()
+    config = DeepgramClientOptions(
+        api_key="test", options={"result_cache": str(tmp_path)}
+    )
+    client = ListenRESTClient(config)
+    transport = httpx.MockTransport(handler)
+    options = PrerecordedOptions(model="nova-2", smart_format=True)
+
+    for _ in range(3):
+        response = client.transcribe_file(
+            {"buffer": b"audio"}, options, transport=transport
+        )
+        assert response.metadata.request_id == "abc"
+    assert len(handler.posts) == 1
+
+    # same audio with other options, or other audio, is a miss
+    client.transcribe_file(
+        {"buffer": b"audio"}, PrerecordedOptions(model="nova-2"), transport=transport
+    )
+    client.transcribe_file({"buffer": b"other"}, options, transport=transport)
+    assert len(handler.posts) == 3
+    assert client.result_cache.hits == 2
+    # the resolved cache stays on the client
+    assert config.options["result_cache"] == str(tmp_path)
+
+
+def test_unit_result_cache_url(tmp_path):
+    client = ListenRESTClient(DeepgramClientOptions(api_key="test"))
+    client.result_cache = ResultCache(str(tmp_path))
+    source = {"url": "https://example.com/audio.wav"}
+
+    handler = Handler(etag='"v1"')
+    for _ in range(2):
+        client.transcribe_url(source, transport=httpx.MockTransport(handler))
+    assert len(handler.posts) == 1
+    assert "Authorization" not in handler.heads[0].headers
+
+    # a new version of the file is a miss
+    handler.etag = '"v2"'
+    client.transcribe_url(source, transport=httpx.MockTransport(handler))
+    assert len(handler.posts) == 2
+
+    # without an ETag the file can change behind the URL, so nothing is cached
+    handler.etag = None
+    for _ in range(2):
+        client.transcribe_url(source, transport=httpx.MockTransport(handler))
+    assert len(handler.posts) == 4
+
+
+@pytest.mark.asyncio
+async def test_unit_result_cache_async(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"audio" * 1000)
+
+    handler = Handler()
+    async with AsyncListenRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        client.result_cache = ResultCache(str(tmp_path / "cache"))
+        for _ in range(2):
+            response = await client.transcribe_file(
+                {"path": str(audio)}, transport=httpx.MockTransport(handler)
+            )
+            assert response.metadata.request_id == "abc"
+    assert len(handler.posts) == 1
@@ -0,0 +1,167 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from deepgram import (
+    DeepgramClient,
+    DeepgramClientOptions,
+    DeepgramApiError,
+    AsyncSpeakRESTClient,
+    SingleFlight,
+)
+from deepgram.clients.common.v1.single_flight import single_flight_key
+from tests.utils import SPEAK_HEADERS
+
+
+def test_unit_single_flight_key():
+    headers = {"Authorization": "Token test"}
+    key = single_flight_key(
+        "POST", "https://x/v1/speak", headers, {"json": {"a": 1, "b": 2}}
+    )
+    assert key == single_flight_key(
+        "post", "https://x/v1/speak", headers, {"json": {"b": 2, "a": 1}}
+    )
+    assert key != single_flight_key(
+        "POST", "https://x/v1/speak", headers, {"json": {"a": 2}}
+    )
+    assert key != single_flight_key(
+        "POST", "https://x/v1/speak?model=b", headers, {"json": {"a": 1, "b": 2}}
+    )
+    assert key != single_flight_key(
+        "POST",
+        "https://x/v1/speak",
+        {"Authorization": "Token other"},
+        {"json": {"a": 1, "b": 2}},
+    )
+    # streamed bodies cannot be compared and are never coalesced
+    assert (
+        single_flight_key("POST", "https://x", headers, {"content": io.BytesIO(b"a")})
+        is None
+    )
+
+
+def test_unit_single_flight_sync():
+    deepgram = DeepgramClient(
+        "test", DeepgramClientOptions(api_key="test", options={"single_flight": True})
+    )
+    single_flight = deepgram.speak.rest.v("1")._get_single_flight()
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        # hold the response until every other caller is waiting on this request
+        deadline = time.monotonic() + 5
+        while single_flight.shared < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return httpx.Response(HTTPStatus.OK, headers=SPEAK_HEADERS, content=b"greeting")
+
+    transport = httpx.MockTransport(handler)
+
+    def speak(_):
+        return deepgram.speak.rest.v("1").stream_memory(
+            {"text": "Welcome"}, transport=transport
+        )
+
+    with ThreadPoolExecutor(5) as executor:
+        responses = list(executor.map(speak, range(5)))
+
+    assert len(calls) == 1
+    assert (single_flight.calls, single_flight.shared, single_flight.in_flight) == (
+        1,
+        4,
+        0,
+    )
+    assert all(r.request_id == "abc" for r in responses)
+    assert all(r.stream_memory.read() == b"greeting" for r in responses)
+
+    # once completed, the same request goes out again
+    speak(0)
+    assert len(calls) == 2
+
+
+def test_unit_single_flight_error():
+    single_flight = SingleFlight()
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        while single_flight.shared < 2:
+            time.sleep(0.01)
+        return httpx.Response(
+            HTTPStatus.TOO_MANY_REQUESTS, json={"err_msg": "slow down"}
+        )
+
+    deepgram = DeepgramClient("test")
+
+    def speak(_):
+        client = deepgram.speak.rest.v("1")
+        client.single_flight = single_flight
+        with pytest.raises(DeepgramApiError):
+            client.stream_memory({"text": "Hi"}, transport=httpx.MockTransport(handler))
+
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(speak, range(3)))
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_single_flight_async():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(HTTPStatus.OK, headers=SPEAK_HEADERS, content=b"greeting")
+
+    transport = httpx.MockTransport(handler)
+    async with AsyncSpeakRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        client.single_flight = SingleFlight()
+        responses = await asyncio.gather(
+            *[
+                client.stream_memory({"text": "Welcome"}, transport=transport)
+                for _ in range(10)
+            ],
+            client.stream_memory({"text": "Goodbye"}, transport=transport),
+        )
+    assert len(calls) == 2
+    assert len({id(r.stream_memory) for r in responses}) == 11
+    assert all(r.stream_memory.getvalue() == b"greeting" for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_unit_single_flight_async_leader_cancelled():
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+    calls = []
+
+    async def send(name):
+        calls.append(name)
+        started.set()
+        await asyncio.sleep(0.05)
+        return name
+
+    leader = asyncio.create_task(single_flight.do_async("key", lambda: send("leader")))
+    await started.wait()
+    waiters = [
+        asyncio.create_task(single_flight.do_async("key", lambda: send("waiter")))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    # one waiter takes over the request, the others share its result
+    assert await asyncio.gather(*waiters) == ["waiter"] * 3
+    assert leader.cancelled()
+    assert calls == ["leader", "waiter"]
+    assert single_flight.calls == 2
+    assert single_flight.shared == 2
+    assert single_flight.in_flight == 0
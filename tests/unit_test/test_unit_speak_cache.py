@@ -0,0 +1,115 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from deepgram import (
+    DeepgramClient,
+    DeepgramClientOptions,
+    SpeakRESTClient,
+    AsyncSpeakRESTClient,
+    SpeakRESTOptions,
+    SpeakCache,
+)
+from tests.utils import mock_speak_transport
+
+
+def test_unit_speak_cache_lru():
+    cache = SpeakCache(max_bytes=10)
+    cache.set("a", b"aaaa", {})
+    cache.set("b", b"bbbb", {})
+    assert cache.get("a") is not None
+    cache.set("c", b"cccc", {})
+    assert cache.get("b") is None
+    assert len(cache) == 2 and cache.size == 8
+    # larger than the whole cache, never stored
+    cache.set("d", b"d" * 11, {})
+    assert cache.get("d") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_unit_speak_cache_hit(tmp_path):
+    calls = []
+    deepgram = DeepgramClient(
+        "test", DeepgramClientOptions(api_key="test", options={"speak_cache": True})
+    )
+    options = SpeakRESTOptions(model="aura-asteria-en", encoding="linear16")
+
+    for _ in range(3):
+        # each router call creates a new client, the cache is shared through the config
+        response = deepgram.speak.rest.v("1").stream_memory(
+            {"text": "Hello world"}, options, transport=mock_speak_transport(calls)
+        )
+        assert response.request_id == "abc"
+        assert response.characters == 11
+        assert response.stream_memory.getvalue().startswith(b"audio-")
+    assert len(calls) == 1
+
+    client = deepgram.speak.rest.v("1")
+    client.stream_memory(
+        {"text": "Hello world"},
+        SpeakRESTOptions(model="aura-asteria-en", encoding="mp3"),
+        transport=mock_speak_transport(calls),
+    )
+    assert len(calls) == 2
+    assert (client.speak_cache.hits, client.speak_cache.misses) == (2, 2)
+
+    # save() goes through the cache as well
+    filename = str(tmp_path / "hello.wav")
+    client.save(filename, {"text": "Hello world"}, options)
+    assert len(calls) == 2
+
+
+def test_unit_speak_cache_disk(tmp_path):
+    calls = []
+    client = SpeakRESTClient(DeepgramClientOptions(api_key="test"))
+    client.speak_cache = SpeakCache(directory=str(tmp_path))
+    client.stream_memory({"text": "Hi"}, transport=mock_speak_transport(calls))
+
+    # a new process with an empty memory cache finds the entry on disk
+    client.speak_cache = SpeakCache(directory=str(tmp_path))
+    response = client.stream_memory(
+        {"text": "Hi"}, transport=mock_speak_transport(calls)
+    )
+    assert len(calls) == 1
+    assert response.model_name == "aura-asteria-en"
+    assert response.stream_memory.getvalue() == b"audio-" + calls[0].content
+
+
+def test_unit_speak_cache_corrupt(tmp_path):
+    calls = []
+    client = SpeakRESTClient(DeepgramClientOptions(api_key="test"))
+    client.speak_cache = SpeakCache(directory=str(tmp_path))
+    client.stream_memory({"text": "Hi"}, transport=mock_speak_transport(calls))
+    (path,) = tmp_path.glob("*.speak")
+
+    # a truncated header and a missing separator both fall through to the network
+    for content in (b'{"model-name": "aura', b"no separator"):
+        path.write_bytes(content)
+        client.speak_cache = SpeakCache(directory=str(tmp_path))
+        response = client.stream_memory(
+            {"text": "Hi"}, transport=mock_speak_transport(calls)
+        )
+        assert response.model_name == "aura-asteria-en"
+        assert client.speak_cache.misses == 1
+    assert len(calls) == 3
+
+    # the corrupt entry was replaced by the fresh response
+    client.speak_cache = SpeakCache(directory=str(tmp_path))
+    client.stream_memory({"text": "Hi"}, transport=mock_speak_transport(calls))
+    assert len(calls) == 3
+    assert client.speak_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_speak_cache_async():
+    calls = []
+    async with AsyncSpeakRESTClient(DeepgramClientOptions(api_key="test")) as client:
+        client.speak_cache = SpeakCache()
+        for _ in range(2):
+            response = await client.stream_memory(
+                {"text": "Hello"}, transport=mock_speak_transport(calls)
+            )
+            assert response.request_id == "abc"
+    assert len(calls) == 1
@@ -0,0 +1,89 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import glob
+import random
+
+import pytest
+
+from deepgram import PrerecordedResponse, TranscriptIndex
+
+FIXTURES = sorted(glob.glob("tests/response_data/listen/rest/*-response.json"))
+
+
+def scan(items, start, end):
+    return [i for i in items if i.start <= end and i.end >= start]
+
+
+@pytest.mark.parametrize("path", FIXTURES)
+def test_unit_time_index_fixtures(path):
+    with open(path, "r", encoding="utf-8") as file:
+        response = PrerecordedResponse.from_json(file.read())
+    index = response.time_index()
+    alternative = response.results.channels[0].alternatives[0]
+    words = alternative.words
+    paragraphs = alternative.paragraphs.paragraphs
+
+    rand = random.Random(0)
+    last = words[-1].end
+    for _ in range(200):
+        start = rand.uniform(-1, last + 1)
+        end = start + rand.uniform(0, 5)
+        assert index.words(start, end) == scan(words, start, end)
+        assert index.paragraphs(start, end) == scan(paragraphs, start, end)
+    # the edges of a word are part of it
+    assert index.words(words[3].start, words[3].start)[-1] is words[3]
+    assert index.words(last + 1, last + 2) == []
+
+
+def test_unit_time_index_speakers():
+    words = [
+        {"word": "a", "start": 0, "end": 1, "speaker": 0},
+        {"word": "b", "start": 2, "end": 3, "speaker": 1},
+        # nested in the previous word
+        {"word": "c", "start": 2.2, "end": 2.4, "speaker": 1},
+        {"word": "d", "start": 5, "end": 6},
+    ]
+    response = PrerecordedResponse.from_dict(
+        {
+            "results": {
+                "channels": [{"alternatives": [{"words": words}]}],
+                "utterances": [
+                    {"id": "1", "start": 0, "end": 1.5, "speaker": 0, "channel": 0},
+                    {"id": "2", "start": 1.8, "end": 3, "speaker": 1, "channel": 0},
+                    {"id": "3", "start": 0, "end": 9, "speaker": 7, "channel": 1},
+                ],
+            }
+        }
+    )
+    index = TranscriptIndex(response)
+    assert [w.word for w in index.words(2.3, 2.3)] == ["b", "c"]
+    assert [w.word for w in index.words(2.5, 4)] == ["b"]
+    assert [u.id for u in index.utterances(1, 2)] == ["1", "2"]
+    assert index.speaker_at(0.5) == 0
+    assert index.speaker_at(1.2) == 0  # between words, within the utterance
+    assert index.speaker_at(2.3) == 1
+    assert index.speaker_at(5.5) is None
+    assert index.paragraphs(0, 10) == []
+
+    assert [u.id for u in response.time_index(channel=0).utterances(0, 9)] == ["1", "2"]
+    assert TranscriptIndex(PrerecordedResponse()).words(0, 1) == []
+
+
+def test_unit_time_index_long_interval():
+    rand = random.Random(1)
+    words = [{"word": "all", "start": 0, "end": 1000}]
+    for i in range(2000):
+        start = i * 0.5 + rand.uniform(0, 0.1)
+        words.append({"word": str(i), "start": start, "end": start + 0.3})
+    response = PrerecordedResponse.from_dict(
+        {"results": {"channels": [{"alternatives": [{"words": words}]}]}}
+    )
+    index = response.time_index()
+    items = response.results.channels[0].alternatives[0].words
+    for _ in range(200):
+        start = rand.uniform(-1, 1100)
+        end = start + rand.uniform(0, 30)
+        assert index.words(start, end) == scan(items, start, end)
+    assert [w.word for w in index.words(500.45, 500.45)] == ["all"]
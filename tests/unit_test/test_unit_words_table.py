@@ -0,0 +1,97 @@
+# Copyright 2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import glob
+import sys
+
+import pytest
+
+from deepgram import DeepgramError, PrerecordedResponse, LiveResultResponse
+
+numpy = pytest.importorskip("numpy")
+
+REST_FIXTURE = sorted(glob.glob("tests/response_data/listen/rest/*-response.json"))[0]
+WS_FIXTURE = sorted(glob.glob("tests/response_data/listen/websocket/*-response.json"))[
+    0
+]
+
+
+def read(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def check(table, words):
+    assert len(table) == len(words)
+    assert table["start"].tolist() == [w.start for w in words]
+    assert table["end"].tolist() == [w.end for w in words]
+    assert table["confidence"].tolist() == [w.confidence for w in words]
+    assert table["speaker"].tolist() == [
+        -1 if w.speaker is None else w.speaker for w in words
+    ]
+    for i, w in enumerate(words):
+        assert table.word(i) == w.word
+        assert table.punctuated_word(i) == (w.punctuated_word or "")
+    # each distinct word has one id
+    assert len(table.vocabulary) == len({w.word for w in words})
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"lazy": True}, {"compact": True}, {"lazy": True, "compact": True}]
+)
+def test_unit_words_table(options):
+    words = PrerecordedResponse.from_json(read(REST_FIXTURE)).results.channels[0]
+    words = words.alternatives[0].words
+    response = PrerecordedResponse.from_json(read(REST_FIXTURE), **options)
+    check(response.words_table(), words)
+
+    if options.get("lazy"):
+        # the table is built from the dicts, the words are still not decoded
+        alternative = response.results.channels[0].alternatives[0]
+        assert "words" not in vars(alternative)
+
+
+def test_unit_words_table_no_channels():
+    for data in ['{"results": {"channels": []}}', "{}"]:
+        assert len(PrerecordedResponse.from_json(data).words_table()) == 0
+
+
+def test_unit_words_table_live():
+    response = LiveResultResponse.from_json(read(WS_FIXTURE))
+    check(response.words_table(), response.channel.alternatives[0].words)
+    check(
+        LiveResultResponse.from_json(read(WS_FIXTURE), lazy=True).words_table(),
+        response.channel.alternatives[0].words,
+    )
+
+
+def test_unit_words_table_speakers():
+    data = {
+        "results": {
+            "channels": [
+                {
+                    "alternatives": [
+                        {
+                            "words": [
+                                {"word": "a", "start": 0, "end": 1, "speaker": 0},
+                                {"word": "b", "start": 1, "end": 3, "speaker": 1},
+                                {"word": "a", "start": 3, "end": 4, "speaker": 0},
+                            ]
+                        }
+                    ]
+                }
+            ]
+        }
+    }
+    table = PrerecordedResponse.from_dict(data).words_table()
+    assert table["word_id"].tolist() == [0, 1, 0]
+    durations = numpy.bincount(table["speaker"], weights=table["end"] - table["start"])
+    assert durations.tolist() == [2.0, 2.0]
+    assert len(PrerecordedResponse().words_table()) == 0
+
+
+def test_unit_words_table_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(DeepgramError):
+        PrerecordedResponse.from_json(read(REST_FIXTURE)).words_table()
@@ -11,3 +11,9 @@ from .utils import (
     read_metadata_bytes,
     string_match_failure,
 )
+from .fixtures import (
+    RESPONSE1,
+    SPEAK_HEADERS,
+    mock_transport,
+    mock_speak_transport,
+)
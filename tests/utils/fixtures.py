@@ -0,0 +1,38 @@
+# Copyright 2023-2024 Deepgram SDK contributors. All Rights Reserved.
+# Use of this source code is governed by a MIT license that can be found in the LICENSE file.
+# SPDX-License-Identifier: MIT
+
+import json
+from http import HTTPStatus
+
+import httpx
+
+RESPONSE1 = {"metadata": {"request_id": "abc"}, "results": {"channels": []}}
+
+SPEAK_HEADERS = {
+    "content-type": "audio/wav",
+    "request-id": "abc",
+    "model-uuid": "uuid",
+    "model-name": "aura-asteria-en",
+    "char-count": "11",
+    "transfer-encoding": "chunked",
+    "date": "Mon, 01 Jan 2024 00:00:00 GMT",
+}
+
+
+def mock_transport(calls: list) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(RESPONSE1))
+
+    return httpx.MockTransport(handler)
+
+
+def mock_speak_transport(calls: list) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(
+            HTTPStatus.OK, headers=SPEAK_HEADERS, content=b"audio-" + request.content
+        )
+
+    return httpx.MockTransport(handler)